@@ -0,0 +1,172 @@
+"""
+Axion Update - Arquivo de changelogs
+Histórico append-only das notas de cada release (uma linha JSON por release) com índice compacto de offsets:
+"tudo desde a versão X" é uma busca no índice + uma leitura contígua do arquivo de dados.
+"""
+
+import os
+import sys
+import json
+import struct
+import argparse
+from bisect import bisect_right
+
+from axion_common import (
+    BASE_DIR, CHANGELOG_PATH, VERSION_PATH, VERSION_RE,
+    load_json, write_atomic, version_key, rel_path
+)
+
+ARCHIVE_DIR = os.path.join(BASE_DIR, "changelog_archive")
+DATA_NAME = "changelog.jsonl"
+INDEX_NAME = "changelog.idx"
+
+# ================= FORMATO DO ÍNDICE =================
+#
+# MAGIC | quantidade:u32
+# por release (ordem crescente de versão): versão:4 x u32 | offset:u64 | tamanho:u32
+
+MAGIC = b"AXI1"
+INDEX_HEADER = struct.Struct("<4sI")
+INDEX_ENTRY = struct.Struct("<4IQI")
+
+# ================= ÍNDICE =================
+
+def _paths(archive_dir):
+    return os.path.join(archive_dir, DATA_NAME), os.path.join(archive_dir, INDEX_NAME)
+
+def read_index(archive_dir=ARCHIVE_DIR):
+    # [(versão como tupla, offset, tamanho)]
+    _, index_path = _paths(archive_dir)
+    if not os.path.exists(index_path):
+        return []
+    with open(index_path, "rb") as f:
+        raw = f.read()
+    magic, count = INDEX_HEADER.unpack_from(raw, 0)
+    if magic != MAGIC or len(raw) != INDEX_HEADER.size + count * INDEX_ENTRY.size:
+        raise ValueError("Índice do arquivo de changelogs inválido")
+    return [
+        (tuple(entry[:4]), entry[4], entry[5])
+        for entry in INDEX_ENTRY.iter_unpack(raw[INDEX_HEADER.size:])
+    ]
+
+def _write_index(index, archive_dir):
+    _, index_path = _paths(archive_dir)
+    payload = bytearray(INDEX_HEADER.pack(MAGIC, len(index)))
+    for key, offset, length in index:
+        payload += INDEX_ENTRY.pack(*key, offset, length)
+    write_atomic(index_path, bytes(payload))
+
+# ================= ESCRITA =================
+
+def append_release(release, game_version, changes, archive_dir=ARCHIVE_DIR):
+    """
+    Acrescenta as notas da release ao final do arquivo. Versões só avançam; republicar
+    a última release substitui apenas o registro do fim (o histórico anterior não é reescrito).
+    Retorna False quando a release já está arquivada com as mesmas notas.
+    """
+    key = version_key(release)
+    record = (json.dumps(
+        {"release": release, "game_version": game_version, "changes": changes},
+        ensure_ascii=False, separators=(",", ":")
+    ) + "\n").encode("utf-8")
+
+    data_path, _ = _paths(archive_dir)
+    index = read_index(archive_dir)
+
+    if index and key < index[-1][0]:
+        raise ValueError(f"Release {release} é anterior à última arquivada")
+    if index and key == index[-1][0]:
+        _, offset, length = index.pop()
+        with open(data_path, "rb") as f:
+            f.seek(offset)
+            if f.read(length) == record:
+                return False
+        end = offset
+    else:
+        end = index[-1][1] + index[-1][2] if index else 0
+
+    os.makedirs(archive_dir, exist_ok=True)
+    with open(data_path, "ab") as f:
+        # Descarta bytes após o último registro indexado (append interrompido ou release substituída)
+        f.truncate(end)
+        f.seek(end)
+        f.write(record)
+        f.flush()
+        os.fsync(f.fileno())
+
+    index.append((key, end, len(record)))
+    _write_index(index, archive_dir)
+    return True
+
+# ================= LEITURA =================
+
+def read_since_raw(since, archive_dir=ARCHIVE_DIR):
+    # Bytes (JSON lines) de todas as releases posteriores a `since`, numa única leitura
+    index = read_index(archive_dir)
+    start = bisect_right([key for key, _, _ in index], version_key(since)) if since else 0
+    if start >= len(index):
+        return b""
+    offset = index[start][1]
+    end = index[-1][1] + index[-1][2]
+
+    data_path, _ = _paths(archive_dir)
+    with open(data_path, "rb") as f:
+        f.seek(offset)
+        return f.read(end - offset)
+
+def changes_since(since, archive_dir=ARCHIVE_DIR):
+    return [json.loads(line) for line in read_since_raw(since, archive_dir).splitlines()]
+
+def release_notes(release, archive_dir=ARCHIVE_DIR):
+    key = version_key(release)
+    for entry_key, offset, length in read_index(archive_dir):
+        if entry_key == key:
+            data_path, _ = _paths(archive_dir)
+            with open(data_path, "rb") as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+    return None
+
+def archive_entry(archive_dir=ARCHIVE_DIR):
+    # Referência ao arquivo gravada em version.json
+    data_path, index_path = _paths(archive_dir)
+    return {
+        "data": rel_path(data_path),
+        "index": rel_path(index_path),
+        "releases": len(read_index(archive_dir)),
+    }
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arquivo de changelogs das releases do Axion")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("adicionar", help="arquiva o changelog.json atual sob a release de version.json")
+    desde = sub.add_parser("desde", help="mostra as notas de todas as releases após a versão informada")
+    desde.add_argument("versao")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "adicionar":
+        manifest = load_json(VERSION_PATH, {"game_version": "", "axion_release": ""})
+        release = manifest.get("axion_release", "")
+        if not VERSION_RE.match(release):
+            print("ERRO: axion_release inválido em version.json")
+            return 1
+        changes = load_json(CHANGELOG_PATH, {"changes": []})["changes"]
+        if append_release(release, manifest.get("game_version", ""), changes):
+            print(f"Release {release} arquivada ({len(changes)} entradas)")
+        else:
+            print(f"Release {release} já estava arquivada")
+        return 0
+
+    if not VERSION_RE.match(args.versao):
+        print("Versao invalida.")
+        return 1
+    for record in changes_since(args.versao):
+        print(f"== {record['release']} ==")
+        for item in record["changes"]:
+            print(f"  {item}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
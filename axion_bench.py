@@ -0,0 +1,278 @@
+"""
+Axion Update - Benchmarks
+Mede o editor (Qt offscreen), a validação e o fluxo de publicação com changelogs sintéticos de 10, 1k e 50k entradas
+e compara com a baseline gravada em bench_baseline.json.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from axion_common import (
+    BASE_DIR, PREFIXOS, load_json, save_json
+)
+from axion_validate import validate_changelog
+
+BASELINE_PATH = os.path.join(BASE_DIR, "bench_baseline.json")
+SIZES = (10, 1000, 50000)
+MIN_REPS = 20
+MAX_REPS = 300
+BUDGET_S = 0.5      # tempo por medição: repete até atingir o orçamento ou MAX_REPS
+THRESHOLD = 0.20    # piora relativa da mediana que conta como regressão
+SPREAD_K = 3.0      # ... e precisa passar de SPREAD_K vezes o IQR medido (ruído desta máquina)
+NOISE_MS = 0.05     # piso absoluto do ruído (timer, event loop do Qt)
+CALIBRATION = "calibracao"
+
+# ================= DADOS SINTÉTICOS =================
+
+def synthetic_changes(n):
+    prefixos = list(PREFIXOS.values())
+    return [f"{prefixos[i % len(prefixos)]} Alteração sintética número {i}" for i in range(n)]
+
+def synthetic_workspace(tmp, n):
+    changelog_path = os.path.join(tmp, "changelog.json")
+    version_path = os.path.join(tmp, "version.json")
+    save_json(changelog_path, {"changes": synthetic_changes(n)}, fsync=False)
+    save_json(version_path, {"game_version": "1.0.0", "axion_release": "1.0.0"}, fsync=False)
+    return changelog_path, version_path
+
+# ================= MEDIÇÃO =================
+
+def measure(fn, setup=None):
+    # Mediana, mínimo e IQR em ms; setup() roda antes de cada repetição e fica fora do tempo
+    samples = []
+    spent = 0.0
+    while len(samples) < MIN_REPS or (spent < BUDGET_S and len(samples) < MAX_REPS):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        spent += elapsed
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "iqr_ms": round((q3 - q1) * 1000, 4),
+        "reps": len(samples),
+    }
+
+def calibrate():
+    # Trabalho fixo em Python puro medido na mesma execução: a razão contra o da baseline
+    # desconta uma máquina (ou um momento) mais lenta por inteiro
+    return measure(lambda: sum(i * i for i in range(100_000)))
+
+# ================= EDITOR =================
+
+def bench_editor(app, n, tmp):
+    import editor_axion_update as editor
+    from PyQt5.QtWidgets import QInputDialog
+
+    changelog_path, version_path = synthetic_workspace(tmp, n)
+    # O editor lê/grava nos caminhos do módulo: aponta tudo para a pasta temporária
+    editor.CHANGELOG_PATH = changelog_path
+    editor.VERSION_PATH = version_path
+
+    window = editor.EditorWindow()
+    window.autosave.set_enabled(False)
+    window.show()
+    app.processEvents()
+
+    model = window.changelog_model
+    changes = window.dados_changelog["changes"]
+    middle = n // 2
+    results = {}
+
+    def run(fn):
+        def step():
+            fn()
+            app.processEvents()
+        return step
+
+    results["atualizar_lista"] = measure(run(window.atualizar_lista))
+
+    def switch():
+        window.show_page("version")
+        app.processEvents()
+        window.show_page("changelog")
+        app.processEvents()
+    results["show_page"] = measure(switch)
+
+    def select_middle():
+        window.selecionar_linha(middle)
+    results["mover_cima"] = measure(run(window.mover_cima), select_middle)
+    results["mover_baixo"] = measure(run(window.mover_baixo), select_middle)
+
+    # Diálogo de edição respondido sem interação
+    edits = iter(range(1 << 30))
+    original_get_text = QInputDialog.getText
+    QInputDialog.getText = staticmethod(lambda *a, **k: (f"Texto editado {next(edits)}", True))
+    try:
+        results["editar_item"] = measure(run(window.editar_item), select_middle)
+    finally:
+        QInputDialog.getText = original_get_text
+
+    # Remove e repõe a mesma linha para manter o tamanho da lista
+    removed = []
+    def restore_and_select():
+        if removed:
+            model.insert(middle, removed.pop())
+            app.processEvents()
+        select_middle()
+    def remove():
+        removed.append(changes[middle])
+        window.remover_item()
+        app.processEvents()
+    results["remover_item"] = measure(remove, restore_and_select)
+    restore_and_select()
+
+    # Busca incremental: o índice é montado na primeira consulta, fora da medição
+    model.search("")
+    queries = iter(["sintetica 1", "alteracao", "corrigido bug", "numero 12"] * (MAX_REPS + 1))
+    def clear_search():
+        window.entry_busca.clear()
+        app.processEvents()
+    results["busca"] = measure(run(lambda: window.entry_busca.setText(next(queries))), clear_search)
+    clear_search()
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return results
+
+# ================= MANIFESTOS / PUBLICAÇÃO =================
+
+def bench_files(n, tmp):
+    changelog_path, version_path = synthetic_workspace(tmp, n)
+    data = load_json(changelog_path, None)
+    results = {}
+
+    # Conteúdo alternado: save_json pula gravações idênticas, e aqui queremos medir a gravação
+    toggle = [0]
+    def save():
+        toggle[0] ^= 1
+        data["changes"][0] = f"{PREFIXOS['Adicionar']} Alternado {toggle[0]}"
+        save_json(changelog_path, data)
+    results["save_json"] = measure(save)
+    results["save_json_inalterado"] = measure(lambda: save_json(changelog_path, data))
+    results["load_json"] = measure(lambda: load_json(changelog_path, None))
+    # Roda a cada gravação do editor: precisa ficar abaixo de 1 ms por mil entradas
+    results["validar"] = measure(lambda: validate_changelog(data))
+
+    # Bump de versão do publicar_update: valida o changelog e grava o version.json novo
+    release = [0]
+    def bump():
+        changelog = load_json(changelog_path, {"changes": []})
+        if validate_changelog(changelog):
+            raise RuntimeError("changelog sintético inválido")
+        manifest = load_json(version_path, {"game_version": "", "axion_release": ""})
+        release[0] += 1
+        manifest["axion_release"] = f"1.0.{release[0]}"
+        save_json(version_path, manifest)
+    results["publicar_bump"] = measure(bump)
+    return results
+
+# ================= BASELINE =================
+
+def run_all(sizes=SIZES):
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+
+    results = {CALIBRATION: calibrate()}
+    for n in sizes:
+        tmp = tempfile.mkdtemp(prefix="axion-bench-")
+        try:
+            for name, value in bench_editor(app, n, tmp).items():
+                results[f"{n}/{name}"] = value
+            for name, value in bench_files(n, tmp).items():
+                results[f"{n}/{name}"] = value
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+def environment():
+    from PyQt5.QtCore import QT_VERSION_STR
+    return {
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "qpa": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+def speed_factor(results, baseline):
+    # Quanto esta execução está mais lenta que a da baseline no trabalho de calibração
+    old = baseline.get("results", {}).get(CALIBRATION)
+    new = results.get(CALIBRATION)
+    if not old or not new or not old["median_ms"]:
+        return 1.0
+    return new["median_ms"] / old["median_ms"]
+
+def is_regression(old, new, threshold=THRESHOLD, factor=1.0):
+    # Mediana acima da esperada (baseline x fator da máquina) por mais que o limite relativo
+    # e que o espalhamento das duas medições
+    expected = old["median_ms"] * factor
+    noise = max(SPREAD_K * max(old.get("iqr_ms", 0.0), new["iqr_ms"]), NOISE_MS)
+    return new["median_ms"] - expected > max(expected * threshold, noise)
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Compara as medianas, já corrigidas pela calibração da mesma execução.
+    Retorna [(nome, baseline ms, atual ms, variação relativa, regrediu)], quantas regrediram
+    e o fator de velocidade da máquina.
+    """
+    factor = speed_factor(results, baseline)
+    rows = []
+    regressions = 0
+    for name, value in results.items():
+        if name == CALIBRATION:
+            continue
+        old = baseline.get("results", {}).get(name)
+        new_ms = value["median_ms"]
+        if not old:
+            rows.append((name, None, new_ms, None, False))
+            continue
+        expected = old["median_ms"] * factor
+        change = (new_ms - expected) / expected if expected else 0.0
+        regressed = is_regression(old, value, threshold, factor)
+        regressions += regressed
+        rows.append((name, expected, new_ms, change, regressed))
+    return rows, regressions, factor
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do editor e da publicação do Axion")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--salvar", action="store_true", help="grava os resultados como nova baseline")
+    parser.add_argument("--limite", type=float, default=THRESHOLD * 100, help="regressão em %% (padrão 20)")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.tamanhos)
+    baseline = load_json(args.baseline, {})
+    rows, regressions, factor = compare(results, baseline, args.limite / 100)
+
+    print(f"Calibração: {factor:.2f}x o tempo da baseline (baseline abaixo já corrigida)")
+    print(f"{'medição (mediana, ms)':<30} {'baseline':>10} {'atual':>10} {'var':>8}")
+    for name, old, new, change, regressed in rows:
+        old_text = f"{old:10.3f}" if old is not None else f"{'-':>10}"
+        change_text = f"{change * 100:+7.1f}%" if change is not None else f"{'novo':>8}"
+        flag = "  <-- regressão" if regressed else ""
+        print(f"{name:<30} {old_text} {new:10.3f} {change_text}{flag}")
+
+    if args.salvar:
+        save_json(args.baseline, {"environment": environment(), "results": results})
+        print(f"Baseline gravada em {os.path.relpath(args.baseline)}")
+        return 0
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Axion Update - Canais de release
+channels.json descreve todos os canais (stable, beta, ...) e é a fonte única das versões;
+o version.json de cada canal é gerado a partir dele, numa passada só.
+"""
+
+import os
+import re
+import sys
+import argparse
+
+from axion_common import (
+    BASE_DIR, VERSION_PATH, CHANNELS_PATH, DEFAULT_CHANNEL, load_json, save_json
+)
+from axion_manifest import write_client, client_paths, current_deltas
+
+
+CHANNEL_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,31}$")
+
+# Campos de versão copiados do channels.json; o resto do version.json (binary, chunks, deltas,
+# changelog_archive) é dos artefatos publicados e é preservado
+VERSION_FIELDS = ("game_version", "axion_release")
+
+# ================= CANAIS =================
+
+def channel_defaults(name):
+    # O canal padrão fica na raiz (clientes antigos continuam lendo version.json/changelog.json);
+    # os demais em channels/<nome>/. Caminhos relativos ao repositório, com "/"
+    if name == DEFAULT_CHANNEL:
+        return {
+            "version": "version.json",
+            "changelog": "changelog.json",
+            "binary": "Axion.exe",
+            "archive": "changelog_archive",
+        }
+    folder = f"channels/{name}"
+    return {
+        "version": f"{folder}/version.json",
+        "changelog": f"{folder}/changelog.json",
+        "binary": f"{folder}/Axion.exe",
+        "archive": f"{folder}/changelog_archive",
+    }
+
+def new_channel(name, game_version="", axion_release=""):
+    return {"game_version": game_version, "axion_release": axion_release, **channel_defaults(name)}
+
+def load_channels(path=CHANNELS_PATH):
+    """
+    {nome: canal}, canal padrão primeiro. Sem channels.json (repositório de um canal só),
+    o canal padrão vem do version.json da raiz.
+    """
+    dados = load_json(path, None)
+    if dados is None:
+        manifest = load_json(VERSION_PATH, {})
+        return {DEFAULT_CHANNEL: new_channel(
+            DEFAULT_CHANNEL, manifest.get("game_version", ""), manifest.get("axion_release", "")
+        )}
+
+    channels = {}
+    for name, channel in dados.get("channels", {}).items():
+        channels[name] = {**new_channel(name), **channel}
+    if DEFAULT_CHANNEL in channels:
+        channels = {DEFAULT_CHANNEL: channels.pop(DEFAULT_CHANNEL), **channels}
+    return channels
+
+def save_channels(channels, path=CHANNELS_PATH):
+    # Só grava os caminhos que fogem do padrão: o arquivo fica pequeno e fácil de editar à mão
+    compact = {}
+    for name, channel in channels.items():
+        defaults = channel_defaults(name)
+        compact[name] = {k: v for k, v in channel.items() if defaults.get(k) != v}
+    return save_json(path, {"channels": compact})
+
+def channel_path(channel, key):
+    return os.path.join(BASE_DIR, *channel[key].split("/"))
+
+def validate_channel_name(name, channels=()):
+    if not CHANNEL_RE.match(name):
+        return "nome de canal inválido (use letras minúsculas, números, '-' ou '_')"
+    if name in channels:
+        return f"o canal '{name}' já existe"
+    return None
+
+# ================= SAÍDAS =================
+
+def channel_manifest(name, channel, channels):
+    """
+    version.json do canal: versões do channels.json + artefatos já publicados no arquivo atual.
+    O do canal padrão lista os outros canais (só o caminho; cada cliente lê apenas o seu).
+    """
+    previous = load_json(channel_path(channel, "version"), {})
+    manifest = {key: channel.get(key, "") for key in VERSION_FIELDS}
+    for key, value in previous.items():
+        if key not in manifest and key not in ("channel", "channels"):
+            manifest[key] = value
+    # Deltas para a release anterior não servem para a nova: saem junto com a troca de versão
+    if "deltas" in manifest:
+        manifest["deltas"] = current_deltas(manifest)
+        if not manifest["deltas"]:
+            del manifest["deltas"]
+
+    if name == DEFAULT_CHANNEL:
+        others = {n: c["version"] for n, c in channels.items() if n != name}
+        if others:
+            manifest["channels"] = others
+    else:
+        manifest["channel"] = name
+    return manifest
+
+def write_outputs(channels, manifests=None):
+    """
+    Grava o version.json e o client.json de todos os canais numa passada (manifests: {nome: manifesto
+    já montado}, ex. o do canal recém-publicado) e cria o changelog.json de canais novos.
+    Retorna os caminhos que mudaram.
+    """
+    manifests = manifests or {}
+    changed = []
+    for name, channel in channels.items():
+        manifest = manifests.get(name) or channel_manifest(name, channel, channels)
+        version_path = channel_path(channel, "version")
+        os.makedirs(os.path.dirname(version_path), exist_ok=True)
+        if save_json(version_path, manifest):
+            changed.append(version_path)
+        if write_client(manifest, version_path):
+            changed.append(client_paths(version_path)[0])
+
+        changelog_path = channel_path(channel, "changelog")
+        if not os.path.exists(changelog_path):
+            save_json(changelog_path, {"changes": []})
+            changed.append(changelog_path)
+    return changed
+
+def load_manifests(channels):
+    # Manifestos publicados de cada canal (para compartilhar artefatos entre eles)
+    return {name: load_json(channel_path(channel, "version"), {}) for name, channel in channels.items()}
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Canais de release do Axion")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("listar", help="mostra os canais e as versões de cada um")
+
+    criar = sub.add_parser("criar", help="cria um canal novo")
+    criar.add_argument("nome")
+    criar.add_argument("--game", help="versão do jogo (padrão: a do canal stable)")
+    criar.add_argument("--release", default="")
+
+    sub.add_parser("gerar", help="regera o version.json de todos os canais a partir do channels.json")
+    args = parser.parse_args(argv)
+
+    channels = load_channels()
+
+    if args.cmd == "listar":
+        for name, channel in channels.items():
+            print(f"{name:<12} jogo {channel['game_version'] or '-':<10} axion {channel['axion_release'] or '-':<10}"
+                  f" {channel['version']}")
+        return 0
+
+    if args.cmd == "criar":
+        erro = validate_channel_name(args.nome, channels)
+        if erro:
+            print(f"ERRO: {erro}")
+            return 1
+        game = args.game or channels.get(DEFAULT_CHANNEL, {}).get("game_version", "")
+        channels[args.nome] = new_channel(args.nome, game, args.release)
+
+    save_channels(channels)
+    for path in write_outputs(channels):
+        print(f"gravado {os.path.relpath(path, BASE_DIR)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
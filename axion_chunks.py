@@ -0,0 +1,271 @@
+"""
+Axion Update - Manifesto por chunks
+Divide o Axion.exe com chunking por conteúdo (gear hash, estilo FastCDC) e grava um índice compacto
+com offset, tamanho e SHA-256 de cada chunk. Chunks iguais entre releases são reaproveitados da cópia local.
+"""
+
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import argparse
+from operator import length_hint
+
+from axion_common import (
+    BASE_DIR, BINARY_PATH, VERSION_PATH,
+    load_json, save_json, file_sha256, rel_path
+)
+
+CHUNKS_DIR = os.path.join(BASE_DIR, "chunks")
+
+# ================= PARÂMETROS =================
+#
+# Tamanhos mínimo / médio / máximo dos chunks. Até o tamanho médio o corte exige mais bits zerados
+# (normalized chunking), o que concentra os tamanhos perto da média.
+
+MIN_SIZE = 16 * 1024
+AVG_SIZE = 64 * 1024
+MAX_SIZE = 256 * 1024
+
+_MASK64 = (1 << 64) - 1
+_THRESH_SMALL = 1 << (64 - 18)
+_THRESH_LARGE = 1 << (64 - 14)
+
+# Tabela fixa: precisa ser idêntica no publicador e no cliente
+GEAR = [
+    int.from_bytes(hashlib.sha256(b"axion-gear" + bytes([i])).digest()[:8], "little")
+    for i in range(256)
+]
+
+# ================= FORMATO DO ÍNDICE =================
+#
+# MAGIC | quantidade:u32 | tamanho total:u64 | sha256 do binário
+# por chunk: tamanho:u32 | sha256   (offsets são a soma dos tamanhos anteriores)
+
+MAGIC = b"AXC1"
+INDEX_HEADER = struct.Struct("<4sIQ32s")
+INDEX_ENTRY = struct.Struct("<I32s")
+
+# ================= CHUNKING =================
+
+def _cut_point(data, start, size):
+    remaining = size - start
+    if remaining <= MIN_SIZE:
+        return size
+    normal = start + min(AVG_SIZE, remaining)
+    limit = start + min(MAX_SIZE, remaining)
+
+    # Laço mínimo por byte (h + h em vez de shift, sem contador): a posição do corte sai do
+    # que falta no iterador. Continua sendo Python por byte, ~0,13 s/MB; os cortes não podem
+    # mudar (índices publicados), então o gear hash fica como está
+    gear = GEAR
+    h = 0
+    bytes_iter = iter(data[start + MIN_SIZE:normal])
+    for byte in bytes_iter:
+        h = (h + h + gear[byte]) & _MASK64
+        if h < _THRESH_SMALL:
+            return normal - length_hint(bytes_iter)
+    bytes_iter = iter(data[normal:limit])
+    for byte in bytes_iter:
+        h = (h + h + gear[byte]) & _MASK64
+        if h < _THRESH_LARGE:
+            return limit - length_hint(bytes_iter)
+    return limit
+
+def chunk_data(data):
+    # Gera (offset, tamanho, sha256) para cada chunk de um buffer (bytes ou mmap)
+    size = len(data)
+    start = 0
+    while start < size:
+        end = _cut_point(data, start, size)
+        yield start, end - start, hashlib.sha256(data[start:end]).digest()
+        start = end
+
+def chunk_file(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return list(chunk_data(data))
+
+# ================= ÍNDICE =================
+
+def build_index(path):
+    chunks = chunk_file(path)
+    return {
+        "size": sum(length for _, length, _ in chunks),
+        "sha256": file_sha256(path),
+        "chunks": chunks,
+    }
+
+def write_index(index, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_HEADER.pack(
+            MAGIC, len(index["chunks"]), index["size"], bytes.fromhex(index["sha256"])
+        ))
+        for _, length, digest in index["chunks"]:
+            f.write(INDEX_ENTRY.pack(length, digest))
+    os.replace(tmp_path, path)
+
+def read_index(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    magic, count, size, digest = INDEX_HEADER.unpack_from(raw, 0)
+    if magic != MAGIC or len(raw) != INDEX_HEADER.size + count * INDEX_ENTRY.size:
+        raise ValueError("Índice de chunks inválido")
+
+    chunks = []
+    offset = 0
+    for length, chunk_digest in INDEX_ENTRY.iter_unpack(raw[INDEX_HEADER.size:]):
+        chunks.append((offset, length, chunk_digest))
+        offset += length
+    if offset != size:
+        raise ValueError("Índice de chunks inválido")
+    return {"size": size, "sha256": digest.hex(), "chunks": chunks}
+
+def index_entry(index_path, index):
+    # Referência ao índice gravada em version.json
+    return {
+        "file": rel_path(index_path),
+        "count": len(index["chunks"]),
+        "sha256": file_sha256(index_path),
+    }
+
+def index_name(release):
+    return f"Axion-{release}.axc"
+
+def dedup_stats(previous, index):
+    # Quanto do binário novo já existia na release anterior
+    known = {digest for _, _, digest in previous["chunks"]} if previous else set()
+    new = [(length, digest) for _, length, digest in index["chunks"] if digest not in known]
+    return {
+        "chunks": len(index["chunks"]),
+        "new_chunks": len(new),
+        "new_bytes": sum(length for length, _ in new),
+    }
+
+# ================= CLIENTE (STAND-IN) =================
+
+def plan_fetch(index, local_path):
+    """
+    Compara o índice remoto com a cópia local.
+    Retorna (reaproveitar, baixar): reaproveitar = [(offset destino, offset local, tamanho)],
+    baixar = faixas (offset, tamanho) contíguas do binário remoto.
+    """
+    local = {}
+    if local_path and os.path.exists(local_path):
+        for offset, length, digest in chunk_file(local_path):
+            local.setdefault(digest, offset)
+
+    reuse = []
+    fetch = []
+    for offset, length, digest in index["chunks"]:
+        local_offset = local.get(digest)
+        if local_offset is not None:
+            reuse.append((offset, local_offset, length))
+        elif fetch and fetch[-1][0] + fetch[-1][1] == offset:
+            fetch[-1] = (fetch[-1][0], fetch[-1][1] + length)
+        else:
+            fetch.append((offset, length))
+    return reuse, fetch
+
+def assemble(index, local_path, fetch_range, out_path):
+    # fetch_range(offset, tamanho) -> bytes do binário remoto
+    reuse, fetch = plan_fetch(index, local_path)
+    tmp_path = out_path + ".tmp"
+
+    with open(tmp_path, "wb") as out:
+        out.truncate(index["size"])
+        if reuse:
+            with open(local_path, "rb") as local:
+                for offset, local_offset, length in reuse:
+                    local.seek(local_offset)
+                    out.seek(offset)
+                    out.write(local.read(length))
+        for offset, length in fetch:
+            out.seek(offset)
+            out.write(fetch_range(offset, length))
+
+    bad_offset = None
+    with open(tmp_path, "rb") as f:
+        for offset, length, digest in index["chunks"]:
+            if hashlib.sha256(f.read(length)).digest() != digest:
+                bad_offset = offset
+                break
+    if bad_offset is not None:
+        os.remove(tmp_path)
+        raise ValueError(f"Chunk em {bad_offset} não confere com o índice")
+
+    os.replace(tmp_path, out_path)
+    return reuse, fetch
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manifesto por chunks do Axion.exe")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    gerar = sub.add_parser("gerar", help="gera o índice de chunks da release atual")
+    gerar.add_argument("--binario", default=BINARY_PATH)
+
+    plano = sub.add_parser("plano", help="mostra o que um cliente precisaria baixar")
+    plano.add_argument("--indice", required=True)
+    plano.add_argument("--local", help="cópia local (release instalada)")
+
+    montar = sub.add_parser("montar", help="monta o binário a partir da cópia local + faixas remotas")
+    montar.add_argument("--indice", required=True)
+    montar.add_argument("--local")
+    montar.add_argument("--remoto", required=True, help="binário completo servindo as faixas")
+    montar.add_argument("--saida", required=True)
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "gerar":
+        manifest = load_json(VERSION_PATH, {"game_version": "", "axion_release": ""})
+        release = manifest.get("axion_release", "")
+        if not release:
+            print("ERRO: axion_release vazio em version.json")
+            return 1
+
+        previous = None
+        previous_entry = manifest.get("chunks")
+        if previous_entry:
+            previous_path = os.path.join(BASE_DIR, previous_entry["file"])
+            if os.path.exists(previous_path):
+                previous = read_index(previous_path)
+
+        os.makedirs(CHUNKS_DIR, exist_ok=True)
+        index_path = os.path.join(CHUNKS_DIR, index_name(release))
+        index = build_index(args.binario)
+        write_index(index, index_path)
+
+        manifest["chunks"] = index_entry(index_path, index)
+        save_json(VERSION_PATH, manifest)
+
+        stats = dedup_stats(previous, index)
+        print(f"Índice {manifest['chunks']['file']}: {stats['chunks']} chunks, {index['size']:,} bytes")
+        if previous:
+            print(f"  novos desde a release anterior: {stats['new_chunks']} chunks, {stats['new_bytes']:,} bytes")
+        return 0
+
+    index = read_index(args.indice)
+
+    if args.cmd == "plano":
+        reuse, fetch = plan_fetch(index, args.local)
+        fetch_bytes = sum(length for _, length in fetch)
+        print(f"Reaproveitar: {len(reuse)} chunks ({sum(r[2] for r in reuse):,} bytes)")
+        print(f"Baixar: {len(fetch)} faixas ({fetch_bytes:,} de {index['size']:,} bytes)")
+        return 0
+
+    with open(args.remoto, "rb") as remote:
+        def fetch_range(offset, length):
+            remote.seek(offset)
+            return remote.read(length)
+        reuse, fetch = assemble(index, args.local, fetch_range, args.saida)
+    print(f"Binário montado em {args.saida}: {len(reuse)} chunks locais, {len(fetch)} faixas baixadas")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""
+Axion Update - Cliente de download
+Baixa o Axion.exe em faixas paralelas sobre conexões keep-alive, com checkpoint em disco
+(retoma de onde parou) e conferência do SHA-256 contra o version.json.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+
+from axion_common import BINARY_PATH, load_json, save_json, hash_file
+
+RANGE_SIZE = 4 << 20
+CONNECTIONS = 4
+RETRIES = 3
+IO_CHUNK = 1 << 20
+
+# ================= CONEXÕES =================
+
+class ConnectionPool:
+    # Uma conexão keep-alive por worker, devolvida ao pool após cada faixa
+    def __init__(self, url, size):
+        parts = urlsplit(url)
+        self.cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += "?" + parts.query
+        self.idle = queue.LifoQueue(maxsize=size)
+
+    def acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            return self.cls(self.host, self.port, timeout=30)
+
+    def release(self, conn):
+        try:
+            self.idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+def http_get(url, headers=None):
+    parts = urlsplit(url)
+    cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = cls(parts.hostname, parts.port, timeout=30)
+    try:
+        conn.request("GET", parts.path or "/", headers=headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+def manifest_url(base_url, channel=None):
+    # Cada canal tem o seu version.json (o cliente não baixa os dos outros canais)
+    if not channel or channel == "stable":
+        return urljoin(base_url, "version.json")
+    return urljoin(base_url, f"channels/{channel}/version.json")
+
+def fetch_manifest(base_url, channel=None):
+    url = manifest_url(base_url, channel)
+    status, _, body = http_get(url)
+    if status != 200:
+        raise OSError(f"{url}: HTTP {status}")
+    return json.loads(body.decode("utf-8"))
+
+def fetch_client_manifest(base_url, channel=None):
+    # client.json compacto do canal; publicações antigas sem ele caem no version.json
+    url = manifest_url(base_url, channel)
+    status, _, body = http_get(url[:-len("version.json")] + "client.json")
+    if status == 404:
+        return fetch_manifest(base_url, channel)
+    if status != 200:
+        raise OSError(f"client.json: HTTP {status}")
+    return json.loads(body)
+
+def fetch_notes(base_url, manifest):
+    # Notas da release (changelog.json.gz), só quando o cliente vai mesmo atualizar
+    entry = manifest.get("changelog")
+    if not entry:
+        return None
+    import gzip
+    import hashlib
+    status, _, body = http_get(urljoin(base_url, entry["file"]))
+    if status != 200:
+        raise OSError(f"{entry['file']}: HTTP {status}")
+    if len(body) != entry["size"] or hashlib.sha256(body).hexdigest() != entry["sha256"]:
+        raise ValueError("SHA-256 das notas não confere com o client.json")
+    return json.loads(gzip.decompress(body))
+
+# ================= CHECKPOINT =================
+#
+# <saida>.part       arquivo do tamanho final, preenchido faixa a faixa
+# <saida>.part.json  {url, size, sha256, etag, range_size, done: [[início, fim), ...]}
+
+def _checkpoint_path(out_path):
+    return out_path + ".part.json"
+
+def load_checkpoint(out_path, url, size, sha256, range_size=RANGE_SIZE):
+    state = load_json(_checkpoint_path(out_path), None)
+    part_path = out_path + ".part"
+    if (not state or state.get("url") != url or state.get("size") != size
+            or state.get("sha256") != sha256 or not os.path.exists(part_path)
+            or os.path.getsize(part_path) != size):
+        return {"url": url, "size": size, "sha256": sha256, "etag": None,
+                "range_size": range_size, "done": []}
+    return state
+
+def _plan_ranges(size, done, range_size):
+    finished = {tuple(r) for r in done}
+    return [
+        (start, min(start + range_size, size))
+        for start in range(0, size, range_size)
+        if (start, min(start + range_size, size)) not in finished
+    ]
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ================= DOWNLOAD =================
+
+class RangeChanged(Exception):
+    # O servidor ignorou o If-Range: o binário remoto não é mais o do checkpoint
+    pass
+
+def _fetch_range(pool, out, out_lock, start, end, etag):
+    headers = {"Range": f"bytes={start}-{end - 1}"}
+    if etag:
+        headers["If-Range"] = etag
+
+    conn = pool.acquire()
+    try:
+        conn.request("GET", pool.path, headers=headers)
+        response = conn.getresponse()
+        if response.status != 206:
+            response.read()
+            if response.status == 200:
+                raise RangeChanged()
+            raise OSError(f"HTTP {response.status} na faixa {start}-{end - 1}")
+
+        offset = start
+        while offset < end:
+            buf = response.read(min(IO_CHUNK, end - offset))
+            if not buf:
+                raise OSError(f"Conexão encerrada na faixa {start}-{end - 1}")
+            with out_lock:
+                out.seek(offset)
+                out.write(buf)
+            offset += len(buf)
+        response.read()
+        new_etag = response.getheader("ETag")
+    except BaseException:
+        conn.close()
+        raise
+    pool.release(conn)
+    return new_etag
+
+def download(url, out_path, size, sha256, connections=CONNECTIONS, range_size=RANGE_SIZE, progress=None):
+    """
+    Baixa url para out_path em faixas paralelas. Retoma um checkpoint anterior quando ele
+    corresponde ao mesmo url/tamanho/sha256. Só substitui out_path depois de conferir o SHA-256.
+    progress(baixados, total) é chamado de várias threads.
+    Retorna {downloaded, resumed, seconds}.
+    """
+    start_time = time.perf_counter()
+    part_path = out_path + ".part"
+    checkpoint_path = _checkpoint_path(out_path)
+
+    state = load_checkpoint(out_path, url, size, sha256, range_size)
+    if not state["done"]:
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+        save_json(checkpoint_path, state, fsync=False)
+
+    # Um checkpoint retomado mantém o tamanho de faixa com que foi criado
+    pending = _plan_ranges(size, state["done"], state["range_size"])
+    resumed = size - sum(end - start for start, end in pending)
+    downloaded = 0
+
+    ranges = queue.Queue()
+    for item in pending:
+        ranges.put(item)
+
+    pool = ConnectionPool(url, connections)
+    state_lock = threading.Lock()
+    out_lock = threading.Lock()
+    errors = []
+
+    def worker(out):
+        nonlocal downloaded
+        while not errors:
+            try:
+                start, end = ranges.get_nowait()
+            except queue.Empty:
+                return
+            for attempt in range(RETRIES):
+                try:
+                    etag = _fetch_range(pool, out, out_lock, start, end, state["etag"])
+                    break
+                except RangeChanged as exc:
+                    errors.append(exc)
+                    return
+                except (OSError, http.client.HTTPException) as exc:
+                    if attempt == RETRIES - 1:
+                        errors.append(exc)
+                        return
+            # Só marca a faixa como concluída depois que os bytes estão no arquivo
+            with out_lock:
+                out.flush()
+            with state_lock:
+                state["etag"] = state["etag"] or etag
+                state["done"].append([start, end])
+                save_json(checkpoint_path, state, fsync=False)
+                downloaded += end - start
+                if progress:
+                    progress(resumed + downloaded, size)
+
+    try:
+        with open(part_path, "r+b") as out:
+            threads = [
+                threading.Thread(target=worker, args=(out,), daemon=True)
+                for _ in range(min(connections, max(1, len(pending))))
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    finally:
+        pool.close()
+
+    if errors:
+        if isinstance(errors[0], RangeChanged):
+            _remove(checkpoint_path)
+            _remove(part_path)
+            raise ValueError("Axion.exe mudou no servidor durante o download; baixe novamente")
+        raise errors[0]
+
+    actual_size, actual_sha256 = hash_file(part_path)
+    if actual_size != size or actual_sha256 != sha256:
+        _remove(checkpoint_path)
+        _remove(part_path)
+        raise ValueError("SHA-256 do download não confere com o version.json")
+
+    os.replace(part_path, out_path)
+    _remove(checkpoint_path)
+    return {
+        "downloaded": downloaded,
+        "resumed": resumed,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+def update_plan(manifest, installed=None):
+    # Menor caminho a partir da release instalada: o delta dela, se existir e for menor que o binário.
+    # Só deltas para esta release e este binário (o client.json já vem filtrado e omite "to" e
+    # "target_sha256"; o version.json completo pode trazer deltas antigos)
+    binary = manifest["binary"]
+    release = manifest.get("axion_release")
+    deltas = [
+        d for d in manifest.get("deltas", [])
+        if installed and d["from"] == installed and d["size"] < binary["size"]
+        and d.get("to", release) == release and d.get("target_sha256", binary["sha256"]) == binary["sha256"]
+    ]
+    return min(deltas, key=lambda d: d["size"]) if deltas else None
+
+def download_release(base_url, out_path=BINARY_PATH, connections=CONNECTIONS, progress=None, channel=None,
+                     installed=None):
+    """
+    Baixa o binário descrito no version.json do canal (caminhos relativos à raiz publicada).
+    installed: release do Axion.exe que já está em out_path; com delta publicado a partir dela,
+    baixa só o delta e reconstrói o binário ao lado, conferido contra o SHA-256 do manifesto
+    antes de substituir out_path (base diferente da esperada ou resultado errado: binário completo).
+    """
+    manifest = fetch_client_manifest(base_url, channel)
+    binary = manifest.get("binary")
+    if not binary:
+        raise ValueError("version.json não descreve o binário (publique com os artefatos)")
+
+    delta = update_plan(manifest, installed) if os.path.exists(out_path) else None
+    if delta:
+        from axion_delta import apply_delta
+        delta_path = out_path + ".axd"
+        new_path = out_path + ".novo"
+        stats = download(urljoin(base_url, delta["file"]), delta_path, delta["size"], delta["sha256"],
+                         connections, progress=progress)
+        try:
+            apply_delta(out_path, delta_path, new_path)
+            if hash_file(new_path) == (binary["size"], binary["sha256"]):
+                os.replace(new_path, out_path)
+                stats["delta"] = delta["from"]
+                return stats
+        except ValueError:
+            pass
+        finally:
+            _remove(delta_path)
+            _remove(new_path)
+
+    url = urljoin(base_url, binary["file"])
+    return download(url, out_path, binary["size"], binary["sha256"], connections, progress=progress)
+
+# ================= MAIN =================
+
+def _print_stats(label, stats):
+    mb = stats["downloaded"] / (1 << 20)
+    rate = mb / stats["seconds"] if stats["seconds"] else 0
+    print(f"{label:<14} {mb:8.1f} MiB em {stats['seconds']:6.2f} s  ({rate:7.1f} MiB/s)"
+          f"  retomados: {stats['resumed']:,} bytes")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cliente de download do Axion")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    baixar = sub.add_parser("baixar", help="baixa o Axion.exe da release publicada")
+    baixar.add_argument("--url", required=True, help="URL base (raiz publicada, pasta do version.json)")
+    baixar.add_argument("--canal", help="canal da release (padrão: stable)")
+    baixar.add_argument("--saida", default=BINARY_PATH)
+    baixar.add_argument("--conexoes", type=int, default=CONNECTIONS)
+    baixar.add_argument("--instalado", metavar="VERSAO",
+                        help="release do Axion.exe em --saida (baixa só o delta, se houver)")
+
+    notas = sub.add_parser("notas", help="mostra as notas da release publicada")
+    notas.add_argument("--url", required=True, help="URL base (raiz publicada, pasta do version.json)")
+    notas.add_argument("--canal", help="canal da release (padrão: stable)")
+
+    bench = sub.add_parser("bench", help="mede o download de um arquivo num servidor local")
+    bench.add_argument("--arquivo", default=BINARY_PATH)
+    bench.add_argument("--conexoes", type=int, nargs="+", default=[1, CONNECTIONS])
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "baixar":
+        base_url = args.url if args.url.endswith("/") else args.url + "/"
+        stats = download_release(base_url, args.saida, args.conexoes, channel=args.canal,
+                                 installed=args.instalado)
+        _print_stats(f"delta {stats['delta']}" if "delta" in stats else "Axion.exe", stats)
+        return 0
+
+    if args.cmd == "notas":
+        base_url = args.url if args.url.endswith("/") else args.url + "/"
+        manifest = fetch_client_manifest(base_url, args.canal)
+        notes = fetch_notes(base_url, manifest)
+        print(f"Axion {manifest.get('axion_release', '')} (jogo {manifest.get('game_version', '')})")
+        for entry in (notes or {}).get("changes", []):
+            print(f"  {entry}")
+        return 0
+
+    import tempfile
+    from axion_server import serve_in_background
+
+    path = os.path.abspath(args.arquivo)
+    size, sha256 = hash_file(path)
+    server = serve_in_background(os.path.dirname(path), extra=(os.path.basename(path),))
+    url = f"http://127.0.0.1:{server.server_address[1]}/{os.path.basename(path)}"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for n in args.conexoes:
+                out_path = os.path.join(tmp, f"download-{n}")
+                _print_stats(f"{n} conexões", download(url, out_path, size, sha256, n))
+                os.remove(out_path)
+    finally:
+        server.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Axion Update - Utilitários compartilhados
+Configuração e I/O de manifestos usados pelo editor e pelas ferramentas de publicação (sem PyQt5)
+"""
+
+import os
+import re
+import json
+import stat
+
+# ================= CONFIG =================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHANGELOG_PATH = os.path.join(BASE_DIR, "changelog.json")
+VERSION_PATH = os.path.join(BASE_DIR, "version.json")
+BINARY_PATH = os.path.join(BASE_DIR, "Axion.exe")
+DELTAS_DIR = os.path.join(BASE_DIR, "deltas")
+CHANNELS_PATH = os.path.join(BASE_DIR, "channels.json")
+DEFAULT_CHANNEL = "stable"
+
+PREFIXOS = {
+    "Adicionar": "[ + ] Adicionado",
+    "Remover": "[ - ] Removido",
+    "Correção Bug": "[ * ] Corrigido Bug",
+    "Desativar": "[ ! ] Desativado temporariamente"
+}
+
+# Linhas de detalhe ("• show fps — ...") complementam a entrada anterior e não levam prefixo
+SUBITEM = "•"
+
+VERSION_RE = re.compile(r"^\d+(\.\d+){1,3}$")
+
+# ================= UTILS =================
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_json(path, data, fsync=True):
+    """
+    Grava o manifesto de forma atômica (arquivo temporário + rename): um crash no meio
+    da escrita nunca deixa um JSON truncado no lugar do original.
+    Retorna False sem tocar no arquivo quando o conteúdo serializado já é idêntico ao do disco.
+    """
+    payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    if same_content(path, payload):
+        return False
+    write_atomic(path, payload, fsync)
+    return True
+
+def same_content(path, payload):
+    try:
+        if os.path.getsize(path) != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
+def _file_mode(path):
+    # Permissões do arquivo substituído; arquivo novo: as de um open() comum (0o666 menos a umask)
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_umask()
+
+def _umask():
+    # Lida do /proc quando existe: os.umask() troca a máscara do processo todo por um instante,
+    # e o autosave grava de outra thread
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+def write_atomic(path, payload, fsync=True):
+    # tempfile importado aqui: no editor só o worker do autosave grava
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp cria com 0600: sem isso o manifesto ficaria legível só pelo dono
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Persiste o rename também (só POSIX; no Windows não há fsync de diretório)
+    if fsync and os.name == "posix":
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def hash_file(path, buffer_size=1 << 20, use_mmap=False):
+    # SHA-256 em blocos de tamanho fixo: memória constante independente do tamanho do binário
+    # (hashlib/mmap importados aqui: o editor não precisa deles na abertura)
+    import mmap
+    import hashlib
+
+    h = hashlib.sha256()
+    size = 0
+    with open(path, "rb", buffering=0) as f:
+        if use_mmap:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m, memoryview(m) as view:
+                    for offset in range(0, len(m), buffer_size):
+                        h.update(view[offset:offset + buffer_size])
+                    size = len(m)
+        else:
+            buf = bytearray(buffer_size)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+                size += n
+    return size, h.hexdigest()
+
+def file_sha256(path):
+    return hash_file(path)[1]
+
+def split_prefix(texto):
+    # (chave do PREFIXOS, descrição sem prefixo); chave vazia quando não há prefixo conhecido
+    for key, prefixo in PREFIXOS.items():
+        if texto.startswith(prefixo):
+            return key, texto[len(prefixo):].strip()
+    return "", texto
+
+def version_key(versao):
+    # "1.2.7" -> (1, 2, 7, 0): comparável e com tamanho fixo
+    partes = [int(p) for p in versao.split(".")]
+    return tuple(partes + [0] * (4 - len(partes)))
+
+def rel_path(path):
+    # Caminho relativo ao repositório, com "/" (formato usado nos manifestos)
+    return os.path.relpath(path, BASE_DIR).replace(os.sep, "/")
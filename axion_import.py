@@ -0,0 +1,149 @@
+"""
+Axion Update - Importação de entradas
+Converte texto colado ou arquivos (lista Markdown, git log, texto simples) em entradas do changelog,
+detectando a categoria do PREFIXOS de cada linha.
+"""
+
+import re
+import sys
+import argparse
+
+from axion_common import (
+    CHANGELOG_PATH, PREFIXOS, SUBITEM,
+    load_json, save_json, split_prefix
+)
+from axion_validate import validate_changelog
+from axion_search import normalize as _plain
+
+# ================= DETECÇÃO =================
+
+_GIT_COMMIT_RE = re.compile(r"^commit [0-9a-f]{7,40}\b")
+_GIT_HEADER_RE = re.compile(r"^(Author|Date|Merge|AuthorDate|Commit|CommitDate):")
+_ONELINE_HASH_RE = re.compile(r"^(?:\*\s+)?[0-9a-f]{7,40}\s+")
+_BULLET_RE = re.compile(r"^(?:[-*+]|\d+[.)])\s+(?:\[[ xX]\]\s+)?")
+_CONVENTIONAL_RE = re.compile(r"^(\w+)(?:\([^)]*\))?!?:\s*")
+_HEADING_RE = re.compile(r"^(#+\s|={3,}|-{3,}$)")
+
+# Primeira palavra (sem acentos, minúscula) -> categoria
+KEYWORDS = {
+    "Adicionar": ("add", "adds", "added", "adiciona", "adicionado", "adicionada", "adicionar",
+                  "novo", "nova", "new", "feat", "feature", "implementa", "implementado"),
+    "Remover": ("remove", "removes", "removed", "remover", "removido", "removida",
+                "delete", "deleted", "drop", "excluido", "excluida"),
+    "Correção Bug": ("fix", "fixes", "fixed", "corrige", "corrigido", "corrigida", "correcao",
+                     "bug", "bugfix", "hotfix", "resolve", "resolvido"),
+    "Desativar": ("disable", "disables", "disabled", "desativa", "desativado", "desativada",
+                  "desativar", "desabilitado"),
+}
+_KEYWORD_INDEX = {word: key for key, words in KEYWORDS.items() for word in words}
+
+# Palavras-chave que descrevem o item e ficam no texto; as demais repetiriam o prefixo
+# ("[ + ] Adicionado Adicionado ...") e saem
+_KEEP = {"novo", "nova", "new"}
+
+def _strip_label(texto):
+    # "Corrigido Bug da mira" -> ("Correção Bug", "da mira"): texto já começa com o rótulo do prefixo
+    plain = _plain(texto)
+    for key, prefixo in PREFIXOS.items():
+        label = _plain(prefixo.split("] ", 1)[1])
+        if plain.startswith(label + " "):
+            return key, texto[len(label) + 1:]
+    return "", texto
+
+def detect_category(texto):
+    # (chave do PREFIXOS ou "", texto sem o marcador que indicou a categoria)
+    key, resto = split_prefix(texto)
+    if key:
+        return key, resto
+
+    match = _CONVENTIONAL_RE.match(texto)
+    if match and _plain(match.group(1)) in _KEYWORD_INDEX:
+        return _KEYWORD_INDEX[_plain(match.group(1))], texto[match.end():]
+
+    key, resto = _strip_label(texto)
+    if key:
+        return key, resto
+
+    first, _, rest = texto.partition(" ")
+    word = _plain(first.rstrip(":,"))
+    key = _KEYWORD_INDEX.get(word, "")
+    if key and word not in _KEEP and rest:
+        return key, rest
+    return key, texto
+
+# ================= PARSE =================
+
+def _git_log_subjects(lines):
+    # `git log` completo: só a linha de assunto (primeira linha da mensagem) de cada commit
+    subjects = []
+    waiting = False
+    for line in lines:
+        if _GIT_COMMIT_RE.match(line):
+            waiting = True
+        elif waiting and line.strip() and not _GIT_HEADER_RE.match(line):
+            subjects.append(line.strip())
+            waiting = False
+    return subjects
+
+def parse_entries(texto, default_key="Adicionar"):
+    """
+    Retorna as entradas prontas para o changelog (com prefixo).
+    Itens aninhados viram sub-itens "• ..."; linhas sem categoria detectável usam default_key.
+    """
+    lines = texto.replace("\r\n", "\n").split("\n")
+    if any(_GIT_COMMIT_RE.match(line) for line in lines):
+        lines = _git_log_subjects(lines)
+
+    entries = []
+    for raw in lines:
+        if not raw.strip() or _HEADING_RE.match(raw.strip()):
+            continue
+        nested = raw[:1] in (" ", "\t") and bool(entries)
+        line = _ONELINE_HASH_RE.sub("", raw.strip(), count=1)
+        line = _BULLET_RE.sub("", line, count=1).strip()
+        if not line:
+            continue
+
+        if line.startswith(SUBITEM) or (nested and not split_prefix(line)[0]):
+            entries.append(f"{SUBITEM} {line.lstrip(SUBITEM).strip()}")
+            continue
+
+        key, descricao = detect_category(line)
+        descricao = descricao.strip()
+        if descricao:
+            entries.append(f"{PREFIXOS[key or default_key]} {descricao}")
+    return entries
+
+def read_import_file(path):
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        return f.read()
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importa entradas para o changelog.json")
+    parser.add_argument("arquivo", help="lista Markdown, saída do git log ou texto (uma entrada por linha)")
+    parser.add_argument("--categoria", choices=list(PREFIXOS), default="Adicionar",
+                        help="categoria das linhas sem categoria detectável")
+    parser.add_argument("--salvar", action="store_true", help="acrescenta as entradas ao changelog.json")
+    args = parser.parse_args(argv)
+
+    entries = parse_entries(read_import_file(args.arquivo), args.categoria)
+    for entry in entries:
+        print(entry)
+
+    if args.salvar:
+        dados = load_json(CHANGELOG_PATH, {"changes": []})
+        dados["changes"].extend(entries)
+        erros = validate_changelog(dados)
+        if erros:
+            print("ERRO: changelog resultante inválido:")
+            for erro in erros:
+                print(f"  {erro}")
+            return 1
+        save_json(CHANGELOG_PATH, dados)
+        print(f"{len(entries)} entradas adicionadas ao changelog.json")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Axion Update - Integridade da release
+Hash e assinatura Ed25519 do Axion.exe publicado (implementação de referência da RFC 8032, sem dependências)
+"""
+
+import os
+import sys
+import hashlib
+import argparse
+
+from axion_common import (
+    BASE_DIR, BINARY_PATH, VERSION_PATH,
+    load_json, hash_file
+)
+
+SIGN_KEY_PATH = os.path.join(BASE_DIR, "axion_sign.key")
+PUBLIC_KEY_PATH = os.path.join(BASE_DIR, "axion_sign.pub")
+
+# ================= ED25519 =================
+#
+# Só é usado no publicador (uma assinatura por release), então clareza vale mais que velocidade.
+
+_P = 2 ** 255 - 19
+_Q = 2 ** 252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+def _inv(x):
+    return pow(x, _P - 2, _P)
+
+def _add(p1, p2):
+    a = (p1[1] - p1[0]) * (p2[1] - p2[0]) % _P
+    b = (p1[1] + p1[0]) * (p2[1] + p2[0]) % _P
+    c = 2 * p1[3] * p2[3] * _D % _P
+    d = 2 * p1[2] * p2[2] % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f, g * h, f * g, e * h)
+
+def _mul(s, point):
+    result = (0, 1, 1, 0)
+    while s > 0:
+        if s & 1:
+            result = _add(result, point)
+        point = _add(point, point)
+        s >>= 1
+    return result
+
+def _equal(p1, p2):
+    return (p1[0] * p2[2] - p2[0] * p1[2]) % _P == 0 \
+        and (p1[1] * p2[2] - p2[1] * p1[2]) % _P == 0
+
+def _recover_x(y, sign):
+    if y >= _P:
+        return None
+    x2 = (y * y - 1) * _inv(_D * y * y + 1)
+    if x2 == 0:
+        return None if sign else 0
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P != 0:
+        x = x * _SQRT_M1 % _P
+    if (x * x - x2) % _P != 0:
+        return None
+    if (x & 1) != sign:
+        x = _P - x
+    return x
+
+_GY = 4 * _inv(5) % _P
+_GX = _recover_x(_GY, 0)
+_G = (_GX, _GY, 1, _GX * _GY % _P)
+
+def _compress(point):
+    zinv = _inv(point[2])
+    x = point[0] * zinv % _P
+    y = point[1] * zinv % _P
+    return int.to_bytes(y | ((x & 1) << 255), 32, "little")
+
+def _decompress(data):
+    y = int.from_bytes(data, "little")
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    x = _recover_x(y, sign)
+    if x is None:
+        return None
+    return (x, y, 1, x * y % _P)
+
+def _hash_int(data):
+    return int.from_bytes(hashlib.sha512(data).digest(), "little") % _Q
+
+def _expand(secret):
+    h = hashlib.sha512(secret).digest()
+    a = int.from_bytes(h[:32], "little")
+    a &= (1 << 254) - 8
+    a |= 1 << 254
+    return a, h[32:]
+
+def public_key(secret):
+    a, _ = _expand(secret)
+    return _compress(_mul(a, _G))
+
+def sign(secret, message):
+    a, prefix = _expand(secret)
+    pub = _compress(_mul(a, _G))
+    r = _hash_int(prefix + message)
+    r_enc = _compress(_mul(r, _G))
+    s = (r + _hash_int(r_enc + pub + message) * a) % _Q
+    return r_enc + int.to_bytes(s, 32, "little")
+
+def verify(pub, message, signature):
+    if len(pub) != 32 or len(signature) != 64:
+        return False
+    a_point = _decompress(pub)
+    r_point = _decompress(signature[:32])
+    s = int.from_bytes(signature[32:], "little")
+    if a_point is None or r_point is None or s >= _Q:
+        return False
+    h = _hash_int(signature[:32] + pub + message)
+    return _equal(_mul(s, _G), _add(r_point, _mul(h, a_point)))
+
+# ================= CHAVES =================
+
+def key_id(pub):
+    return hashlib.sha256(pub).hexdigest()[:16]
+
+def load_secret(path=SIGN_KEY_PATH):
+    # AXION_SIGN_KEY (hex) tem prioridade: usado nos jobs automáticos de release
+    value = os.environ.get("AXION_SIGN_KEY")
+    if not value and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            value = f.read()
+    if not value:
+        return None
+    secret = bytes.fromhex(value.strip())
+    if len(secret) != 32:
+        raise ValueError("Chave de assinatura inválida (esperado 32 bytes em hex)")
+    return secret
+
+def load_public(path=PUBLIC_KEY_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return bytes.fromhex(f.read().strip())
+
+def generate_keys(secret_path=SIGN_KEY_PATH, public_path=PUBLIC_KEY_PATH):
+    # A chave privada nasce 0600 (sem depender do umask) e nunca sobrescreve uma existente:
+    # FileExistsError se já houver uma
+    secret = os.urandom(32)
+    pub = public_key(secret)
+    fd = os.open(secret_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(secret.hex())
+    with open(public_path, "w", encoding="utf-8") as f:
+        f.write(pub.hex())
+    return pub
+
+# ================= RELEASE =================
+
+def release_message(release, size, sha256):
+    # Assina versão + tamanho + hash juntos: um binário não pode ser reapresentado como outra release
+    return f"axion-release\n{release}\n{size}\n{sha256}".encode("utf-8")
+
+def binary_entry(release, path, size, sha256, secret=None):
+    entry = {
+        "file": os.path.basename(path),
+        "size": size,
+        "sha256": sha256,
+    }
+    if secret is not None:
+        entry["signature"] = sign(secret, release_message(release, size, sha256)).hex()
+        entry["key_id"] = key_id(public_key(secret))
+    return entry
+
+def verify_binary(manifest, path, pub):
+    entry = manifest.get("binary") or {}
+    size, sha256 = hash_file(path)
+    if size != entry.get("size") or sha256 != entry.get("sha256"):
+        return False
+    signature = bytes.fromhex(entry.get("signature", ""))
+    return verify(pub, release_message(manifest.get("axion_release", ""), size, sha256), signature)
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assinatura das releases do Axion")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("chave", help="gera um novo par de chaves Ed25519")
+    verificar = sub.add_parser("verificar", help="confere hash e assinatura do binário publicado")
+    verificar.add_argument("--binario", default=BINARY_PATH)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "chave":
+        try:
+            pub = generate_keys()
+        except FileExistsError:
+            print(f"ERRO: {SIGN_KEY_PATH} já existe")
+            return 1
+        print(f"Chave privada: {SIGN_KEY_PATH} (NÃO versionar)")
+        print(f"Chave pública: {pub.hex()}")
+        return 0
+
+    pub = load_public()
+    if pub is None:
+        print(f"ERRO: chave pública não encontrada em {PUBLIC_KEY_PATH}")
+        return 1
+    if verify_binary(load_json(VERSION_PATH, {}), args.binario, pub):
+        print("Assinatura válida")
+        return 0
+    print("ERRO: hash ou assinatura não conferem")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
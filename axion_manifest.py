@@ -0,0 +1,166 @@
+"""
+Axion Update - Manifesto do cliente
+client.json compacto (versão, tamanho, SHA-256, assinatura e deltas) para o polling dos clientes,
+com as notas da release em changelog.json.gz, baixado só quando há atualização.
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+
+from axion_common import (
+    load_json, write_atomic, same_content, rel_path
+)
+
+CLIENT_NAME = "client.json"
+NOTES_NAME = "changelog.json.gz"
+
+BINARY_FIELDS = ("file", "size", "sha256", "signature", "key_id")
+DELTA_FIELDS = ("from", "file", "size", "sha256")
+PARSE_REPS = 200
+
+# ================= SERIALIZAÇÃO =================
+
+def dumps_compact(data):
+    # Sem indentação nem espaços: é o que os clientes baixam e fazem parse a cada poll
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_if_changed(path, payload):
+    # Mesmo contrato do save_json: não toca no arquivo quando o conteúdo é idêntico
+    if same_content(path, payload):
+        return False
+    write_atomic(path, payload)
+    return True
+
+def client_paths(version_path):
+    # client.json e changelog.json.gz ficam ao lado do version.json do canal
+    folder = os.path.dirname(version_path)
+    return os.path.join(folder, CLIENT_NAME), os.path.join(folder, NOTES_NAME)
+
+# ================= MANIFESTO =================
+
+def pack_notes(changelog):
+    # gzip com mtime=0: o mesmo changelog gera sempre os mesmos bytes (sem commit à toa)
+    return gzip.compress(dumps_compact(changelog), compresslevel=9, mtime=0)
+
+def write_notes(changelog, notes_path):
+    return write_if_changed(notes_path, pack_notes(changelog))
+
+def notes_entry(notes_path):
+    import hashlib
+    with open(notes_path, "rb") as f:
+        payload = f.read()
+    return {
+        "file": rel_path(notes_path),
+        "size": len(payload),
+        "sha256": hashlib.sha256(payload).hexdigest(),
+    }
+
+def current_deltas(manifest):
+    # Deltas que levam à release do manifesto e ao binário publicado dela; os de outra release
+    # (ou de um binário republicado na mesma versão) reconstruiriam o arquivo errado
+    release = manifest.get("axion_release", "")
+    target = (manifest.get("binary") or {}).get("sha256")
+    return [
+        delta for delta in manifest.get("deltas", [])
+        if delta.get("to") == release and (target is None or delta.get("target_sha256") == target)
+    ]
+
+def client_manifest(manifest, notes_path=None):
+    """
+    Só o que o cliente precisa para decidir e baixar: versões, binário, deltas para a release
+    atual (o alvo é sempre o binário, então "to"/"target_sha256" saem) e o ponteiro das notas.
+    """
+    client = {
+        "axion_release": manifest.get("axion_release", ""),
+        "game_version": manifest.get("game_version", ""),
+    }
+    binary = manifest.get("binary")
+    if binary:
+        client["binary"] = {key: binary[key] for key in BINARY_FIELDS if key in binary}
+    deltas = [{key: delta[key] for key in DELTA_FIELDS} for delta in current_deltas(manifest)]
+    if deltas:
+        client["deltas"] = deltas
+    if notes_path and os.path.exists(notes_path):
+        client["changelog"] = notes_entry(notes_path)
+    return client
+
+def write_client(manifest, version_path):
+    client_path, notes_path = client_paths(version_path)
+    return write_if_changed(client_path, dumps_compact(client_manifest(manifest, notes_path)))
+
+# ================= RELATÓRIO =================
+
+def parse_ms(payload, compressed=False, reps=PARSE_REPS):
+    # Melhor de N parses (com descompressão, se for o caso), em ms
+    best = float("inf")
+    for _ in range(reps):
+        start = time.perf_counter()
+        json.loads(gzip.decompress(payload) if compressed else payload)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def format_report(version_path, changelog_path):
+    """
+    [(formato, arquivo, bytes, bytes com gzip, parse ms, lido a cada poll)] do formato completo
+    (version.json + changelog.json) e do formato do cliente (client.json; changelog.json.gz
+    só quando há atualização).
+    """
+    client_path, notes_path = client_paths(version_path)
+    rows = []
+    for fmt, path, compressed, polled in (("completo", version_path, False, True),
+                                          ("completo", changelog_path, False, True),
+                                          ("cliente", client_path, False, True),
+                                          ("cliente", notes_path, True, False)):
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            payload = f.read()
+        wire = len(payload) if compressed else len(gzip.compress(payload, mtime=0))
+        rows.append((fmt, rel_path(path), len(payload), wire, parse_ms(payload, compressed), polled))
+    return rows
+
+def print_report(rows):
+    print(f"{'arquivo':<36} {'bytes':>9} {'gzip':>9} {'parse ms':>9}")
+    for _, name, size, wire, ms, _ in rows:
+        print(f"{name:<36} {size:>9,} {wire:>9,} {ms:9.3f}")
+    # Custo de um poll sem atualização em cada formato
+    for fmt in ("completo", "cliente"):
+        polled = [row for row in rows if row[0] == fmt and row[5]]
+        if polled:
+            print(f"{'poll ' + fmt:<36} {sum(r[2] for r in polled):>9,} {sum(r[3] for r in polled):>9,}"
+                  f" {sum(r[4] for r in polled):9.3f}")
+
+# ================= MAIN =================
+
+def main(argv=None):
+    from axion_channels import load_channels, channel_path
+
+    parser = argparse.ArgumentParser(description="Manifesto compacto dos clientes do Axion")
+    parser.add_argument("--canal", help="só este canal (padrão: todos)")
+    parser.add_argument("--gerar", action="store_true",
+                        help="regera client.json e changelog.json.gz a partir dos arquivos atuais")
+    args = parser.parse_args(argv)
+
+    channels = load_channels()
+    if args.canal and args.canal not in channels:
+        print(f"ERRO: canal desconhecido: {args.canal}")
+        return 1
+
+    for name, channel in channels.items():
+        if args.canal and name != args.canal:
+            continue
+        version_path = channel_path(channel, "version")
+        changelog_path = channel_path(channel, "changelog")
+        if args.gerar:
+            write_notes(load_json(changelog_path, {"changes": []}), client_paths(version_path)[1])
+            write_client(load_json(version_path, {}), version_path)
+        print(f"[{name}]")
+        print_report(format_report(version_path, changelog_path))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
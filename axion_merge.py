@@ -0,0 +1,110 @@
+"""
+Axion Update - Merge de changelogs
+Merge de três vias entre o snapshot carregado (base), as edições locais e o arquivo alterado fora do editor.
+"""
+
+from difflib import SequenceMatcher
+
+def _matcher(a, b):
+    # autojunk desligado: em listas grandes o difflib descartaria linhas repetidas ("• ...")
+    return SequenceMatcher(None, a, b, autojunk=False)
+
+def _sync_regions(base, ours, theirs):
+    # Trechos iguais nas três versões: (base início, base fim, ours início, ours fim, theirs início, theirs fim)
+    ours_blocks = _matcher(base, ours).get_matching_blocks()
+    theirs_blocks = _matcher(base, theirs).get_matching_blocks()
+    regions = []
+    i = j = 0
+    while i < len(ours_blocks) and j < len(theirs_blocks):
+        a_base, a_start, a_len = ours_blocks[i]
+        b_base, b_start, b_len = theirs_blocks[j]
+        start = max(a_base, b_base)
+        end = min(a_base + a_len, b_base + b_len)
+        if start < end:
+            a_sub = a_start + start - a_base
+            b_sub = b_start + start - b_base
+            regions.append((start, end, a_sub, a_sub + end - start, b_sub, b_sub + end - start))
+        if a_base + a_len < b_base + b_len:
+            i += 1
+        else:
+            j += 1
+    regions.append((len(base), len(base), len(ours), len(ours), len(theirs), len(theirs)))
+    return regions
+
+def _edits(base, other):
+    # (base início, base fim, trecho novo) de cada diferença entre base e other
+    return [
+        (i1, i2, other[j1:j2])
+        for tag, i1, i2, j1, j2 in _matcher(base, other).get_opcodes()
+        if tag != "equal"
+    ]
+
+def _overlaps(x, y):
+    # Mesmas linhas da base, ou inserções no mesmo ponto (ordem entre elas ambígua)
+    if x[0] < y[1] and y[0] < x[1]:
+        return True
+    return x[0] == y[0] and (x[0] == x[1] or y[0] == y[1])
+
+def _merge_chunk(base, ours, theirs):
+    """
+    Trecho alterado dos dois lados: se as alterações mexem em linhas diferentes da base
+    (ex: cada lado removeu uma linha vizinha), aplica as duas. Retorna None se elas se sobrepõem.
+    """
+    ours_edits = _edits(base, ours)
+    theirs_edits = _edits(base, theirs)
+    if any(_overlaps(x, y) for x in ours_edits for y in theirs_edits):
+        return None
+    merged = []
+    pos = 0
+    for start, end, lines in sorted(ours_edits + theirs_edits, key=lambda e: (e[0], e[1])):
+        merged.extend(base[pos:start])
+        merged.extend(lines)
+        pos = end
+    merged.extend(base[pos:])
+    return merged
+
+def merge3(base, ours, theirs):
+    """
+    Retorna (lista mesclada, conflitos). Trecho alterado só de um lado fica com a alteração;
+    alterado dos dois lados em linhas diferentes da base fica com as duas alterações; nas
+    mesmas linhas mantém as duas versões (locais primeiro, depois as linhas externas que não
+    existem nas locais) e conta como conflito.
+    """
+    merged = []
+    conflicts = 0
+    z = a = b = 0
+    for z_match, z_end, a_match, a_end, b_match, b_end in _sync_regions(base, ours, theirs):
+        base_chunk = base[z:z_match]
+        ours_chunk = ours[a:a_match]
+        theirs_chunk = theirs[b:b_match]
+        if ours_chunk == base_chunk:
+            merged.extend(theirs_chunk)
+        elif theirs_chunk == base_chunk or ours_chunk == theirs_chunk:
+            merged.extend(ours_chunk)
+        elif (clean := _merge_chunk(base_chunk, ours_chunk, theirs_chunk)) is not None:
+            merged.extend(clean)
+        else:
+            conflicts += 1
+            merged.extend(ours_chunk)
+            merged.extend(item for item in theirs_chunk if item not in ours_chunk)
+        merged.extend(base[z_match:z_end])
+        z, a, b = z_end, a_end, b_end
+    return merged, conflicts
+
+def edit_ops(old, new):
+    """
+    Operações que transformam old em new, do fim para o começo (índices continuam válidos):
+    ("replace", linha, textos) / ("delete", linha, quantidade) / ("insert", linha, textos).
+    """
+    ops = []
+    for tag, i1, i2, j1, j2 in reversed(_matcher(old, new).get_opcodes()):
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            ops.append(("replace", i1, new[j1:j2]))
+            continue
+        if i2 > i1:
+            ops.append(("delete", i1, i2 - i1))
+        if j2 > j1:
+            ops.append(("insert", i1, new[j1:j2]))
+    return ops
@@ -0,0 +1,230 @@
+"""
+Axion Update - Artefatos da release
+Hash/assinatura, índice de chunks e deltas do Axion.exe (de várias releases anteriores) gerados em
+paralelo e registrados em version.json
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor
+
+from axion_common import (
+    BASE_DIR, BINARY_PATH, VERSION_PATH, DELTAS_DIR,
+    load_json, save_json, hash_file, rel_path
+)
+from axion_delta import make_delta, register_delta, delta_name
+from axion_chunks import CHUNKS_DIR, build_index, write_index, index_entry, index_name
+from axion_integrity import load_secret, binary_entry
+
+DELTA_MEMORY = 1 << 30      # teto por worker: base + alvo mapeados, assinatura e compressor xz
+
+# ================= ESTÁGIOS =================
+
+def _timed(fn, *args):
+    # (resultado, (início, fim)) em perf_counter: o relógio monotônico é do sistema (Linux,
+    # Windows, macOS), então os instantes medidos nos workers valem também no processo pai
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (start, time.perf_counter())
+
+def _chunk_stage(binary_path, index_path):
+    index = build_index(binary_path)
+    write_index(index, index_path)
+    return index_entry(index_path, index), index["sha256"]
+
+def _address_space():
+    # Espaço de endereçamento atual do processo (Linux); herdado do pai no fork
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def _limit_memory(limit):
+    # Initializer dos workers: teto do espaço de endereçamento além do que o worker já herdou
+    # (mmaps da base e do alvo incluídos). Um delta que estoura recebe MemoryError só no seu worker.
+    # Sem o módulo resource (Windows), sem teto
+    try:
+        import resource
+    except ImportError:
+        return
+    limit += _address_space()
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def _available_memory():
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def _executor(jobs=2, memory_limit=DELTA_MEMORY):
+    # Deltas: um processo por núcleo até o número de jobs, sem passar da memória livre dividida
+    # pelo teto de cada worker. Sempre processos, mesmo com um núcleo só: o teto (RLIMIT_AS)
+    # vale para o processo inteiro e não pode cair no processo do publicador.
+    workers = min(os.cpu_count() or 1, jobs)
+    available = _available_memory()
+    if memory_limit and available:
+        workers = max(1, min(workers, available // memory_limit))
+    if not memory_limit:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_limit_memory, initargs=(memory_limit,))
+
+def _chunk_executor():
+    # Chunking é Python puro (preso à GIL): num processo próprio, sem o teto dos deltas, quando há
+    # outro núcleo; com um núcleo só, numa thread. O hash fica numa thread deste processo, já que
+    # o hashlib libera a GIL em blocos grandes.
+    if (os.cpu_count() or 1) > 1:
+        return ProcessPoolExecutor(max_workers=1)
+    return ThreadPoolExecutor(max_workers=1)
+
+def _delta_bases(base_path, from_release, bases, release):
+    # [(release anterior, Axion.exe dela)] sem repetidas nem a própria release; --base/--de vem primeiro
+    result = []
+    seen = {release}
+    for from_rel, path in [(from_release, base_path), *bases]:
+        if path and from_rel and from_rel not in seen:
+            seen.add(from_rel)
+            result.append((from_rel, path))
+    return result
+
+def _submit_deltas(workers, bases, binary_path, release):
+    os.makedirs(DELTAS_DIR, exist_ok=True)
+    futures = []
+    for from_release, base_path in bases:
+        delta_path = os.path.join(DELTAS_DIR, delta_name(from_release, release))
+        futures.append((from_release, delta_path,
+                        workers.submit(_timed, make_delta, base_path, binary_path, delta_path)))
+    return futures
+
+def _collect_deltas(manifest, futures, sha256, spans):
+    """
+    Registra no manifesto todos os deltas gerados (cada cliente escolhe o da release instalada).
+    Um delta que estourou o teto de memória, não leu a base ou perdeu o worker fica de fora:
+    os clientes daquela release baixam o binário completo.
+    """
+    for from_release, delta_path, future in futures:
+        try:
+            stats, spans[f"delta {from_release}"] = future.result()
+        except (MemoryError, OSError, BrokenExecutor) as e:
+            print(f"AVISO: delta {from_release} -> {manifest['axion_release']} não gerado"
+                  f" ({type(e).__name__}: {str(e) or 'memória insuficiente'})")
+            try:
+                os.remove(delta_path + ".tmp")
+            except OSError:
+                pass
+            continue
+        if stats["target_sha256"] != sha256:
+            raise RuntimeError("Axion.exe foi alterado durante a publicação")
+        register_delta(manifest, from_release, delta_path, sha256)
+
+def _shared_chunks(binary_path, shared):
+    # Índice de chunks já publicado para o mesmo binário (ex: beta promovida a stable, republicação).
+    # Só hasheia antes do chunking quando algum canal tem um binário do mesmo tamanho
+    size = os.path.getsize(binary_path)
+    candidates = [
+        m for m in shared
+        if m.get("chunks") and (m.get("binary") or {}).get("size") == size
+        and os.path.exists(os.path.join(BASE_DIR, m["chunks"]["file"]))
+    ]
+    if not candidates:
+        return None
+    (size, sha256), span = _timed(hash_file, binary_path)
+    for other in candidates:
+        if other["binary"]["sha256"] == sha256:
+            return size, sha256, dict(other["chunks"]), span
+    return None
+
+def _register_binary(manifest, release, binary_path, size, sha256, secret, spans):
+    # A assinatura cobre a versão: canais que compartilham o binário assinam cada um a sua
+    manifest["binary"], spans["sign"] = _timed(binary_entry, release, binary_path, size, sha256, secret)
+    # Relativo ao repositório, como chunks/deltas (binários de outros canais ficam em channels/<nome>/)
+    path = rel_path(binary_path)
+    if not path.startswith("../"):
+        manifest["binary"]["file"] = path
+
+def generate_artifacts(manifest, binary_path=BINARY_PATH, base_path=None, from_release=None, secret=None,
+                       shared=(), bases=(), memory_limit=DELTA_MEMORY, spans=None):
+    """
+    Gera os artefatos da release atual (manifest["axion_release"]) e atualiza o manifesto.
+    shared: manifestos já publicados (outros canais, release anterior); um binário idêntico
+    reaproveita o índice de chunks deles.
+    bases: [(release anterior, Axion.exe dela)] além de base_path/from_release; um delta de cada
+    para a release atual, em paralelo (memory_limit: teto em bytes de cada worker de delta).
+    spans: dict preenchido com (início, fim) em perf_counter de cada estágio (trace).
+    Retorna os tempos de cada estágio em segundos.
+    """
+    release = manifest["axion_release"]
+    bases = _delta_bases(base_path, from_release, bases, release)
+    spans = {} if spans is None else spans
+    start = time.perf_counter()
+
+    reused = _shared_chunks(binary_path, shared)
+    if reused:
+        size, sha256, chunks, spans["hash"] = reused
+        if bases:
+            with _executor(len(bases), memory_limit) as workers:
+                futures = _submit_deltas(workers, bases, binary_path, release)
+                _collect_deltas(manifest, futures, sha256, spans)
+    else:
+        os.makedirs(CHUNKS_DIR, exist_ok=True)
+        index_path = os.path.join(CHUNKS_DIR, index_name(release))
+        with _chunk_executor() as chunker, ThreadPoolExecutor(max_workers=1) as hasher:
+            chunk_future = chunker.submit(_timed, _chunk_stage, binary_path, index_path)
+            hash_future = hasher.submit(_timed, hash_file, binary_path)
+            workers = _executor(len(bases), memory_limit) if bases else None
+            try:
+                futures = _submit_deltas(workers, bases, binary_path, release) if bases else []
+                (size, sha256), spans["hash"] = hash_future.result()
+                (chunks, chunk_sha256), spans["chunks"] = chunk_future.result()
+                if chunk_sha256 != sha256:
+                    raise RuntimeError("Axion.exe foi alterado durante a publicação")
+                _collect_deltas(manifest, futures, sha256, spans)
+            finally:
+                if workers:
+                    workers.shutdown()
+
+    _register_binary(manifest, release, binary_path, size, sha256, secret, spans)
+    manifest["chunks"] = chunks
+
+    spans["total"] = (start, time.perf_counter())
+    return {stage: end - begin for stage, (begin, end) in spans.items()}
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os artefatos da release do Axion")
+    parser.add_argument("--binario", default=BINARY_PATH)
+    parser.add_argument("--base", help="Axion.exe da release anterior (gera delta)")
+    parser.add_argument("--de", help="versão da release anterior")
+    parser.add_argument("--sem-assinatura", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.base and not args.de:
+        print("ERRO: --base exige --de <versão anterior>")
+        return 1
+
+    manifest = load_json(VERSION_PATH, {"game_version": "", "axion_release": ""})
+    if not manifest.get("axion_release"):
+        print("ERRO: axion_release vazio em version.json")
+        return 1
+
+    secret = None if args.sem_assinatura else load_secret()
+    if secret is None and not args.sem_assinatura:
+        print("AVISO: chave de assinatura não encontrada - binário publicado sem assinatura")
+
+    timings = generate_artifacts(manifest, args.binario, args.base, args.de, secret)
+    save_json(VERSION_PATH, manifest)
+
+    binary = manifest["binary"]
+    print(f"Axion.exe {manifest['axion_release']}: {binary['size']:,} bytes, sha256 {binary['sha256']}")
+    for stage, seconds in timings.items():
+        print(f"  {stage:<14} {seconds * 1000:9.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
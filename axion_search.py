@@ -0,0 +1,138 @@
+"""
+Axion Update - Busca no changelog
+Índice invertido incremental (token -> entradas) com busca por prefixo e filtro por categoria do PREFIXOS.
+Usado pelo editor sobre dados_changelog["changes"] e sobre o histórico de releases (sem PyQt5).
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+from axion_common import split_prefix
+
+_TOKEN_RE = re.compile(r"\w+")
+_COMBINING_RE = re.compile("[\u0300-\u036f]")
+
+# ================= TOKENS =================
+
+def normalize(texto):
+    # Minúsculas e sem acentos: "correção" casa com "correcao"
+    texto = texto.lower()
+    if texto.isascii():
+        return texto
+    return _COMBINING_RE.sub("", unicodedata.normalize("NFKD", texto))
+
+def tokenize(texto):
+    return set(_TOKEN_RE.findall(normalize(texto)))
+
+# ================= ÍNDICE =================
+
+class ChangelogIndex:
+    """
+    Entradas identificadas por ids estáveis (não pela linha: mover itens não mexe no índice).
+    add / remove / update alteram só os tokens da entrada afetada.
+    """
+
+    def __init__(self):
+        self.postings = {}      # token -> {ids}
+        self.tokens = []        # tokens distintos em ordem (faixa de prefixo via bisect)
+        self.doc_tokens = {}    # id -> tokens da entrada
+        self.categories = {}    # chave do PREFIXOS ("" = sem prefixo) -> {ids}
+        self.doc_category = {}
+
+    def __len__(self):
+        return len(self.doc_tokens)
+
+    def add(self, doc_id, texto, _sorted=True):
+        tokens = tokenize(texto)
+        self.doc_tokens[doc_id] = tokens
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                if _sorted:
+                    insort(self.tokens, token)
+            ids.add(doc_id)
+
+        category = split_prefix(texto)[0]
+        self.doc_category[doc_id] = category
+        self.categories.setdefault(category, set()).add(doc_id)
+
+    def remove(self, doc_id):
+        for token in self.doc_tokens.pop(doc_id, ()):
+            ids = self.postings[token]
+            ids.discard(doc_id)
+            if not ids:
+                del self.postings[token]
+                del self.tokens[bisect_left(self.tokens, token)]
+        category = self.doc_category.pop(doc_id, None)
+        if category is not None:
+            self.categories[category].discard(doc_id)
+
+    def update(self, doc_id, texto):
+        self.remove(doc_id)
+        self.add(doc_id, texto)
+
+    def _prefix_ids(self, prefix):
+        # União das entradas de todos os tokens que começam com o prefixo
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\uffff", start)
+        if end - start == 1:
+            return self.postings[self.tokens[start]]
+        postings = self.postings
+        return set().union(*[postings[token] for token in self.tokens[start:end]])
+
+    def search(self, query, category=None):
+        """
+        Ids das entradas que contêm todos os termos da consulta (cada termo casa por prefixo)
+        e, se informada, pertencem à categoria. Consulta vazia sem categoria retorna None (sem filtro).
+        """
+        terms = sorted(tokenize(query), key=len, reverse=True)
+        if not terms and category is None:
+            return None
+
+        result = None
+        if category is not None:
+            result = self.categories.get(category, set())
+        # Termos mais longos primeiro: faixas menores, interseção encolhe mais cedo
+        for term in terms:
+            ids = self._prefix_ids(term)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return set(result) if result is not None else set(self.doc_tokens)
+
+    def matches(self, doc_id, query, category=None):
+        # Mesmo critério do search() para uma entrada só: atualiza um filtro ativo quando ela muda
+        if category is not None and self.doc_category.get(doc_id) != category:
+            return False
+        tokens = self.doc_tokens.get(doc_id, ())
+        return all(any(token.startswith(term) for token in tokens) for term in tokenize(query))
+
+def build_index(texts, ids=None):
+    # Índice novo (ids = posição em texts quando não informados); tokens ordenados uma vez no fim
+    index = ChangelogIndex()
+    pairs = zip(ids, texts) if ids is not None else enumerate(texts)
+    for doc_id, texto in pairs:
+        index.add(doc_id, texto, _sorted=False)
+    index.tokens = sorted(index.postings)
+    return index
+
+# ================= HISTÓRICO =================
+
+class ArchiveSearch:
+    # Busca nas notas das releases arquivadas (somente leitura: o índice é montado uma vez)
+    def __init__(self, records):
+        self.entries = [
+            (record["release"], texto)
+            for record in reversed(records)
+            for texto in record["changes"]
+        ]
+        self.index = build_index(texto for _, texto in self.entries)
+
+    def search(self, query, category=None):
+        # [(release, texto)], releases mais recentes primeiro
+        ids = self.index.search(query, category)
+        if ids is None:
+            return []
+        return [self.entries[i] for i in sorted(ids)]
@@ -0,0 +1,346 @@
+"""
+Axion Update - Servidor local de atualização
+Stand-in do GitHub para testar o cliente offline: serve version.json, changelog.json e o Axion.exe
+de uma pasta com Range, ETag forte, If-None-Match (304) e gzip/zstd nos JSON.
+"""
+
+import os
+import sys
+import gzip
+import time
+import hashlib
+import argparse
+import threading
+import http.client
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, unquote
+
+from axion_common import BASE_DIR
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE = (".json", ".jsonl")
+IO_CHUNK = 1 << 20
+
+# Só o que a publicação envia: manifestos, notas, binários e as pastas de artefatos, na raiz
+# ou em channels/<canal>/. O resto da pasta (.git, axion_sign.key, scripts) dá 404
+PUBLIC_FILES = {"version.json", "client.json", "channels.json", "changelog.json", "changelog.json.gz"}
+PUBLIC_DIRS = {"chunks", "deltas", "changelog_archive"}
+BINARY_EXT = ".exe"
+
+# ================= CACHE DE REPRESENTAÇÕES =================
+
+class FileCache:
+    """
+    ETag e variantes comprimidas por arquivo, recalculadas só quando (mtime, tamanho) mudam:
+    um poll de version.json não re-hasheia nem re-comprime nada.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, path):
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry["stamp"] == stamp:
+                return entry
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for buf in iter(lambda: f.read(IO_CHUNK), b""):
+                h.update(buf)
+        entry = {
+            "stamp": stamp,
+            "size": st.st_size,
+            "etag": h.hexdigest()[:32],
+            "last_modified": formatdate(st.st_mtime, usegmt=True),
+            "encoded": {},
+        }
+        with self.lock:
+            self.entries[path] = entry
+        return entry
+
+    def encoded(self, path, entry, encoding):
+        body = entry["encoded"].get(encoding)
+        if body is None:
+            with open(path, "rb") as f:
+                raw = f.read()
+            if encoding == "zstd":
+                body = zstandard.ZstdCompressor(level=19).compress(raw)
+            else:
+                body = gzip.compress(raw, compresslevel=9, mtime=0)
+            entry["encoded"][encoding] = body
+        return body
+
+# ================= HTTP =================
+
+def is_public(rel_path, extra=()):
+    # rel_path relativo à raiz servida, com "/"
+    parts = rel_path.split("/")
+    if any(not part or part.startswith(".") for part in parts) or parts[-1].endswith(".key"):
+        return False
+    if rel_path in extra:
+        return True
+    if len(parts) >= 3 and parts[0] == "channels":
+        parts = parts[2:]
+    if len(parts) == 1:
+        return parts[0] in PUBLIC_FILES or parts[0].endswith(BINARY_EXT)
+    return parts[0] in PUBLIC_DIRS
+
+def _accepted_encodings(header):
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
+
+def _etag_matches(header, etag):
+    # If-None-Match usa comparação fraca (RFC 9110 13.1.2)
+    if header.strip() == "*":
+        return True
+    tags = [t.strip() for t in header.split(",")]
+    return any(t.removeprefix("W/") == etag for t in tags)
+
+def _parse_range(header, size):
+    """
+    Retorna (início, fim inclusivo), None para ignorar o Range (servir 200 completo)
+    ou "unsatisfiable". Só faixas únicas: múltiplas faixas recebem o arquivo inteiro.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                return "unsatisfiable"
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return "unsatisfiable"
+    return start, min(end, size - 1)
+
+class UpdateRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive: o cliente reaproveita as conexões
+    server_version = "AxionUpdate/1.0"
+    disable_nagle_algorithm = True  # cabeçalho e corpo saem em writes separados; sem isso o poll espera o ACK atrasado
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def resolve(self):
+        root = self.server.root
+        path = os.path.realpath(os.path.join(root, unquote(urlsplit(self.path).path).lstrip("/")))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            return None
+        if not is_public(os.path.relpath(path, root).replace(os.sep, "/"), self.server.extra):
+            return None
+        return path
+
+    def finish_headers(self, status, entry, etag, length, extra=()):
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", entry["last_modified"])
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Accept-Ranges", "bytes")
+        for name, value in extra:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+        self.server.count(status, 0)
+
+    def serve(self, send_body):
+        path = self.resolve()
+        if path is None:
+            self.send_error(404)
+            return
+
+        entry = self.server.cache.get(path)
+        size = entry["size"]
+        compressible = path.endswith(COMPRESSIBLE)
+
+        encoding = None
+        range_header = self.headers.get("Range")
+        if compressible and not range_header:
+            accepted = _accepted_encodings(self.headers.get("Accept-Encoding"))
+            if zstandard is not None and "zstd" in accepted:
+                encoding = "zstd"
+            elif "gzip" in accepted:
+                encoding = "gzip"
+
+        # ETag forte por representação (identity / gzip / zstd)
+        etag = f'"{entry["etag"]}-{encoding}"' if encoding else f'"{entry["etag"]}"'
+        vary = [("Vary", "Accept-Encoding")] if compressible else []
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            self.finish_headers(304, entry, etag, 0, vary)
+            return
+
+        if encoding:
+            body = self.server.cache.encoded(path, entry, encoding)
+            self.finish_headers(200, entry, etag, len(body), vary + [
+                ("Content-Type", "application/json"), ("Content-Encoding", encoding)
+            ])
+            if send_body:
+                self.wfile.write(body)
+                self.server.count(None, len(body))
+            return
+
+        content_type = "application/json" if compressible else "application/octet-stream"
+        start, end = 0, size - 1
+        status = 200
+        extra = vary + [("Content-Type", content_type)]
+
+        if range_header:
+            if_range = self.headers.get("If-Range")
+            parsed = _parse_range(range_header, size) if not if_range or if_range == etag else None
+            if parsed == "unsatisfiable":
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self.server.count(416, 0)
+                return
+            if parsed:
+                start, end = parsed
+                status = 206
+                extra.append(("Content-Range", f"bytes {start}-{end}/{size}"))
+
+        length = end - start + 1 if size else 0
+        self.finish_headers(status, entry, etag, length, extra)
+        if send_body and length:
+            self.send_file_range(path, start, length)
+
+    def send_file_range(self, path, start, length):
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = length
+            while remaining:
+                buf = f.read(min(IO_CHUNK, remaining))
+                if not buf:
+                    break
+                self.wfile.write(buf)
+                remaining -= len(buf)
+        self.server.count(None, length - remaining)
+
+class UpdateServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, root, verbose=False, extra=()):
+        super().__init__(address, UpdateRequestHandler)
+        self.root = os.path.realpath(root)
+        self.extra = frozenset(extra)     # arquivos servidos além dos publicados (benchmarks)
+        self.verbose = verbose
+        self.cache = FileCache()
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "bytes": 0, "status": {}}
+
+    def count(self, status, body_bytes):
+        with self.stats_lock:
+            if status is not None:
+                self.stats["requests"] += 1
+                self.stats["status"][status] = self.stats["status"].get(status, 0) + 1
+            self.stats["bytes"] += body_bytes
+
+def serve_in_background(root=BASE_DIR, host="127.0.0.1", port=0, extra=()):
+    # Para testes/benchmarks: porta 0 escolhe uma porta livre (server.server_address)
+    server = UpdateServer((host, port), root, extra=extra)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+# ================= BENCHMARK DE POLLING =================
+
+def poll_benchmark(url, polls=200):
+    """
+    Compara polls completos com polls condicionais (If-None-Match) numa conexão keep-alive.
+    Retorna {modo: (ms por poll, bytes de corpo por poll)}.
+    """
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port)
+    path = parts.path or "/"
+    results = {}
+    try:
+        for mode in ("completo", "gzip", "condicional"):
+            etag = None
+            total_bytes = 0
+            start = time.perf_counter()
+            for _ in range(polls):
+                headers = {}
+                if mode == "gzip":
+                    headers["Accept-Encoding"] = "gzip"
+                if mode == "condicional" and etag:
+                    headers["If-None-Match"] = etag
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                etag = response.getheader("ETag")
+                total_bytes += len(body)
+            elapsed = time.perf_counter() - start
+            results[mode] = (elapsed / polls * 1000, total_bytes / polls)
+    finally:
+        conn.close()
+    return results
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor local de atualização do Axion")
+    sub = parser.add_subparsers(dest="cmd")
+
+    servir = sub.add_parser("servir", help="serve a pasta (padrão)")
+    servir.add_argument("--dir", default=BASE_DIR)
+    servir.add_argument("--porta", type=int, default=8765)
+
+    poll = sub.add_parser("poll", help="mede o custo de polling de um arquivo")
+    poll.add_argument("--url", help="padrão: servidor local temporário com version.json")
+    poll.add_argument("--n", type=int, default=200)
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "poll":
+        server = None
+        url = args.url
+        if not url:
+            server = serve_in_background()
+            url = f"http://127.0.0.1:{server.server_address[1]}/version.json"
+        for mode, (ms, body) in poll_benchmark(url, args.n).items():
+            print(f"{mode:<12} {ms:7.3f} ms/poll  {body:9.1f} bytes/poll")
+        if server:
+            server.shutdown()
+        return 0
+
+    root = getattr(args, "dir", BASE_DIR)
+    port = getattr(args, "porta", 8765)
+    server = UpdateServer(("127.0.0.1", port), root, verbose=True)
+    print(f"Servindo {root} em http://127.0.0.1:{port}/ (zstd: {'sim' if zstandard else 'não'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Axion Update - Store de artefatos
+Cópia local, endereçada por SHA-256, dos binários e índices de chunks das releases recentes
+(.axion_store/, fora do git). Deltas contra releases anteriores leem daqui em vez do histórico do LFS.
+Retenção LRU por tamanho total e por quantidade; as releases atuais dos canais nunca saem.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+
+from axion_common import (
+    BASE_DIR, load_json, save_json, hash_file, version_key
+)
+
+STORE_DIR = os.environ.get("AXION_STORE") or os.path.join(BASE_DIR, ".axion_store")
+MAX_BYTES = 4 << 30
+MAX_RELEASES = 10
+
+FICLONE = 0x40049409    # ioctl do Linux para reflink (btrfs, xfs, ...)
+
+# ================= CÓPIA =================
+
+def _reflink(src, dst):
+    # Cópia copy-on-write: instantânea e sem espaço extra até um dos lados mudar
+    import fcntl
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+def clone_file(src, dst, hardlink=False):
+    """
+    Reflink quando o sistema de arquivos suporta; senão hardlink (só se permitido: os dois
+    nomes passam a ser o mesmo arquivo) e, por fim, cópia. Retorna o método usado.
+    """
+    try:
+        _reflink(src, dst)
+        return "reflink"
+    except (ImportError, OSError):
+        _remove(dst)
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    return "copia"
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ================= STORE =================
+
+class ArtifactStore:
+    """
+    objects/<sha[:2]>/<sha>   conteúdo (somente leitura)
+    store.json                {sha: {kind, size, last_used, releases: [[canal, release], ...]}}
+    """
+
+    def __init__(self, root=STORE_DIR, max_bytes=MAX_BYTES, max_releases=MAX_RELEASES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_releases = max_releases
+        self.index_path = os.path.join(root, "store.json")
+        self.objects = load_json(self.index_path, {}).get("objects", {})
+
+    def object_path(self, sha256):
+        return os.path.join(self.root, "objects", sha256[:2], sha256)
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        save_json(self.index_path, {"objects": self.objects}, fsync=False)
+
+    def put(self, path, sha256=None, kind="binary", channel=None, release=None):
+        """
+        Guarda o arquivo (se o conteúdo ainda não estiver no store) e associa a release.
+        O objeto nunca é um hardlink do arquivo de origem: o build pode regravar o Axion.exe
+        no mesmo inode. Retorna o caminho do objeto.
+        """
+        if sha256 is None:
+            sha256 = hash_file(path)[1]
+        obj = self.object_path(sha256)
+        entry = self.objects.get(sha256)
+
+        if entry is None or not os.path.exists(obj):
+            os.makedirs(os.path.dirname(obj), exist_ok=True)
+            tmp = f"{obj}.{os.getpid()}.tmp"
+            try:
+                method = clone_file(path, tmp)
+                # Conteúdo conferido antes de entrar: a origem pode ter mudado desde o hash
+                size, actual = hash_file(tmp)
+                if actual != sha256:
+                    raise ValueError(f"{os.path.basename(path)} mudou antes de entrar no store")
+                os.chmod(tmp, 0o444)
+                os.replace(tmp, obj)
+            except BaseException:
+                _remove(tmp)
+                raise
+            releases = entry["releases"] if entry else []
+            entry = self.objects[sha256] = {"kind": kind, "size": size, "method": method, "releases": releases}
+
+        if release and [channel, release] not in entry["releases"]:
+            entry["releases"].append([channel, release])
+        entry["last_used"] = time.time()
+        return obj
+
+    def get(self, sha256):
+        # Caminho do objeto (e marca como usado), ou None
+        entry = self.objects.get(sha256)
+        obj = self.object_path(sha256)
+        if entry is None or not os.path.exists(obj):
+            return None
+        entry["last_used"] = time.time()
+        return obj
+
+    def find_release(self, release, channel=None, kind="binary"):
+        for sha256, entry in self.objects.items():
+            if entry["kind"] != kind:
+                continue
+            for ch, rel in entry["releases"]:
+                if rel == release and (channel is None or ch == channel):
+                    obj = self.get(sha256)
+                    if obj:
+                        return obj
+        return None
+
+    def recent_releases(self, channel=None, limit=MAX_RELEASES, exclude=()):
+        # [(release, sha256, caminho)] dos binários do canal, releases mais novas primeiro
+        found = {}
+        for sha256, entry in self.objects.items():
+            if entry["kind"] != "binary" or not os.path.exists(self.object_path(sha256)):
+                continue
+            for ch, rel in entry["releases"]:
+                if (channel is None or ch == channel) and rel not in exclude:
+                    found[rel] = sha256
+        releases = sorted(found, key=version_key, reverse=True)[:limit]
+        return [(rel, found[rel], self.get(found[rel])) for rel in releases]
+
+    def export(self, sha256, out_path, writable=False):
+        """
+        Materializa o objeto em out_path. Leitura (ex: base de delta): hardlink, sem cópia.
+        writable=True (rollback): reflink ou cópia, para que escrever no arquivo não altere o store.
+        """
+        obj = self.get(sha256)
+        if obj is None:
+            raise KeyError(sha256)
+        tmp = out_path + ".tmp"
+        _remove(tmp)
+        clone_file(obj, tmp, hardlink=not writable)
+        if writable:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, out_path)
+        return out_path
+
+    def evict(self, pinned=()):
+        """
+        Remove os objetos usados há mais tempo até caber em max_bytes e max_releases binários;
+        índices de chunks saem junto com o último binário das suas releases.
+        pinned: SHA-256 que ficam (releases atuais dos canais). Retorna os SHA-256 removidos.
+        """
+        total = sum(entry["size"] for entry in self.objects.values())
+        binaries = sum(1 for entry in self.objects.values() if entry["kind"] == "binary")
+        removed = []
+        for sha256 in sorted(self.objects, key=lambda s: self.objects[s].get("last_used", 0)):
+            over_bytes = total > self.max_bytes
+            if not over_bytes and binaries <= self.max_releases:
+                break
+            entry = self.objects[sha256]
+            # Só a quantidade estourou: apagar um índice de chunks não ajuda
+            if sha256 in pinned or (not over_bytes and entry["kind"] != "binary"):
+                continue
+            self._drop(sha256)
+            total -= entry["size"]
+            binaries -= entry["kind"] == "binary"
+            removed.append(sha256)
+
+        kept = {tuple(ref) for entry in self.objects.values() if entry["kind"] == "binary"
+                for ref in entry["releases"]}
+        for sha256, entry in list(self.objects.items()):
+            if entry["kind"] != "binary" and sha256 not in pinned and not kept & set(map(tuple, entry["releases"])):
+                self._drop(sha256)
+                removed.append(sha256)
+        return removed
+
+    def _drop(self, sha256):
+        self.objects.pop(sha256)
+        obj = self.object_path(sha256)
+        if os.path.exists(obj):
+            os.chmod(obj, 0o644)
+            _remove(obj)
+
+    def stats(self):
+        total = sum(entry["size"] for entry in self.objects.values())
+        return {"objects": len(self.objects), "bytes": total}
+
+def pinned_hashes(manifests):
+    # Binários e índices das releases atuais: nunca saem do store
+    pinned = set()
+    for manifest in manifests:
+        for key in ("binary", "chunks"):
+            entry = manifest.get(key)
+            if entry and entry.get("sha256"):
+                pinned.add(entry["sha256"])
+    return pinned
+
+def store_release(store, manifest, channel, binary_path):
+    # Guarda binário e índice de chunks da release publicada (chamado pelo publicador)
+    release = manifest["axion_release"]
+    binary = manifest.get("binary")
+    if binary:
+        store.put(binary_path, binary["sha256"], "binary", channel, release)
+    chunks = manifest.get("chunks")
+    if chunks:
+        store.put(os.path.join(BASE_DIR, chunks["file"]), None, "chunks", channel, release)
+
+# ================= MAIN =================
+
+def main(argv=None):
+    from axion_channels import load_channels, load_manifests, channel_path
+
+    parser = argparse.ArgumentParser(description="Store local de artefatos do Axion")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("listar", help="releases guardadas no store")
+
+    importar = sub.add_parser("importar", help="guarda a release atual de cada canal")
+
+    restaurar = sub.add_parser("restaurar", help="copia o binário de uma release (rollback)")
+    restaurar.add_argument("release")
+    restaurar.add_argument("--canal")
+    restaurar.add_argument("--saida", required=True)
+
+    limpar = sub.add_parser("limpar", help="aplica a retenção LRU")
+    for p in (importar, limpar):
+        p.add_argument("--max-gb", type=float, default=MAX_BYTES / (1 << 30))
+        p.add_argument("--max-releases", type=int, default=MAX_RELEASES)
+    args = parser.parse_args(argv)
+
+    max_bytes = int(getattr(args, "max_gb", MAX_BYTES / (1 << 30)) * (1 << 30))
+    store = ArtifactStore(max_bytes=max_bytes, max_releases=getattr(args, "max_releases", MAX_RELEASES))
+    channels = load_channels()
+    manifests = load_manifests(channels)
+
+    if args.cmd == "listar":
+        for sha256, entry in sorted(store.objects.items(), key=lambda kv: -kv[1].get("last_used", 0)):
+            releases = ", ".join(f"{ch}:{rel}" for ch, rel in entry["releases"]) or "-"
+            print(f"{sha256[:12]}  {entry['kind']:<7} {entry['size']:>13,}  {entry['method']:<8} {releases}")
+        stats = store.stats()
+        print(f"{stats['objects']} objetos, {stats['bytes'] / (1 << 20):.1f} MiB em {store.root}")
+        return 0
+
+    if args.cmd == "restaurar":
+        obj = store.find_release(args.release, args.canal)
+        if obj is None:
+            print(f"ERRO: release {args.release} não está no store")
+            return 1
+        store.export(os.path.basename(obj), args.saida, writable=True)
+        store.save()
+        print(f"{args.release} restaurada em {args.saida}")
+        return 0
+
+    if args.cmd == "importar":
+        for name, manifest in manifests.items():
+            binary_path = channel_path(channels[name], "binary")
+            binary = manifest.get("binary")
+            if binary and os.path.exists(binary_path) and hash_file(binary_path)[1] == binary["sha256"]:
+                store_release(store, manifest, name, binary_path)
+                print(f"{name}: {manifest['axion_release']} guardada")
+
+    for sha256 in store.evict(pinned_hashes(manifests.values())):
+        print(f"removido {sha256[:12]}")
+    store.save()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Axion Update - Instrumentação
+Tempos e contadores das ações do editor e das etapas da publicação (opt-in: AXION_TRACE=<arquivo>
+ou --trace=<arquivo>). Grava um trace-event JSON (chrome://tracing, Perfetto) e, ao lado, os
+histogramas de latência por operação. Desligada, não envolve nenhuma função.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import atexit
+import threading
+import functools
+
+MAX_EVENTS = 200_000     # eventos no trace; os histogramas continuam contando depois disso
+
+# ================= HISTOGRAMA =================
+
+def bucket_bound(us):
+    # Limite superior do bucket em µs: cada potência de 2 dividida em 4 faixas iguais
+    # (erro máximo de ~25%, memória constante por operação)
+    n = max(1, math.ceil(us))
+    if n <= 8:
+        return n
+    step = 1 << ((n - 1).bit_length() - 3)
+    return -(-n // step) * step
+
+class Histogram:
+    def __init__(self):
+        self.count = 0
+        self.total_us = 0.0
+        self.min_us = float("inf")
+        self.max_us = 0.0
+        self.buckets = {}   # limite superior em µs -> contagem
+
+    def add(self, us):
+        self.count += 1
+        self.total_us += us
+        self.min_us = min(self.min_us, us)
+        self.max_us = max(self.max_us, us)
+        bound = bucket_bound(us)
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+
+    def percentile(self, p):
+        # Limite superior do bucket que contém o percentil (estimativa conservadora)
+        target = self.count * p / 100
+        seen = 0
+        for bound in sorted(self.buckets):
+            seen += self.buckets[bound]
+            if seen >= target:
+                return min(bound, self.max_us)
+        return self.max_us
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_us / self.count / 1000, 4) if self.count else 0,
+            "min_ms": round(self.min_us / 1000, 4) if self.count else 0,
+            "max_ms": round(self.max_us / 1000, 4),
+            "p50_ms": round(self.percentile(50) / 1000, 4),
+            "p90_ms": round(self.percentile(90) / 1000, 4),
+            "p99_ms": round(self.percentile(99) / 1000, 4),
+            "buckets_us": {f"<={bound}": n for bound, n in sorted(self.buckets.items())},
+        }
+
+# ================= TRACER =================
+
+class Tracer:
+    def __init__(self, path):
+        self.path = path
+        self.pid = os.getpid()
+        self.t0 = time.perf_counter()
+        self.events = []
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.saved = False
+
+    def _ts(self, t):
+        return round((t - self.t0) * 1e6, 3)
+
+    def record(self, name, start, end=None, cat="editor"):
+        # Evento completo ("X") + amostra no histograma da operação
+        end = time.perf_counter() if end is None else end
+        us = (end - start) * 1e6
+        with self.lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.add(us)
+            if len(self.events) < MAX_EVENTS:
+                self.events.append({
+                    "name": name, "cat": cat, "ph": "X", "ts": self._ts(start), "dur": round(us, 3),
+                    "pid": self.pid, "tid": threading.get_ident(),
+                })
+
+    def count(self, name, n=1):
+        with self.lock:
+            value = self.counters[name] = self.counters.get(name, 0) + n
+            if len(self.events) < MAX_EVENTS:
+                self.events.append({
+                    "name": name, "ph": "C", "ts": self._ts(time.perf_counter()),
+                    "pid": self.pid, "args": {"value": value},
+                })
+
+    def span(self, name, cat="editor"):
+        return _Span(self, name, cat)
+
+    def wrap(self, fn, name, cat="editor"):
+        # Sinais do Qt passam argumentos extras (ex: clicked -> checked) que o método não aceita:
+        # o wrapper repassa só os posicionais que a função original declara
+        code = getattr(fn, "__code__", None)
+        limit = None
+        if code is not None and not code.co_flags & 0x04:   # sem *args
+            limit = code.co_argcount
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*(args if limit is None else args[:limit]), **kwargs)
+            finally:
+                self.record(name, start, cat=cat)
+        return wrapper
+
+    def summary(self):
+        return {name: hist.to_dict() for name, hist in sorted(self.histograms.items())}
+
+    def save(self):
+        with self.lock:
+            events = list(self.events)
+            data = {
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+            }
+            histograms = {"histograms": self.summary(), "counters": dict(self.counters)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        with open(histogram_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(histograms, f, ensure_ascii=False, indent=2)
+        self.saved = True
+
+    def report(self, file=sys.stderr):
+        print(f"[trace] {'operação':<28} {'n':>6} {'p50 ms':>9} {'p90 ms':>9} {'máx ms':>9}", file=file)
+        for name, stats in self.summary().items():
+            print(f"[trace] {name:<28} {stats['count']:>6} {stats['p50_ms']:9.3f} {stats['p90_ms']:9.3f}"
+                  f" {stats['max_ms']:9.3f}", file=file)
+        for name, value in sorted(self.counters.items()):
+            print(f"[trace] {name:<28} {value:>6}", file=file)
+        print(f"[trace] gravado em {self.path} (histogramas em {histogram_path(self.path)})",
+              file=file, flush=True)
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "start")
+
+    def __init__(self, tracer, name, cat):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, cat=self.cat)
+        return False
+
+def histogram_path(trace_path):
+    root, ext = os.path.splitext(trace_path)
+    return f"{root}.hist{ext or '.json'}"
+
+# ================= ATIVAÇÃO =================
+
+def trace_target(argv=None):
+    # --trace=<arquivo> na linha de comando ou AXION_TRACE=<arquivo> no ambiente
+    for arg in sys.argv if argv is None else argv:
+        if arg.startswith("--trace="):
+            return arg.split("=", 1)[1]
+    return os.environ.get("AXION_TRACE") or None
+
+def from_env(path=None):
+    # Tracer gravado na saída do processo, ou None (instrumentação desligada)
+    path = path or trace_target()
+    if not path:
+        return None
+    tracer = Tracer(os.path.abspath(path))
+
+    def finish():
+        if tracer.histograms and not tracer.saved:
+            tracer.save()
+            tracer.report()
+    atexit.register(finish)
+    return tracer
+
+def instrument(cls, names, tracer, cat="editor"):
+    # Envolve os métodos da classe; sem tracer a classe fica intacta (custo zero)
+    if tracer is None:
+        return cls
+    for name in names:
+        setattr(cls, name, tracer.wrap(getattr(cls, name), name, cat))
+    return cls
@@ -0,0 +1,151 @@
+"""
+Axion Update - Validação
+Regras do changelog.json e do version.json usadas pelo editor (a cada gravação) e pelo publicador:
+uma passada linear pelas entradas, com conjuntos para achar duplicadas.
+"""
+
+import sys
+import argparse
+
+from axion_common import (
+    PREFIXOS, SUBITEM, VERSION_RE, CHANGELOG_PATH, VERSION_PATH,
+    load_json, version_key
+)
+
+_PREFIXES = tuple(PREFIXOS.values())
+
+def _head_length(prefixes):
+    # Menor comprimento em que os prefixos já são todos distintos ("[ + ] " / "[ - ] " ...)
+    for n in range(1, max(map(len, prefixes)) + 1):
+        if len({p[:n] for p in prefixes}) == len(prefixes):
+            return n
+    return max(map(len, prefixes))
+
+# Caminho rápido da varredura: começo da entrada -> (único prefixo possível, tamanho), um lookup
+# em vez de um startswith por prefixo
+_HEAD = _head_length(_PREFIXES)
+_BY_HEAD = {p[:_HEAD]: (p, len(p)) for p in _PREFIXES}
+_SUB_LEN = len(SUBITEM)
+
+VERSION_FIELDS = ("game_version", "axion_release")
+
+# ================= CHANGELOG =================
+
+def _prefix_of(item):
+    for prefixo in _PREFIXES:
+        if item.startswith(prefixo):
+            return prefixo
+    return None
+
+def validate_entry(texto, linha=None):
+    # Erro de uma entrada isolada (editar / adicionar no editor), ou None
+    onde = f"linha {linha}: " if linha else ""
+    if not isinstance(texto, str) or not texto.strip():
+        return f"{onde}entrada vazia"
+    if texto.startswith(SUBITEM):
+        if not texto[len(SUBITEM):].strip():
+            return f"{onde}detalhe vazio"
+        return None
+    prefixo = _prefix_of(texto)
+    if prefixo is None:
+        return f"{onde}sem prefixo conhecido: {texto}"
+    if not texto[len(prefixo):].strip():
+        return f"{onde}descrição vazia: {texto}"
+    return None
+
+def validate_changelog(dados):
+    """
+    Lista de erros ("linha N: ...") do changelog: estrutura, prefixo do PREFIXOS em cada entrada,
+    detalhes "•" só depois de uma entrada, entradas repetidas e detalhes repetidos na mesma entrada.
+    """
+    if not isinstance(dados, dict):
+        return ["changelog precisa ser um objeto JSON"]
+    changes = dados.get("changes")
+    if not isinstance(changes, list):
+        return ["'changes' precisa ser uma lista"]
+
+    erros = []
+    seen = {}           # entrada -> primeira linha
+    details = {}        # detalhes da entrada atual -> linha
+    has_parent = False
+    by_head = _BY_HEAD
+    head = _HEAD
+    sub = _SUB_LEN
+    for i, item in enumerate(changes, 1):
+        # Caminhos rápidos (entrada ou detalhe válidos): o item é examinado uma vez, e só o
+        # que não passa neles vai para validate_entry montar a mensagem de erro
+        if item.__class__ is str:
+            entry = by_head.get(item[:head])
+            if entry is not None:
+                prefixo, size = entry
+                if item.startswith(prefixo) and len(item.rstrip()) > size:
+                    has_parent = True
+                    if details:
+                        details = {}
+                    first = seen.setdefault(item, i)
+                    if first != i:
+                        erros.append(f"linha {i}: entrada duplicada (linha {first})")
+                    continue
+            elif has_parent and item.startswith(SUBITEM) and len(item.rstrip()) > sub:
+                first = details.setdefault(item, i)
+                if first != i:
+                    erros.append(f"linha {i}: detalhe repetido (linha {first})")
+                continue
+
+        erro = validate_entry(item, i)
+        if erro:
+            erros.append(erro)
+        elif not has_parent:
+            erros.append(f"linha {i}: detalhe sem entrada principal")
+        elif item in details:
+            erros.append(f"linha {i}: detalhe repetido (linha {details[item]})")
+        else:
+            details[item] = i
+    return erros
+
+# ================= VERSION =================
+
+def validate_version(manifest, previous=None):
+    """
+    Erros do manifesto de versão: campos presentes, game_version / axion_release no formato
+    X.Y[.Z[.W]] e axion_release não anterior à release publicada (previous).
+    Republicar a mesma release é permitido.
+    """
+    if not isinstance(manifest, dict):
+        return ["version.json precisa ser um objeto JSON"]
+
+    erros = []
+    for field in VERSION_FIELDS:
+        value = manifest.get(field)
+        if not isinstance(value, str) or not value:
+            erros.append(f"{field}: obrigatório")
+        elif not VERSION_RE.match(value):
+            erros.append(f"{field}: versão inválida: {value} (use X.Y, X.Y.Z ou X.Y.Z.W)")
+    if erros or not previous:
+        return erros
+
+    anterior = previous.get("axion_release", "")
+    if isinstance(anterior, str) and VERSION_RE.match(anterior):
+        if version_key(manifest["axion_release"]) < version_key(anterior):
+            erros.append(f"axion_release: {manifest['axion_release']} é anterior à release publicada {anterior}")
+    return erros
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valida o changelog.json e o version.json")
+    parser.add_argument("--changelog", default=CHANGELOG_PATH)
+    parser.add_argument("--version", default=VERSION_PATH)
+    args = parser.parse_args(argv)
+
+    erros = [f"changelog: {erro}" for erro in validate_changelog(load_json(args.changelog, {"changes": []}))]
+    erros += [f"version: {erro}" for erro in validate_version(load_json(args.version, {}))]
+    for erro in erros:
+        print(erro)
+    if erros:
+        return 1
+    print("OK")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,47 +5,869 @@ Editor elegante com edição e reordenação de changelog
 
 import os
 import sys
-import json
+import time
+import queue
+import threading
+from bisect import bisect_left
+from collections import deque
+from itertools import compress
+
+_T_START = time.perf_counter()
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QListWidget, QComboBox, QFrame,
-    QMessageBox, QListWidgetItem, QInputDialog
+    QLineEdit, QPushButton, QListView, QComboBox, QFrame,
+    QStackedWidget, QCheckBox, QShortcut, QMessageBox, QInputDialog,
+    QFileDialog, QMenu
+)
+from PyQt5.QtCore import (
+    Qt, QPoint, QObject, QEvent, QTimer, pyqtSignal,
+    QAbstractListModel, QModelIndex, QMimeData, QFileSystemWatcher
 )
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QColor, QKeySequence
 
 # ================= CONFIG =================
 
-BASE_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
-os.chdir(BASE_DIR)
+from axion_common import (
+    BASE_DIR, CHANGELOG_PATH, VERSION_PATH, CHANNELS_PATH, DEFAULT_CHANNEL, PREFIXOS,
+    load_json, save_json, split_prefix
+)
+from axion_validate import validate_changelog, validate_entry, validate_version
+from axion_trace import from_env as trace_from_env, instrument
+# Busca, merge e canais (axion_search, axion_merge/difflib, axion_channels/axion_manifest/gzip)
+# são importados no primeiro uso: nenhum deles roda na abertura
+
+_T_IMPORTS = time.perf_counter()
+
+# Trace de inicialização (opt-in): AXION_STARTUP_TRACE=1 ou --trace-startup
+STARTUP_TRACE = os.environ.get("AXION_STARTUP_TRACE") == "1" or "--trace-startup" in sys.argv
+STARTUP_TARGET_MS = float(os.environ.get("AXION_STARTUP_TARGET_MS", "250"))
+
+# Instrumentação das ações (opt-in): AXION_TRACE=<arquivo> ou --trace=<arquivo>.
+# Desligada, TRACE é None e nenhum método é envolvido
+TRACE = trace_from_env()
+TRACED_ACTIONS = (
+    "show_page", "load_changelog_page", "load_version_page", "atualizar_lista",
+    "adicionar_item", "editar_item", "remover_item", "mover_cima", "mover_baixo",
+    "filtrar", "desfazer", "refazer", "inserir_entradas",
+    "recarregar_changelog", "recarregar_version", "snapshot_changelog",
+    "salvar_version", "trocar_canal",
+)
+
+# ================= THEME =================
+#
+# Um único stylesheet para a janela inteira. Os widgets só recebem objectName
+# (e propriedades dinâmicas como "active" / "variant"); o Qt faz o parse uma vez.
+
+THEME = """
+    #container, #container QWidget {
+        background: #1a1a1a;
+        border-radius: 8px;
+    }
+    
+    /* ===== TITLEBAR / HEADER ===== */
+    
+    QWidget#titlebar {
+        background: #0a0a0a;
+        border-bottom: 1px solid rgba(255, 255, 255, 15);
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    QLabel#titlebarTitle {
+        color: #aaaaaa;
+        letter-spacing: 1px;
+        background: transparent;
+        border: none;
+    }
+    QPushButton#closeButton {
+        color: #cc3333;
+        background: transparent;
+        border: none;
+        border-radius: 2px;
+    }
+    QPushButton#closeButton:hover {
+        color: #ff5555;
+        background: rgba(255, 50, 50, 30);
+    }
+    QWidget#header {
+        background: transparent;
+        border-bottom: 1px solid rgba(255, 255, 255, 13);
+    }
+    QLabel#headerTitle {
+        color: #ffffff;
+        background: transparent;
+        border: none;
+    }
+    
+    /* ===== TABS ===== */
+    
+    QWidget#tabBar {
+        background: rgba(0, 0, 0, 77);
+        border-bottom: 1px solid rgba(255, 255, 255, 13);
+    }
+    QLabel#tab {
+        color: #999999;
+        background: transparent;
+        border-bottom: 2px solid transparent;
+        padding: 0 20px;
+    }
+    QLabel#tab[active="true"] {
+        color: #ffffff;
+        background: rgba(120, 40, 220, 20);
+        border-bottom: 2px solid #7828dc;
+    }
+    
+    /* ===== CARDS ===== */
+    
+    QFrame#card {
+        background: #141414;
+        border: 1px solid rgba(255, 255, 255, 20);
+        border-radius: 6px;
+    }
+    QFrame#separator {
+        background: rgba(255, 255, 255, 13);
+        border: none;
+    }
+    QLabel#fieldLabel {
+        color: #888888;
+        background: transparent;
+        border: none;
+    }
+    
+    /* ===== INPUTS ===== */
+    
+    QLineEdit#input, QComboBox#combo {
+        background: rgba(0, 0, 0, 153);
+        border: 1px solid rgba(255, 255, 255, 26);
+        border-radius: 4px;
+        padding: 8px 11px;
+        color: #cccccc;
+    }
+    QLineEdit#input[variant="large"] {
+        padding: 10px 12px;
+    }
+    QLineEdit#input:focus, QComboBox#combo:focus {
+        border-color: #7828dc;
+        background: rgba(0, 0, 0, 204);
+    }
+    QComboBox#combo::drop-down {
+        border: none;
+    }
+    QComboBox#combo QAbstractItemView {
+        background: #1a1a1a;
+        border: 1px solid rgba(255, 255, 255, 26);
+        selection-background-color: #7828dc;
+        color: #cccccc;
+    }
+    QMenu#importMenu {
+        background: #1a1a1a;
+        border: 1px solid rgba(255, 255, 255, 26);
+        color: #cccccc;
+        padding: 4px;
+    }
+    QMenu#importMenu::item {
+        padding: 6px 14px;
+        border-radius: 4px;
+    }
+    QMenu#importMenu::item:selected {
+        background: #7828dc;
+    }
+    
+    /* ===== BOTÕES ===== */
+    
+    QPushButton#primaryButton {
+        background: rgba(120, 40, 220, 128);
+        border: 1px solid rgba(150, 50, 255, 153);
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: #ffffff;
+    }
+    QPushButton#primaryButton[variant="large"] {
+        padding: 11px 20px;
+    }
+    QPushButton#primaryButton:hover {
+        background: rgba(130, 50, 220, 179);
+        border-color: rgba(180, 80, 255, 230);
+    }
+    QPushButton#primaryButton:pressed {
+        background: rgba(110, 30, 200, 153);
+    }
+    QPushButton#iconButton, QPushButton#secondaryButton {
+        background: transparent;
+        border: 1px solid rgba(255, 255, 255, 38);
+        border-radius: 4px;
+        color: #999999;
+    }
+    QPushButton#secondaryButton {
+        padding: 6px 14px;
+    }
+    QPushButton#iconButton:hover, QPushButton#secondaryButton:hover {
+        background: rgba(255, 255, 255, 8);
+        border-color: rgba(255, 255, 255, 64);
+        color: #cccccc;
+    }
+    
+    /* ===== AUTOSAVE ===== */
+    
+    QCheckBox#autosaveToggle, QCheckBox#filterToggle {
+        color: #888888;
+        background: transparent;
+        border: none;
+        spacing: 6px;
+    }
+    QLabel#saveStatus {
+        color: #666666;
+        background: transparent;
+        border: none;
+    }
+    QLabel#saveStatus[state="pending"] {
+        color: #c9a227;
+    }
+    QLabel#saveStatus[state="saved"] {
+        color: #4caf50;
+    }
+    QLabel#saveStatus[state="error"] {
+        color: #ff5555;
+    }
+    QLabel#saveStatus[state="warning"] {
+        color: #e08a2c;
+    }
+    
+    /* ===== LISTA DO CHANGELOG ===== */
+    
+    QListView#changelogList {
+        background: #0f0f0f;
+        border: 1px solid rgba(255, 255, 255, 20);
+        border-radius: 4px;
+        padding: 8px;
+        color: #cccccc;
+    }
+    QListView#changelogList::item {
+        background: rgba(255, 255, 255, 8);
+        border-left: 2px solid #7828dc;
+        border-radius: 3px;
+        padding: 10px 12px 10px 8px;
+        margin-bottom: 5px;
+    }
+    QListView#changelogList::item:hover {
+        background: rgba(255, 255, 255, 15);
+    }
+    QListView#changelogList::item:selected {
+        background: rgba(120, 40, 220, 60);
+        border-left-color: #a855f7;
+        color: #ffffff;
+    }
+    QListView#changelogList QScrollBar:vertical {
+        background: rgba(0, 0, 0, 80);
+        width: 10px;
+        border-radius: 5px;
+        margin: 2px;
+    }
+    QListView#changelogList QScrollBar::handle:vertical {
+        background: rgba(120, 40, 220, 150);
+        border-radius: 5px;
+        min-height: 30px;
+    }
+    QListView#changelogList QScrollBar::handle:vertical:hover {
+        background: rgba(120, 40, 220, 200);
+    }
+    QListView#changelogList QScrollBar::add-line:vertical,
+    QListView#changelogList QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QListView#changelogList QScrollBar::add-page:vertical,
+    QListView#changelogList QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+
+# ================= STARTUP TRACE =================
 
-CHANGELOG_PATH = os.path.join(BASE_DIR, "changelog.json")
-VERSION_PATH = os.path.join(BASE_DIR, "version.json")
+class StartupTrace(QObject):
+    """
+    Tempos da abertura do editor: imports, QApplication, EditorWindow.__init__, init_ui e primeiro paint.
+    O primeiro paint termina quando o evento de paint da janela e de todos os filhos foi processado.
+    """
+    
+    def __init__(self, t_start, t_imports):
+        super().__init__()
+        self.t_start = t_start
+        self.marks = [("imports", t_start, t_imports)]
+        self.t_show = None
+    
+    def mark(self, name, start, end=None):
+        self.marks.append((name, start, end if end is not None else time.perf_counter()))
+    
+    def watch(self):
+        # Filtro no QApplication: a janela em si pode não receber Paint (o container a cobre)
+        self.t_show = time.perf_counter()
+        QApplication.instance().installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.t_show is not None:
+            QApplication.instance().removeEventFilter(self)
+            # singleShot(0) roda depois que os filhos terminaram de pintar o mesmo frame
+            QTimer.singleShot(0, self.report)
+        return False
+    
+    def report(self):
+        self.mark("first paint", self.t_show)
+        self.t_show = None
+        total_ms = (self.marks[-1][2] - self.t_start) * 1000
+        
+        for name, start, end in sorted(self.marks, key=lambda m: m[1]):
+            print(f"[startup] {name:<24} {(end - start) * 1000:8.1f} ms", file=sys.stderr)
+        status = "OK" if total_ms <= STARTUP_TARGET_MS else "ACIMA DA META"
+        print(
+            f"[startup] {'total':<24} {total_ms:8.1f} ms (meta {STARTUP_TARGET_MS:.0f} ms) {status}",
+            file=sys.stderr, flush=True
+        )
 
-PREFIXOS = {
-    "Adicionar": "[ + ] Adicionado",
-    "Remover": "[ - ] Removido",
-    "Correção Bug": "[ * ] Corrigido Bug",
-    "Desativar": "[ ! ] Desativado temporariamente"
-}
+# ================= UNDO / REDO =================
 
-# ================= UTILS =================
+class EditJournal:
+    """
+    Pilhas de desfazer/refazer com a operação aplicada, não cópias da lista:
+    ("insert", linha, texto) / ("delete", linha, texto) / ("replace", linha, antes, depois)
+    / ("move", origem, destino final) / ("insert_many" | "delete_many", linha, textos).
+    A memória cresce com o número de edições.
+    """
+    
+    LIMIT = 1000
+    
+    def __init__(self):
+        self.undo_stack = deque(maxlen=self.LIMIT)
+        self.redo_stack = []
+    
+    def record(self, op):
+        self.undo_stack.append(op)
+        self.redo_stack.clear()
+    
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+    
+    def can_undo(self):
+        return bool(self.undo_stack)
+    
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+# ================= MODEL =================
+
+class ChangelogModel(QAbstractListModel):
+    """
+    Lista do changelog ligada direto a dados_changelog["changes"].
+    Cada ação emite só o sinal da linha afetada, sem reconstruir a view.
+    O índice de busca (montado na primeira busca) é atualizado junto, só na entrada afetada.
+    Toda edição entra no journal; desfazer/refazer reaplicam a operação inversa pelos mesmos métodos.
+    """
+    
+    MIME_TYPE = "application/x-axion-changelog-row"
+    
+    def __init__(self, changes, parent=None):
+        super().__init__(parent)
+        self.journal = EditJournal()
+        self.replaying = False
+        self.set_changes(changes)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.changes)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"⋮⋮  {self.changes[index.row()]}"
+        if role == Qt.EditRole:
+            return self.changes[index.row()]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+    
+    # ===== EDIÇÃO =====
+    
+    def set_changes(self, changes):
+        self.beginResetModel()
+        self.changes = changes
+        # ids estáveis por linha: o índice de busca não depende da posição
+        self.ids = list(range(len(changes)))
+        self.next_id = len(changes)
+        self.search_index = None
+        # Lista nova: o histórico de edições não se aplica mais
+        self.journal.clear()
+        self.endResetModel()
+    
+    def record(self, op):
+        if not self.replaying:
+            self.journal.record(op)
+    
+    def insert(self, row, texto):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.changes.insert(row, texto)
+        self.ids.insert(row, self.next_id)
+        if self.search_index is not None:
+            self.search_index.add(self.next_id, texto)
+        self.next_id += 1
+        self.endInsertRows()
+        self.record(("insert", row, texto))
+    
+    def append(self, texto):
+        self.insert(len(self.changes), texto)
+    
+    def insert_many(self, row, textos):
+        # Várias entradas num único rowsInserted (uma atualização da view, um autosave)
+        if not textos:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(textos) - 1)
+        novos = list(range(self.next_id, self.next_id + len(textos)))
+        self.changes[row:row] = textos
+        self.ids[row:row] = novos
+        if self.search_index is not None:
+            for doc_id, texto in zip(novos, textos):
+                self.search_index.add(doc_id, texto)
+        self.next_id += len(textos)
+        self.endInsertRows()
+        self.record(("insert_many", row, list(textos)))
+    
+    def remove_many(self, row, count):
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        textos = self.changes[row:row + count]
+        removidos = self.ids[row:row + count]
+        del self.changes[row:row + count]
+        del self.ids[row:row + count]
+        if self.search_index is not None:
+            for doc_id in removidos:
+                self.search_index.remove(doc_id)
+        self.endRemoveRows()
+        self.record(("delete_many", row, textos))
+    
+    def remove(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        texto = self.changes.pop(row)
+        doc_id = self.ids.pop(row)
+        if self.search_index is not None:
+            self.search_index.remove(doc_id)
+        self.endRemoveRows()
+        self.record(("delete", row, texto))
+    
+    def replace(self, row, texto):
+        anterior = self.changes[row]
+        if anterior == texto:
+            return
+        self.changes[row] = texto
+        if self.search_index is not None:
+            self.search_index.update(self.ids[row], texto)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        self.record(("replace", row, anterior, texto))
+    
+    def move(self, row, dest):
+        # dest segue a convenção do Qt: posição *antes* da qual a linha é inserida
+        if dest in (row, row + 1):
+            return False
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dest):
+            return False
+        final = dest - 1 if dest > row else dest
+        item = self.changes.pop(row)
+        doc_id = self.ids.pop(row)
+        self.changes.insert(final, item)
+        self.ids.insert(final, doc_id)
+        self.endMoveRows()
+        self.record(("move", row, final))
+        return True
+    
+    def move_to(self, row, final):
+        # Move a linha para que termine no índice `final`
+        return self.move(row, final + 1 if final > row else final)
+    
+    def sync_to(self, changes):
+        # Leva a lista ao conteúdo de `changes` só com as linhas que diferem (sem reset da view)
+        from axion_merge import edit_ops
+        
+        self.replaying = True
+        try:
+            for kind, row, arg in edit_ops(self.changes, changes):
+                if kind == "replace":
+                    for offset, texto in enumerate(arg):
+                        self.replace(row + offset, texto)
+                elif kind == "delete":
+                    self.remove_many(row, arg)
+                else:
+                    self.insert_many(row, arg)
+        finally:
+            self.replaying = False
+        # As operações do journal se referem a linhas que podem ter mudado de lugar
+        self.journal.clear()
+    
+    # ===== DESFAZER / REFAZER =====
+    
+    def _apply(self, op, inverse):
+        kind, row = op[0], op[1]
+        if kind == "insert_many" or kind == "delete_many":
+            if (kind == "insert_many") == inverse:
+                self.remove_many(row, len(op[2]))
+                return min(row, len(self.changes) - 1)
+            self.insert_many(row, op[2])
+            return row
+        if kind == "insert" or kind == "delete":
+            if (kind == "insert") == inverse:
+                self.remove(row)
+                return row if row < len(self.changes) else row - 1
+            self.insert(row, op[2])
+            return row
+        if kind == "replace":
+            self.replace(row, op[2] if inverse else op[3])
+            return row
+        final = op[2]
+        if inverse:
+            self.move_to(final, row)
+            return row
+        self.move_to(row, final)
+        return final
+    
+    def undo(self):
+        # Retorna a linha afetada (para seleção) ou -1 quando não há o que desfazer
+        if not self.journal.can_undo():
+            return -1
+        op = self.journal.undo_stack.pop()
+        self.replaying = True
+        try:
+            row = self._apply(op, inverse=True)
+        finally:
+            self.replaying = False
+        self.journal.redo_stack.append(op)
+        return row
+    
+    def redo(self):
+        if not self.journal.can_redo():
+            return -1
+        op = self.journal.redo_stack.pop()
+        self.replaying = True
+        try:
+            row = self._apply(op, inverse=False)
+        finally:
+            self.replaying = False
+        self.journal.undo_stack.append(op)
+        return row
+    
+    # ===== BUSCA =====
+    
+    def search(self, query, category=None):
+        # Linhas (em ordem) que casam com a busca; None quando não há filtro
+        if self.search_index is None:
+            from axion_search import build_index
+            self.search_index = build_index(self.changes, self.ids)
+        ids = self.search_index.search(query, category)
+        if ids is None:
+            return None
+        if len(ids) == len(self.ids):
+            return list(range(len(self.ids)))
+        return list(compress(range(len(self.ids)), map(ids.__contains__, self.ids)))
+    
+    # ===== DRAG & DROP =====
+    
+    def supportedDropActions(self):
+        return Qt.MoveAction
+    
+    def mimeTypes(self):
+        return [self.MIME_TYPE]
+    
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        mime.setData(self.MIME_TYPE, str(indexes[0].row()).encode())
+        return mime
+    
+    def dropMimeData(self, mime, action, row, column, parent):
+        if action != Qt.MoveAction or not mime.hasFormat(self.MIME_TYPE):
+            return False
+        origem = int(bytes(mime.data(self.MIME_TYPE)).decode())
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self.changes)
+        self.move(origem, row)
+        # False: o move já foi feito aqui, a view não deve remover a linha de origem
+        return False
 
-def load_json(path, default):
-    if not os.path.exists(path):
-        return default
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+class ChangelogFilterModel(QAbstractListModel):
+    """
+    Resultado da busca: linhas do changelog que casaram (na ordem do changelog)
+    seguidas das notas de releases anteriores, que são só leitura.
+    Com um filtro ativo, cada alteração na lista reavalia só as entradas afetadas (pelo índice de
+    busca) e emite insert/remove/dataChanged nas linhas delas: seleção e rolagem ficam onde estão.
+    """
+    
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.rows = []
+        self.archive = []
+        self.query = None       # None: sem filtro ativo (as alterações da lista são ignoradas)
+        self.category = None
+        source.rowsInserted.connect(self._source_inserted)
+        source.rowsAboutToBeRemoved.connect(self._source_removing)
+        source.rowsRemoved.connect(self._source_removed)
+        source.rowsMoved.connect(self._source_moved)
+        source.dataChanged.connect(self._source_changed)
+        source.modelReset.connect(self._source_reset)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows) + len(self.archive)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < len(self.rows):
+            if role == Qt.DisplayRole:
+                return f"⋮⋮  {self.source.changes[self.rows[row]]}"
+            if role == Qt.EditRole:
+                return self.source.changes[self.rows[row]]
+            return None
+        release, texto = self.archive[row - len(self.rows)]
+        if role == Qt.DisplayRole:
+            return f"{release}  {texto}"
+        if role == Qt.ForegroundRole:
+            return QColor("#777777")
+        if role == Qt.ToolTipRole:
+            return f"Release {release}"
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.row() < len(self.rows):
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled
+    
+    def set_results(self, rows, archive, query="", category=None):
+        self.beginResetModel()
+        self.rows = rows
+        self.archive = archive
+        self.query = query
+        self.category = category
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_results([], [], None)
+    
+    def source_row(self, row):
+        return self.rows[row] if 0 <= row < len(self.rows) else -1
+    
+    def filter_row(self, source_row):
+        pos = bisect_left(self.rows, source_row)
+        return pos if pos < len(self.rows) and self.rows[pos] == source_row else -1
+    
+    # ===== ALTERAÇÕES DA LISTA =====
+    
+    def _matches(self, source_row):
+        source = self.source
+        return source.search_index.matches(source.ids[source_row], self.query, self.category)
+    
+    def _shift(self, pos, delta):
+        # Linhas filtradas a partir de pos apontam para linhas do changelog deslocadas
+        rows = self.rows
+        for i in range(pos, len(rows)):
+            rows[i] += delta
+    
+    def _source_inserted(self, parent, first, last):
+        if self.query is None:
+            return
+        count = last - first + 1
+        pos = bisect_left(self.rows, first)
+        self._shift(pos, count)
+        novos = [row for row in range(first, last + 1) if self._matches(row)]
+        if novos:
+            # Linhas novas são contíguas no changelog: entram num bloco só no filtro
+            self.beginInsertRows(QModelIndex(), pos, pos + len(novos) - 1)
+            self.rows[pos:pos] = novos
+            self.endInsertRows()
+    
+    def _source_removing(self, parent, first, last):
+        # Antes da remoção: as linhas saem do filtro enquanto ainda apontam para o texto certo
+        if self.query is None:
+            return
+        start = bisect_left(self.rows, first)
+        end = bisect_left(self.rows, last + 1)
+        if end > start:
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            del self.rows[start:end]
+            self.endRemoveRows()
+    
+    def _source_removed(self, parent, first, last):
+        if self.query is not None:
+            self._shift(bisect_left(self.rows, first), -(last - first + 1))
+    
+    def _source_changed(self, top_left, bottom_right, roles=()):
+        if self.query is None:
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            pos = bisect_left(self.rows, row)
+            listed = pos < len(self.rows) and self.rows[pos] == row
+            match = self._matches(row)
+            if listed and match:
+                index = self.index(pos)
+                self.dataChanged.emit(index, index)
+            elif listed:
+                self.beginRemoveRows(QModelIndex(), pos, pos)
+                del self.rows[pos]
+                self.endRemoveRows()
+            elif match:
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                self.rows.insert(pos, row)
+                self.endInsertRows()
+    
+    def _source_moved(self, parent, start, end, destination, dest):
+        if self.query is None:
+            return
+        if end != start:
+            self._source_reset()
+            return
+        # O changelog só move uma linha por vez (mover, arrastar, desfazer)
+        final = dest - 1 if dest > start else dest
+        rows = self.rows
+        pos = bisect_left(rows, start)
+        listed = pos < len(rows) and rows[pos] == start
+        # Linhas entre a origem e o destino andam uma casa; a movida passa a apontar para `final`
+        # (a ordem do filtro só é corrigida abaixo, dentro do beginMoveRows)
+        low, high, delta = (start + 1, final, -1) if final > start else (final, start - 1, 1)
+        for i in range(bisect_left(rows, low), bisect_left(rows, high + 1)):
+            rows[i] += delta
+        if not listed:
+            return
+        rows[pos] = final
+        if final > start:
+            new_pos = bisect_left(rows, final, pos + 1) - 1
+        else:
+            new_pos = bisect_left(rows, final, 0, pos)
+        if new_pos == pos:
+            return
+        self.beginMoveRows(QModelIndex(), pos, pos, QModelIndex(), new_pos + 1 if new_pos > pos else new_pos)
+        rows.insert(new_pos, rows.pop(pos))
+        self.endMoveRows()
+    
+    def _source_reset(self):
+        # Lista substituída (recarga): refaz a busca inteira
+        if self.query is None:
+            return
+        rows = self.source.search(self.query, self.category)
+        self.set_results(rows if rows is not None else [], self.archive, self.query, self.category)
 
-def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+# ================= AUTOSAVE =================
+
+class AutoSaver(QObject):
+    """
+    Agrupa as edições do changelog e grava numa thread de fundo após um intervalo sem edições.
+    O snapshot é tirado na thread da UI; validação, serialização e escrita ficam no worker.
+    """
+    
+    status_changed = pyqtSignal(str, str)           # (estado, texto)
+    _write_done = pyqtSignal(bool, str, object, object)     # emitido pelo worker, entregue na thread da UI
+    
+    def __init__(self, path, snapshot, delay_ms=800, parent=None, validate=None):
+        super().__init__(parent)
+        self.path = path
+        self.snapshot = snapshot
+        self.validate = validate
+        self.problemas = []         # da última validação (aparecem no indicador de status)
+        self.enabled = True
+        self.dirty = False
+        self.writes_in_flight = 0
+        # Último snapshot gravado e o stat do arquivo logo depois: o watcher reconhece a própria
+        # escrita pelo stat, sem reler o arquivo
+        self.last_written = None
+        self.written_stamp = None
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.save_now)
+        
+        # Um único worker (criado na primeira gravação): as gravações saem na ordem em que foram pedidas
+        self.queue = queue.Queue()
+        self.worker = None
+        self._write_done.connect(self._on_write_done)
+    
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if enabled and self.dirty:
+            self.timer.start()
+    
+    def schedule(self, *args):
+        self.dirty = True
+        self.status_changed.emit("pending", "Alterações não salvas")
+        if self.enabled:
+            self.timer.start()
+    
+    def save_now(self):
+        self.timer.stop()
+        self.dirty = False
+        self.writes_in_flight += 1
+        self.status_changed.emit("saving", "Salvando...")
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self.worker.start()
+        self.queue.put(self.snapshot())
+    
+    def discard(self):
+        # A lista foi recarregada do disco: não há o que gravar
+        self.timer.stop()
+        self.dirty = False
+    
+    def _run(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                return
+            self._write(data)
+    
+    def _write(self, data):
+        # Valida aqui e não na UI: em changelogs grandes a passada custa dezenas de ms.
+        # Grava mesmo com problemas, só avisa
+        problemas = self.validate(data) if self.validate else []
+        try:
+            start = time.perf_counter()
+            alterado = save_json(self.path, data)
+            if TRACE:
+                TRACE.record("save_json", start, cat="io")
+                TRACE.count("save_json.gravado" if alterado else "save_json.inalterado")
+            self._write_done.emit(alterado, "", problemas, (data, file_stamp(self.path)))
+        except Exception as exc:
+            self._write_done.emit(False, str(exc), problemas, None)
+    
+    def _on_write_done(self, alterado, erro, problemas, written):
+        self.writes_in_flight -= 1
+        self.problemas = problemas
+        if written:
+            self.last_written, self.written_stamp = written
+        if erro:
+            self.dirty = True
+            self.status_changed.emit("error", f"Erro ao salvar: {erro}")
+        elif not self.writes_in_flight and not self.dirty:
+            self.status_changed.emit("saved", "Salvo" if alterado else "Sem alterações")
+    
+    def flush(self):
+        # Fechamento da janela: grava o que estiver pendente e espera o worker terminar
+        if self.dirty:
+            self.save_now()
+        if self.worker is not None:
+            self.queue.put(None)
+            self.worker.join()
+            self.worker = None
 
 # ================= MAIN WINDOW =================
 
+def file_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
 class EditorWindow(QWidget):
-    def __init__(self):
+    def __init__(self, startup_trace=None):
         super().__init__()
         
         self.setWindowTitle("Axion Update Manager")
@@ -59,10 +881,50 @@ class EditorWindow(QWidget):
         # Load data
         self.dados_changelog = load_json(CHANGELOG_PATH, {"changes": []})
         self.dados_version = load_json(VERSION_PATH, {"game_version": "", "axion_release": ""})
+        # Canais de release: lidos ao abrir a aba Versão (sem channels.json só existe o stable,
+        # lido do version.json)
+        self.canais = None
+        self.canal_atual = DEFAULT_CHANNEL
+        self.changelog_model = ChangelogModel(self.dados_changelog["changes"], self)
+        # Base do merge de três vias: o changelog como estava no disco na última leitura/gravação
+        self.base_changes = list(self.dados_changelog["changes"])
+        # Autosave: qualquer alteração no model (botões ou drag & drop) agenda uma gravação,
+        # validada no worker (autosave.problemas)
+        self.autosave = AutoSaver(CHANGELOG_PATH, self.snapshot_changelog, parent=self,
+                                  validate=validate_changelog)
+        model = self.changelog_model
+        for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                       model.dataChanged, model.modelReset):
+            signal.connect(self.autosave.schedule)
         
+        t_ui = time.perf_counter()
         self.init_ui()
+        if startup_trace:
+            startup_trace.mark("  init_ui", t_ui)
+        
+        self.init_watcher()
+    
+    def init_watcher(self):
+        # Alterações externas (publicador, git pull, outro editor): os eventos são agrupados e
+        # só o arquivo cujo stat (mtime, tamanho, inode) mudou é relido
+        self.disk_stamps = {path: file_stamp(path) for path in (CHANGELOG_PATH, VERSION_PATH, CHANNELS_PATH)}
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(150)
+        self.reload_timer.timeout.connect(self.verificar_arquivos)
+        
+        self.watcher = QFileSystemWatcher(self)
+        # A pasta também: gravações atômicas trocam o inode e o watch do arquivo se perde
+        self.watcher.addPaths([p for p in (CHANGELOG_PATH, VERSION_PATH, CHANNELS_PATH,
+                                           os.path.dirname(CHANGELOG_PATH))
+                               if os.path.exists(p)])
+        self.watcher.fileChanged.connect(self.reload_timer.start)
+        self.watcher.directoryChanged.connect(self.reload_timer.start)
     
     def init_ui(self):
+        # Tema aplicado uma vez no topo da árvore (parse único do QSS)
+        self.setStyleSheet(THEME)
+        
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -70,12 +932,7 @@ class EditorWindow(QWidget):
         
         # Container
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background: #1a1a1a;
-                border-radius: 8px;
-            }
-        """)
+        container.setObjectName("container")
         main_layout.addWidget(container)
         
         root = QVBoxLayout(container)
@@ -97,6 +954,11 @@ class EditorWindow(QWidget):
         self.content_layout.setContentsMargins(18, 18, 18, 18)
         self.content_layout.setSpacing(0)
         
+        # Páginas montadas sob demanda e mantidas vivas (troca de aba não recria widgets)
+        self.pages = QStackedWidget()
+        self.page_widgets = {}
+        self.content_layout.addWidget(self.pages)
+        
         root.addWidget(self.content_widget, 1)
         
         # Show initial page
@@ -105,19 +967,14 @@ class EditorWindow(QWidget):
     def create_titlebar(self):
         titlebar = QWidget()
         titlebar.setFixedHeight(32)
-        titlebar.setStyleSheet("""
-            background: #0a0a0a;
-            border-bottom: 1px solid rgba(255, 255, 255, 15);
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-        """)
+        titlebar.setObjectName("titlebar")
         
         layout = QHBoxLayout(titlebar)
         layout.setContentsMargins(12, 0, 12, 0)
         
         title = QLabel("AXION UPDATE MANAGER")
         title.setFont(QFont("Consolas", 9))
-        title.setStyleSheet("color: #aaaaaa; letter-spacing: 1px; background: transparent; border: none;")
+        title.setObjectName("titlebarTitle")
         layout.addWidget(title)
         layout.addStretch()
         
@@ -125,18 +982,7 @@ class EditorWindow(QWidget):
         close_btn.setFont(QFont("Segoe UI", 12))
         close_btn.setFixedSize(24, 24)
         close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton { 
-                color: #cc3333; 
-                background: transparent;
-                border: none;
-                border-radius: 2px;
-            }
-            QPushButton:hover { 
-                color: #ff5555; 
-                background: rgba(255, 50, 50, 30); 
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
         
@@ -144,20 +990,20 @@ class EditorWindow(QWidget):
     
     def create_header(self):
         header = QWidget()
-        header.setStyleSheet("background: transparent; border-bottom: 1px solid rgba(255, 255, 255, 13);")
+        header.setObjectName("header")
         layout = QVBoxLayout(header)
         layout.setContentsMargins(22, 18, 22, 12)
         
         title = QLabel("Axion Update Manager")
         title.setFont(QFont("Segoe UI", 18, QFont.DemiBold))
-        title.setStyleSheet("color: #ffffff; background: transparent; border: none;")
+        title.setObjectName("headerTitle")
         layout.addWidget(title)
         
         return header
     
     def create_tabs(self):
         tabs_widget = QWidget()
-        tabs_widget.setStyleSheet("background: rgba(0, 0, 0, 77); border-bottom: 1px solid rgba(255, 255, 255, 13);")
+        tabs_widget.setObjectName("tabBar")
         
         layout = QHBoxLayout(tabs_widget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -177,14 +1023,8 @@ class EditorWindow(QWidget):
         tab.setFont(QFont("Segoe UI", 11))
         tab.setCursor(Qt.PointingHandCursor)
         tab.setFixedHeight(36)
-        tab.setStyleSheet("""
-            QLabel {
-                color: #999999;
-                background: transparent;
-                border-bottom: 2px solid transparent;
-                padding: 0 20px;
-            }
-        """)
+        tab.setObjectName("tab")
+        tab.setProperty("active", False)
         tab.mousePressEvent = lambda e: self.show_page(page_id)
         tab.page_id = page_id
         return tab
@@ -192,49 +1032,39 @@ class EditorWindow(QWidget):
     def show_page(self, page_id):
         self.current_page = page_id
         
-        # Update tabs
+        # Update tabs (o tema já tem os dois estados; só troca a propriedade)
         for tab in [self.tab_changelog, self.tab_version]:
-            if tab.page_id == page_id:
-                tab.setStyleSheet("""
-                    QLabel {
-                        color: #ffffff;
-                        background: rgba(120, 40, 220, 20);
-                        border-bottom: 2px solid #7828dc;
-                        padding: 0 20px;
-                    }
-                """)
-            else:
-                tab.setStyleSheet("""
-                    QLabel {
-                        color: #999999;
-                        background: transparent;
-                        border-bottom: 2px solid transparent;
-                        padding: 0 20px;
-                    }
-                """)
-        
-        # Clear content
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Load page
-        if page_id == "changelog":
-            self.load_changelog_page()
-        elif page_id == "version":
-            self.load_version_page()
+            active = tab.page_id == page_id
+            if tab.property("active") != active:
+                tab.setProperty("active", active)
+                tab.style().unpolish(tab)
+                tab.style().polish(tab)
+        
+        # Load page (só na primeira visita)
+        page = self.page_widgets.get(page_id)
+        if page is None:
+            if page_id == "changelog":
+                page = self.load_changelog_page()
+            elif page_id == "version":
+                page = self.load_version_page()
+            self.page_widgets[page_id] = page
+            self.pages.addWidget(page)
+        
+        self.pages.setCurrentWidget(page)
+    
+    def wrap_page(self, card):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(card)
+        layout.addStretch()
+        return page
     
     def load_changelog_page(self):
         # Card
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: #141414;
-                border: 1px solid rgba(255, 255, 255, 20);
-                border-radius: 6px;
-            }
-        """)
+        card.setObjectName("card")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(16, 16, 16, 16)
         card_layout.setSpacing(16)
@@ -247,130 +1077,84 @@ class EditorWindow(QWidget):
         self.combo_tipo.addItems(list(PREFIXOS.keys()))
         self.combo_tipo.setFixedWidth(140)
         self.combo_tipo.setFont(QFont("Segoe UI", 11))
-        self.combo_tipo.setStyleSheet("""
-            QComboBox {
-                background: rgba(0, 0, 0, 153);
-                border: 1px solid rgba(255, 255, 255, 26);
-                border-radius: 4px;
-                padding: 8px 11px;
-                color: #cccccc;
-            }
-            QComboBox:focus {
-                border-color: #7828dc;
-                background: rgba(0, 0, 0, 204);
-            }
-            QComboBox::drop-down { border: none; }
-            QComboBox QAbstractItemView {
-                background: #1a1a1a;
-                border: 1px solid rgba(255, 255, 255, 26);
-                selection-background-color: #7828dc;
-                color: #cccccc;
-            }
-        """)
+        self.combo_tipo.setObjectName("combo")
         input_row.addWidget(self.combo_tipo)
         
         self.entry_texto = QLineEdit()
         self.entry_texto.setPlaceholderText("Digite a descrição...")
         self.entry_texto.setFont(QFont("Segoe UI", 11))
-        self.entry_texto.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 153);
-                border: 1px solid rgba(255, 255, 255, 26);
-                border-radius: 4px;
-                padding: 8px 11px;
-                color: #cccccc;
-            }
-            QLineEdit:focus {
-                border-color: #7828dc;
-                background: rgba(0, 0, 0, 204);
-            }
-        """)
+        self.entry_texto.setObjectName("input")
         input_row.addWidget(self.entry_texto, 1)
         
         btn_add = QPushButton("Adicionar")
         btn_add.setFont(QFont("Segoe UI", 11, QFont.DemiBold))
         btn_add.setCursor(Qt.PointingHandCursor)
-        btn_add.setStyleSheet("""
-            QPushButton {
-                background: rgba(120, 40, 220, 128);
-                border: 1px solid rgba(150, 50, 255, 153);
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background: rgba(130, 50, 220, 179);
-                border-color: rgba(180, 80, 255, 230);
-            }
-            QPushButton:pressed {
-                background: rgba(110, 30, 200, 153);
-            }
-        """)
+        btn_add.setObjectName("primaryButton")
         btn_add.clicked.connect(self.adicionar_item)
         input_row.addWidget(btn_add)
         
+        self.btn_import = QPushButton("Importar")
+        self.btn_import.setFont(QFont("Segoe UI", 11))
+        self.btn_import.setToolTip("Várias entradas de uma vez: texto colado, lista Markdown ou git log")
+        self.btn_import.setCursor(Qt.PointingHandCursor)
+        self.btn_import.setObjectName("secondaryButton")
+        self.btn_import.clicked.connect(self.menu_importar)
+        input_row.addWidget(self.btn_import)
+        
         card_layout.addLayout(input_row)
         
+        # Search
+        search_row = QHBoxLayout()
+        search_row.setSpacing(8)
+        
+        self.combo_filtro = QComboBox()
+        self.combo_filtro.addItems(["Todas"] + list(PREFIXOS.keys()))
+        self.combo_filtro.setFixedWidth(140)
+        self.combo_filtro.setFont(QFont("Segoe UI", 11))
+        self.combo_filtro.setObjectName("combo")
+        self.combo_filtro.currentIndexChanged.connect(self.filtrar)
+        search_row.addWidget(self.combo_filtro)
+        
+        self.entry_busca = QLineEdit()
+        self.entry_busca.setPlaceholderText("Buscar no changelog...")
+        self.entry_busca.setFont(QFont("Segoe UI", 11))
+        self.entry_busca.setObjectName("input")
+        self.entry_busca.textChanged.connect(self.filtrar)
+        search_row.addWidget(self.entry_busca, 1)
+        
+        self.check_historico = QCheckBox("Histórico")
+        self.check_historico.setFont(QFont("Segoe UI", 10))
+        self.check_historico.setToolTip("Buscar também nas releases anteriores")
+        self.check_historico.setObjectName("filterToggle")
+        self.check_historico.toggled.connect(self.filtrar)
+        search_row.addWidget(self.check_historico)
+        
+        card_layout.addLayout(search_row)
+        
         # List
-        self.listbox = QListWidget()
+        self.listbox = QListView()
         self.listbox.setFont(QFont("Consolas", 11))
-        self.listbox.setDragDropMode(QListWidget.InternalMove)
+        self.listbox.setDragDropMode(QListView.InternalMove)
         self.listbox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.listbox.setWordWrap(True)
-        self.listbox.setStyleSheet("""
-            QListWidget {
-                background: #0f0f0f;
-                border: 1px solid rgba(255, 255, 255, 20);
-                border-radius: 4px;
-                padding: 8px;
-                color: #cccccc;
-            }
-            QListWidget::item {
-                background: rgba(255, 255, 255, 8);
-                border-left: 2px solid #7828dc;
-                border-radius: 3px;
-                padding: 10px 12px 10px 8px;
-                margin-bottom: 5px;
-            }
-            QListWidget::item:hover {
-                background: rgba(255, 255, 255, 15);
-            }
-            QListWidget::item:selected {
-                background: rgba(120, 40, 220, 60);
-                border-left-color: #a855f7;
-                color: #ffffff;
-            }
-            QScrollBar:vertical {
-                background: rgba(0, 0, 0, 80);
-                width: 10px;
-                border-radius: 5px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(120, 40, 220, 150);
-                border-radius: 5px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(120, 40, 220, 200);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        self.listbox.setLayoutMode(QListView.Batched)
+        self.listbox.setObjectName("changelogList")
         self.listbox.setMaximumHeight(280)
+        self.listbox.setModel(self.changelog_model)
         card_layout.addWidget(self.listbox)
         
-        # Update list
-        self.atualizar_lista()
+        # Ctrl+V na lista: cola várias linhas como entradas
+        QShortcut(QKeySequence.Paste, self.listbox, activated=self.colar_entradas,
+                  context=Qt.WidgetShortcut)
+        
+        # Com um filtro ativo, a lista mostra o resultado da busca (atualizado a cada alteração)
+        self.filter_model = ChangelogFilterModel(self.changelog_model, self)
+        self.archive_search = None
         
         # Separator
         sep = QFrame()
         sep.setFixedHeight(1)
-        sep.setStyleSheet("background: rgba(255, 255, 255, 13); border: none;")
+        sep.setObjectName("separator")
         card_layout.addWidget(sep)
         
         # Actions
@@ -386,19 +1170,7 @@ class EditorWindow(QWidget):
         btn_edit.setFixedSize(32, 32)
         btn_edit.setToolTip("Editar selecionado")
         btn_edit.setCursor(Qt.PointingHandCursor)
-        btn_edit.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(255, 255, 255, 38);
-                border-radius: 4px;
-                color: #999999;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 8);
-                border-color: rgba(255, 255, 255, 64);
-                color: #cccccc;
-            }
-        """)
+        btn_edit.setObjectName("iconButton")
         btn_edit.clicked.connect(self.editar_item)
         left_actions.addWidget(btn_edit)
         
@@ -407,19 +1179,7 @@ class EditorWindow(QWidget):
         btn_up.setFixedSize(32, 32)
         btn_up.setToolTip("Mover para cima")
         btn_up.setCursor(Qt.PointingHandCursor)
-        btn_up.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(255, 255, 255, 38);
-                border-radius: 4px;
-                color: #999999;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 8);
-                border-color: rgba(255, 255, 255, 64);
-                color: #cccccc;
-            }
-        """)
+        btn_up.setObjectName("iconButton")
         btn_up.clicked.connect(self.mover_cima)
         left_actions.addWidget(btn_up)
         
@@ -428,154 +1188,127 @@ class EditorWindow(QWidget):
         btn_down.setFixedSize(32, 32)
         btn_down.setToolTip("Mover para baixo")
         btn_down.setCursor(Qt.PointingHandCursor)
-        btn_down.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(255, 255, 255, 38);
-                border-radius: 4px;
-                color: #999999;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 8);
-                border-color: rgba(255, 255, 255, 64);
-                color: #cccccc;
-            }
-        """)
+        btn_down.setObjectName("iconButton")
         btn_down.clicked.connect(self.mover_baixo)
         left_actions.addWidget(btn_down)
         
         btn_remove = QPushButton("Remover")
         btn_remove.setFont(QFont("Segoe UI", 11))
         btn_remove.setCursor(Qt.PointingHandCursor)
-        btn_remove.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: 1px solid rgba(255, 255, 255, 38);
-                border-radius: 4px;
-                padding: 6px 14px;
-                color: #999999;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 8);
-                border-color: rgba(255, 255, 255, 64);
-                color: #cccccc;
-            }
-        """)
+        btn_remove.setToolTip("Remover selecionado (Ctrl+Z desfaz)")
+        btn_remove.setObjectName("secondaryButton")
         btn_remove.clicked.connect(self.remover_item)
         left_actions.addWidget(btn_remove)
         
+        # Desfazer / refazer (só com a aba do changelog visível; campos de texto mantêm o próprio Ctrl+Z)
+        for keys, slot in ((QKeySequence.Undo, self.desfazer), (QKeySequence.Redo, self.refazer),
+                           (QKeySequence("Ctrl+Shift+Z"), self.refazer)):
+            QShortcut(keys, card, activated=slot)
+        
         actions.addLayout(left_actions)
         actions.addStretch()
         
+        # Autosave
+        self.save_status = QLabel("")
+        self.save_status.setFont(QFont("Segoe UI", 9))
+        self.save_status.setObjectName("saveStatus")
+        self.save_status.setMaximumWidth(160)
+        self.autosave.status_changed.connect(self.atualizar_status)
+        actions.addWidget(self.save_status)
+        
+        autosave_toggle = QCheckBox("Auto")
+        autosave_toggle.setFont(QFont("Segoe UI", 10))
+        autosave_toggle.setToolTip("Salvar automaticamente após editar")
+        autosave_toggle.setObjectName("autosaveToggle")
+        autosave_toggle.setChecked(self.autosave.enabled)
+        autosave_toggle.toggled.connect(self.autosave.set_enabled)
+        actions.addWidget(autosave_toggle)
+        
         # Right action
         btn_save = QPushButton("Salvar Changelog")
         btn_save.setFont(QFont("Segoe UI", 11, QFont.DemiBold))
         btn_save.setCursor(Qt.PointingHandCursor)
-        btn_save.setStyleSheet("""
-            QPushButton {
-                background: rgba(120, 40, 220, 128);
-                border: 1px solid rgba(150, 50, 255, 153);
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background: rgba(130, 50, 220, 179);
-                border-color: rgba(180, 80, 255, 230);
-            }
-        """)
+        btn_save.setObjectName("primaryButton")
         btn_save.clicked.connect(self.salvar_changelog)
         actions.addWidget(btn_save)
         
         card_layout.addLayout(actions)
         
-        self.content_layout.addWidget(card)
-        self.content_layout.addStretch()
+        return self.wrap_page(card)
     
     def load_version_page(self):
+        from axion_channels import load_channels
+        self.canais = load_channels()
+        
         # Card
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background: #141414;
-                border: 1px solid rgba(255, 255, 255, 20);
-                border-radius: 6px;
-            }
-        """)
+        card.setObjectName("card")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 40, 40, 40)
         card_layout.setSpacing(18)
         
+        # Channel
+        channel_label = QLabel("CANAL")
+        channel_label.setFont(QFont("Segoe UI", 10))
+        channel_label.setObjectName("fieldLabel")
+        card_layout.addWidget(channel_label)
+        
+        channel_row = QHBoxLayout()
+        channel_row.setSpacing(8)
+        
+        self.combo_canal = QComboBox()
+        self.combo_canal.addItems(list(self.canais))
+        self.combo_canal.setFont(QFont("Segoe UI", 12))
+        self.combo_canal.setObjectName("combo")
+        self.combo_canal.currentTextChanged.connect(self.trocar_canal)
+        channel_row.addWidget(self.combo_canal, 1)
+        
+        btn_channel = QPushButton("+")
+        btn_channel.setFont(QFont("Segoe UI", 14))
+        btn_channel.setFixedSize(32, 32)
+        btn_channel.setToolTip("Novo canal (ex: beta)")
+        btn_channel.setCursor(Qt.PointingHandCursor)
+        btn_channel.setObjectName("iconButton")
+        btn_channel.clicked.connect(self.novo_canal)
+        channel_row.addWidget(btn_channel)
+        card_layout.addLayout(channel_row)
+        
         # Game version
         game_label = QLabel("VERSÃO DO JOGO")
         game_label.setFont(QFont("Segoe UI", 10))
-        game_label.setStyleSheet("color: #888888; background: transparent; border: none;")
+        game_label.setObjectName("fieldLabel")
         card_layout.addWidget(game_label)
         
         self.entry_game = QLineEdit()
-        self.entry_game.setText(self.dados_version.get("game_version", ""))
+        self.entry_game.setText(self.canais[self.canal_atual]["game_version"])
         self.entry_game.setFont(QFont("Segoe UI", 12))
-        self.entry_game.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 153);
-                border: 1px solid rgba(255, 255, 255, 26);
-                border-radius: 4px;
-                padding: 10px 12px;
-                color: #cccccc;
-            }
-            QLineEdit:focus {
-                border-color: #7828dc;
-                background: rgba(0, 0, 0, 204);
-            }
-        """)
+        self.entry_game.setObjectName("input")
+        self.entry_game.setProperty("variant", "large")
         card_layout.addWidget(self.entry_game)
         
         # Axion version
         axion_label = QLabel("RELEASE DO AXION")
         axion_label.setFont(QFont("Segoe UI", 10))
-        axion_label.setStyleSheet("color: #888888; background: transparent; border: none;")
+        axion_label.setObjectName("fieldLabel")
         card_layout.addWidget(axion_label)
         
         self.entry_axion = QLineEdit()
-        self.entry_axion.setText(self.dados_version.get("axion_release", ""))
+        self.entry_axion.setText(self.canais[self.canal_atual]["axion_release"])
         self.entry_axion.setFont(QFont("Segoe UI", 12))
-        self.entry_axion.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 153);
-                border: 1px solid rgba(255, 255, 255, 26);
-                border-radius: 4px;
-                padding: 10px 12px;
-                color: #cccccc;
-            }
-            QLineEdit:focus {
-                border-color: #7828dc;
-                background: rgba(0, 0, 0, 204);
-            }
-        """)
+        self.entry_axion.setObjectName("input")
+        self.entry_axion.setProperty("variant", "large")
         card_layout.addWidget(self.entry_axion)
         
         # Save button
-        btn_save = QPushButton("Salvar Version.json")
+        btn_save = QPushButton("Salvar Versões")
         btn_save.setFont(QFont("Segoe UI", 11, QFont.DemiBold))
         btn_save.setCursor(Qt.PointingHandCursor)
-        btn_save.setStyleSheet("""
-            QPushButton {
-                background: rgba(120, 40, 220, 128);
-                border: 1px solid rgba(150, 50, 255, 153);
-                border-radius: 4px;
-                padding: 11px 20px;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background: rgba(130, 50, 220, 179);
-                border-color: rgba(180, 80, 255, 230);
-            }
-        """)
+        btn_save.setObjectName("primaryButton")
+        btn_save.setProperty("variant", "large")
         btn_save.clicked.connect(self.salvar_version)
         card_layout.addWidget(btn_save)
         
-        self.content_layout.addWidget(card)
-        self.content_layout.addStretch()
+        return self.wrap_page(card)
     
     # ===== METHODS =====
     
@@ -586,18 +1319,108 @@ class EditorWindow(QWidget):
             return
         
         frase = f"{PREFIXOS[self.combo_tipo.currentText()]} {texto}"
-        self.dados_changelog["changes"].append(frase)
-        self.atualizar_lista()
+        self.changelog_model.append(frase)
+        self.listbox.scrollToBottom()
         self.entry_texto.clear()
     
+    def menu_importar(self):
+        menu = QMenu(self)
+        menu.setObjectName("importMenu")
+        menu.addAction("Colar texto...", self.importar_texto)
+        menu.addAction("Arquivo...", self.importar_arquivo)
+        menu.exec_(self.btn_import.mapToGlobal(QPoint(0, self.btn_import.height())))
+    
+    def importar_texto(self):
+        texto, ok = QInputDialog.getMultiLineText(
+            self,
+            "Importar entradas",
+            "Uma entrada por linha (lista Markdown, git log ou texto):",
+            QApplication.clipboard().text()
+        )
+        if ok:
+            self.inserir_entradas(texto)
+    
+    def importar_arquivo(self):
+        caminho, _ = QFileDialog.getOpenFileName(
+            self, "Importar entradas", BASE_DIR, "Texto (*.txt *.md *.log);;Todos (*)"
+        )
+        if caminho:
+            from axion_import import read_import_file
+            self.inserir_entradas(read_import_file(caminho))
+    
+    def colar_entradas(self):
+        self.inserir_entradas(QApplication.clipboard().text())
+    
+    def inserir_entradas(self, texto):
+        # Linhas sem categoria detectável usam a do combo; tudo entra após a linha selecionada
+        from axion_import import parse_entries
+        entradas = parse_entries(texto, self.combo_tipo.currentText())
+        if not entradas:
+            QMessageBox.warning(self, "Aviso", "Nenhuma entrada encontrada no texto.")
+            return
+        
+        atual = self.linha_atual()
+        row = atual + 1 if atual >= 0 else len(self.dados_changelog["changes"])
+        self.changelog_model.insert_many(row, entradas)
+        self.selecionar_linha(row)
+        self.listbox.scrollTo(self.listbox.currentIndex())
+    
     def atualizar_lista(self):
-        self.listbox.clear()
-        for item in self.dados_changelog["changes"]:
-            list_item = QListWidgetItem(f"⋮⋮  {item}")
-            self.listbox.addItem(list_item)
+        # Recarrega a lista inteira: só quando dados_changelog["changes"] é substituído
+        self.changelog_model.set_changes(self.dados_changelog["changes"])
+    
+    def filtrando(self):
+        return self.listbox.model() is self.filter_model
+    
+    def linha_atual(self):
+        index = self.listbox.currentIndex()
+        if not index.isValid():
+            return -1
+        if self.filtrando():
+            return self.filter_model.source_row(index.row())
+        return index.row()
+    
+    def selecionar_linha(self, row):
+        if self.filtrando():
+            row = self.filter_model.filter_row(row)
+            self.listbox.setCurrentIndex(self.filter_model.index(row) if row >= 0 else QModelIndex())
+            return
+        self.listbox.setCurrentIndex(self.changelog_model.index(row))
+    
+    def filtrar(self, *args):
+        categoria = self.combo_filtro.currentText() if self.combo_filtro.currentIndex() > 0 else None
+        consulta = self.entry_busca.text()
+        rows = self.changelog_model.search(consulta, categoria)
+        
+        if rows is None:
+            if self.filtrando():
+                selecionada = self.linha_atual()
+                self.filter_model.clear()
+                self.listbox.setModel(self.changelog_model)
+                self.listbox.setDragDropMode(QListView.InternalMove)
+                if selecionada >= 0:
+                    self.selecionar_linha(selecionada)
+            return
+        
+        historico = []
+        if self.check_historico.isChecked():
+            if self.archive_search is None:
+                from axion_archive import changes_since
+                from axion_search import ArchiveSearch
+                self.archive_search = ArchiveSearch(changes_since(None))
+            historico = self.archive_search.search(consulta, categoria)
+        
+        selecionada = self.linha_atual()
+        self.filter_model.set_results(rows, historico, consulta, categoria)
+        if not self.filtrando():
+            # Reordenar só faz sentido na lista completa
+            self.listbox.setModel(self.filter_model)
+            self.listbox.setDragDropMode(QListView.NoDragDrop)
+        if selecionada >= 0:
+            self.selecionar_linha(selecionada)
     
     def editar_item(self):
-        current_row = self.listbox.currentRow()
+        current_row = self.linha_atual()
         if current_row < 0:
             QMessageBox.warning(self, "Aviso", "Selecione um item para editar.")
             return
@@ -605,13 +1428,7 @@ class EditorWindow(QWidget):
         texto_atual = self.dados_changelog["changes"][current_row]
         
         # Remove prefixo para edição
-        prefixo_encontrado = ""
-        texto_limpo = texto_atual
-        for key, prefixo in PREFIXOS.items():
-            if texto_atual.startswith(prefixo):
-                prefixo_encontrado = key
-                texto_limpo = texto_atual[len(prefixo):].strip()
-                break
+        prefixo_encontrado, texto_limpo = split_prefix(texto_atual)
         
         texto_novo, ok = QInputDialog.getText(
             self, 
@@ -627,58 +1444,224 @@ class EditorWindow(QWidget):
             else:
                 novo_texto = texto_novo.strip()
             
-            self.dados_changelog["changes"][current_row] = novo_texto
-            self.atualizar_lista()
-            self.listbox.setCurrentRow(current_row)
+            # Entrada sem prefixo do PREFIXOS (nem detalhe "•") não passaria na publicação
+            erro = validate_entry(novo_texto)
+            if erro:
+                QMessageBox.warning(self, "Aviso", f"Entrada inválida: {erro}")
+                return
+            
+            self.changelog_model.replace(current_row, novo_texto)
     
     def mover_cima(self):
-        current_row = self.listbox.currentRow()
+        current_row = self.linha_atual()
         if current_row <= 0:
             return
         
-        # Swap
-        self.dados_changelog["changes"][current_row], self.dados_changelog["changes"][current_row - 1] = \
-            self.dados_changelog["changes"][current_row - 1], self.dados_changelog["changes"][current_row]
-        
-        self.atualizar_lista()
-        self.listbox.setCurrentRow(current_row - 1)
+        self.changelog_model.move(current_row, current_row - 1)
+        self.selecionar_linha(current_row - 1)
     
     def mover_baixo(self):
-        current_row = self.listbox.currentRow()
+        current_row = self.linha_atual()
         if current_row < 0 or current_row >= len(self.dados_changelog["changes"]) - 1:
             return
         
-        # Swap
-        self.dados_changelog["changes"][current_row], self.dados_changelog["changes"][current_row + 1] = \
-            self.dados_changelog["changes"][current_row + 1], self.dados_changelog["changes"][current_row]
-        
-        self.atualizar_lista()
-        self.listbox.setCurrentRow(current_row + 1)
+        self.changelog_model.move(current_row, current_row + 2)
+        self.selecionar_linha(current_row + 1)
     
     def remover_item(self):
-        current_row = self.listbox.currentRow()
+        current_row = self.linha_atual()
         if current_row >= 0:
-            del self.dados_changelog["changes"][current_row]
-            self.atualizar_lista()
+            self.changelog_model.remove(current_row)
+    
+    def desfazer(self):
+        row = self.changelog_model.undo()
+        if row >= 0:
+            self.selecionar_linha(row)
+    
+    def refazer(self):
+        row = self.changelog_model.redo()
+        if row >= 0:
+            self.selecionar_linha(row)
+    
+    # ===== ALTERAÇÕES EXTERNAS =====
+    
+    def verificar_arquivos(self):
+        watched = self.watcher.files()
+        for path in (CHANGELOG_PATH, VERSION_PATH, CHANNELS_PATH):
+            if path not in watched and os.path.exists(path):
+                self.watcher.addPath(path)
+        
+        if self.arquivo_mudou(CHANGELOG_PATH):
+            self.recarregar_changelog()
+        # Os dois sempre: o stamp de cada um precisa ser atualizado
+        version_mudou = self.arquivo_mudou(VERSION_PATH)
+        if self.arquivo_mudou(CHANNELS_PATH) or version_mudou:
+            self.recarregar_version()
+    
+    def arquivo_mudou(self, path):
+        stamp = file_stamp(path)
+        if stamp == self.disk_stamps.get(path):
+            return False
+        self.disk_stamps[path] = stamp
+        return stamp is not None
+    
+    def ler_externo(self, path):
+        try:
+            return load_json(path, None)
+        except (OSError, ValueError):
+            # Escrita externa pela metade: relê no próximo evento
+            self.disk_stamps[path] = None
+            return None
+    
+    def recarregar_changelog(self):
+        written = self.autosave.last_written
+        if written is not None and self.disk_stamps[CHANGELOG_PATH] == self.autosave.written_stamp:
+            # Nossa própria gravação (mesmo stat de logo depois dela): nada a reler
+            self.base_changes = list(written["changes"])
+            return
+        
+        dados = self.ler_externo(CHANGELOG_PATH)
+        if not isinstance(dados, dict) or not isinstance(dados.get("changes"), list):
+            return
+        theirs = dados["changes"]
+        
+        if written is not None and written["changes"] == theirs:
+            # Nossa gravação, com o stat ainda por chegar do worker
+            self.base_changes = list(theirs)
+            return
+        if theirs == self.base_changes:
+            return
+        
+        ours = self.dados_changelog["changes"]
+        if ours == self.base_changes:
+            merged, conflitos = list(theirs), 0
+        else:
+            from axion_merge import merge3
+            merged, conflitos = merge3(self.base_changes, ours, theirs)
+        self.base_changes = list(theirs)
+        for key, value in dados.items():
+            if key != "changes":
+                self.dados_changelog[key] = value
+        
+        model = self.changelog_model
+        row = self.linha_atual()
+        doc_id = model.ids[row] if row >= 0 else None
+        model.sync_to(merged)
+        if doc_id in model.ids:
+            self.selecionar_linha(model.ids.index(doc_id))
+        
+        if merged == theirs:
+            # Nada a gravar: a validação do conteúdo relido fica aqui mesmo (já houve o parse inteiro)
+            self.autosave.problemas = validate_changelog(self.dados_changelog)
+            self.autosave.discard()
+            self.atualizar_status("saved", "Recarregado do disco")
+        else:
+            self.autosave.schedule()
+            texto = f"Mesclado ({conflitos} conflito{'s' if conflitos > 1 else ''})" if conflitos else "Mesclado com o disco"
+            self.atualizar_status("pending", texto)
+    
+    def recarregar_version(self):
+        dados = self.ler_externo(VERSION_PATH)
+        if isinstance(dados, dict):
+            self.dados_version = dados
+        if self.canais is None:
+            # Aba Versão ainda não aberta: os canais são lidos quando ela abrir
+            return
+        from axion_channels import load_channels
+        try:
+            canais = load_channels()
+        except (OSError, ValueError):
+            self.disk_stamps[CHANNELS_PATH] = None
+            return
+        if canais == self.canais:
+            return
+        antigo = self.canais.get(self.canal_atual, {})
+        self.canais = canais
+        
+        self.combo_canal.blockSignals(True)
+        self.combo_canal.clear()
+        self.combo_canal.addItems(list(canais))
+        self.combo_canal.blockSignals(False)
+        if self.canal_atual not in canais:
+            self.combo_canal.setCurrentText(DEFAULT_CHANNEL)
+            self.trocar_canal(DEFAULT_CHANNEL)
+            return
+        self.combo_canal.setCurrentText(self.canal_atual)
+        # Campos da aba Versão: só troca o que o usuário não estiver editando
+        canal = canais[self.canal_atual]
+        for entry, key in ((self.entry_game, "game_version"), (self.entry_axion, "axion_release")):
+            if entry.text().strip() == antigo.get(key, ""):
+                entry.setText(canal[key])
+    
+    def snapshot_changelog(self):
+        # Alterações externas ainda não processadas entram antes (a gravação não as sobrescreve)
+        self.verificar_arquivos()
+        # Cópia rasa: o worker valida e serializa sem disputar a lista com a UI
+        return {**self.dados_changelog, "changes": list(self.dados_changelog["changes"])}
     
     def salvar_changelog(self):
-        # Atualiza ordem baseado no drag & drop
-        nova_ordem = []
-        for i in range(self.listbox.count()):
-            texto = self.listbox.item(i).text()
-            # Remove o handle "⋮⋮  "
-            texto_limpo = texto.replace("⋮⋮  ", "")
-            nova_ordem.append(texto_limpo)
-        
-        self.dados_changelog["changes"] = nova_ordem
-        save_json(CHANGELOG_PATH, self.dados_changelog)
-        QMessageBox.information(self, "Sucesso", "changelog.json atualizado")
+        # Grava já (sem esperar o autosave); o resultado aparece no indicador de status
+        self.autosave.save_now()
+    
+    def atualizar_status(self, estado, texto):
+        dica = texto
+        problemas = self.autosave.problemas
+        if estado == "saved" and problemas:
+            n = len(problemas)
+            estado = "warning"
+            texto = f"{texto} · {n} problema{'s' if n > 1 else ''}"
+            dica = "\n".join(problemas[:10] + ([f"... e mais {n - 10}"] if n > 10 else []))
+        self.save_status.setText(texto)
+        self.save_status.setToolTip(dica)
+        self.save_status.setProperty("state", estado)
+        self.save_status.style().unpolish(self.save_status)
+        self.save_status.style().polish(self.save_status)
+    
+    def trocar_canal(self, nome):
+        if nome not in self.canais:
+            return
+        self.canal_atual = nome
+        self.entry_game.setText(self.canais[nome]["game_version"])
+        self.entry_axion.setText(self.canais[nome]["axion_release"])
+    
+    def novo_canal(self):
+        nome, ok = QInputDialog.getText(self, "Novo canal", "Nome do canal (ex: beta):")
+        nome = nome.strip().lower()
+        if not ok or not nome:
+            return
+        from axion_channels import new_channel, validate_channel_name
+        erro = validate_channel_name(nome, self.canais)
+        if erro:
+            QMessageBox.warning(self, "Aviso", erro.capitalize())
+            return
+        # Começa com as versões do canal aberto; só vai para o disco no Salvar
+        atual = self.canais[self.canal_atual]
+        self.canais[nome] = new_channel(nome, atual["game_version"], atual["axion_release"])
+        self.combo_canal.addItem(nome)
+        self.combo_canal.setCurrentText(nome)
     
     def salvar_version(self):
-        self.dados_version["game_version"] = self.entry_game.text().strip()
-        self.dados_version["axion_release"] = self.entry_axion.text().strip()
-        save_json(VERSION_PATH, self.dados_version)
-        QMessageBox.information(self, "Sucesso", "version.json atualizado")
+        from axion_channels import save_channels, channel_path, write_outputs
+        
+        self.verificar_arquivos()
+        canal = self.canais[self.canal_atual]
+        novo = {"game_version": self.entry_game.text().strip(), "axion_release": self.entry_axion.text().strip()}
+        # A release do canal não volta para trás em relação ao version.json atual
+        erros = validate_version(novo, load_json(channel_path(canal, "version"), {}))
+        if erros:
+            QMessageBox.warning(self, "Aviso", "\n".join(erros))
+            return
+        canal.update(novo)
+        # channels.json e o version.json de cada canal numa passada
+        alterado = save_channels(self.canais)
+        alterados = write_outputs(self.canais)
+        self.dados_version = load_json(VERSION_PATH, self.dados_version)
+        for path in (VERSION_PATH, CHANNELS_PATH):
+            self.disk_stamps[path] = file_stamp(path)
+        QMessageBox.information(
+            self, "Sucesso",
+            f"Canal {self.canal_atual} atualizado" if alterado or alterados else "Versões já estavam atualizadas"
+        )
     
     # ===== DRAG =====
     
@@ -690,11 +1673,29 @@ class EditorWindow(QWidget):
         if event.buttons() == Qt.LeftButton and self._drag_pos:
             self.move(self.pos() + event.globalPos() - self._drag_pos)
             self._drag_pos = event.globalPos()
+    
+    def closeEvent(self, event):
+        self.autosave.flush()
+        super().closeEvent(event)
+
+instrument(EditorWindow, TRACED_ACTIONS, TRACE)
 
 # ================= MAIN =================
 
 if __name__ == "__main__":
+    os.chdir(BASE_DIR)
+    trace = StartupTrace(_T_START, _T_IMPORTS) if STARTUP_TRACE else None
+    
+    t = time.perf_counter()
     app = QApplication(sys.argv)
-    window = EditorWindow()
+    if trace:
+        trace.mark("QApplication", t)
+    
+    t = time.perf_counter()
+    window = EditorWindow(startup_trace=trace)
+    if trace:
+        trace.mark("EditorWindow.__init__", t)
+        trace.watch()
+    
     window.show()
     sys.exit(app.exec_())
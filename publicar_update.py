@@ -0,0 +1,303 @@
+"""
+Axion Update - Publicador
+Versão headless do publicar_update.bat (sem PyQt5 nem PowerShell, roda também em Linux):
+atualiza o canal no channels.json, valida o changelog, gera os artefatos, regera o version.json
+de todos os canais e envia só os arquivos alterados.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from contextlib import contextmanager
+
+from axion_common import (
+    BASE_DIR, VERSION_RE, load_json
+)
+from axion_validate import validate_changelog, validate_version
+from axion_publish import DELTA_MEMORY, generate_artifacts
+from axion_archive import append_release, archive_entry
+from axion_integrity import load_secret
+from axion_trace import from_env as trace_from_env
+from axion_store import ArtifactStore, store_release, pinned_hashes
+from axion_manifest import client_paths, write_notes, format_report, print_report
+from axion_channels import (
+    CHANNELS_PATH, DEFAULT_CHANNEL,
+    load_channels, save_channels, new_channel, validate_channel_name,
+    channel_path, channel_manifest, load_manifests, write_outputs
+)
+
+DELTA_RELEASES = 5
+
+# ================= GIT =================
+
+def git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=BASE_DIR, capture_output=True, text=True
+    )
+
+def committed_manifest(path):
+    # version.json da última release commitada (um blob só, sem status da árvore)
+    result = git("show", f"HEAD:{os.path.relpath(path, BASE_DIR).replace(os.sep, '/')}")
+    if result.returncode != 0:
+        return {}
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
+        return {}
+
+def artifact_paths(previous, manifest):
+    """
+    Artefatos que a geração realmente alterou, comparando as entradas do manifesto com as da
+    release commitada: um binário com o mesmo SHA-256 não é passado ao git (o filtro do LFS
+    rehashearia o arquivo inteiro só para descobrir que nada mudou).
+    """
+    paths = []
+    for key in ("binary", "chunks"):
+        entry = manifest.get(key)
+        old = previous.get(key) or {}
+        if entry and (entry["sha256"] != old.get("sha256") or entry["file"] != old.get("file")):
+            paths.append(entry["file"])
+    old_deltas = previous.get("deltas", [])
+    paths.extend(delta["file"] for delta in manifest.get("deltas", []) if delta not in old_deltas)
+    return [os.path.join(BASE_DIR, p) for p in paths]
+
+def stage(paths):
+    # Só os caminhos informados: nada de `git add .` nem status da árvore inteira.
+    # Retorna os que realmente mudaram (já adicionados ao índice)
+    paths = sorted({os.path.relpath(p, BASE_DIR) for p in paths})
+    existing = [p for p in paths if os.path.exists(os.path.join(BASE_DIR, p))]
+    if existing:
+        add = git("add", "--", *existing)
+        if add.returncode != 0:
+            raise RuntimeError(add.stderr.strip() or "git add falhou")
+    return git("diff", "--cached", "--name-only", "--", *paths).stdout.splitlines()
+
+# ================= CANAIS =================
+
+def new_channel_game(channels, game=None):
+    # Versão do jogo de um canal novo: --game, senão a do canal padrão (ou do primeiro que existir)
+    if game:
+        return game
+    base = channels.get(DEFAULT_CHANNEL) or next(iter(channels.values()), {})
+    return base.get("game_version", "")
+
+# ================= ETAPAS =================
+
+class Steps:
+    # Tempo de cada etapa da publicação, impresso no fim (e no trace, se ligado)
+    def __init__(self, tracer=None):
+        self.timings = []
+        self.tracer = tracer
+
+    @contextmanager
+    def __call__(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.timings.append((name, end - start))
+            if self.tracer:
+                self.tracer.record(name, start, end, cat="publish")
+
+    def report(self):
+        print("Tempos:")
+        for name, seconds in self.timings:
+            print(f"  {name:<12} {seconds * 1000:9.1f} ms")
+        print(f"  {'total':<12} {sum(s for _, s in self.timings) * 1000:9.1f} ms")
+
+# ================= MAIN =================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publica uma nova versão do Axion")
+    parser.add_argument("versao", nargs="?", help="nova versão do Axion (ex: 1.0.4)")
+    parser.add_argument("--canal", default=DEFAULT_CHANNEL, help="canal da release (padrão: stable)")
+    parser.add_argument("--game", help="nova versão do jogo")
+    parser.add_argument("--base", help="Axion.exe da release anterior (padrão: a do store local)")
+    parser.add_argument("--de", help="versão da release anterior (padrão: a atual do canal)")
+    parser.add_argument("--deltas", type=int, default=DELTA_RELEASES, metavar="N",
+                        help=f"gera deltas das N releases mais recentes do canal no store (padrão: {DELTA_RELEASES})")
+    parser.add_argument("--memoria-delta", type=int, default=DELTA_MEMORY >> 20, metavar="MB",
+                        help="teto de memória de cada worker de delta")
+    parser.add_argument("--sem-artefatos", action="store_true", help="não gera hash/chunks/delta")
+    parser.add_argument("--sem-assinatura", action="store_true")
+    parser.add_argument("--sem-push", action="store_true")
+    parser.add_argument("--trace", metavar="ARQUIVO",
+                        help="grava trace-event JSON e histogramas das etapas (ou AXION_TRACE)")
+    args = parser.parse_args(argv)
+
+    if git("rev-parse", "--is-inside-work-tree").returncode != 0:
+        print("ERRO: Esta pasta nao e um repositorio Git.")
+        return 1
+
+    versao = args.versao
+    if not versao and sys.stdin.isatty():
+        versao = input("Digite a nova versao do Axion (ex: 1.0.4): ").strip()
+    if not versao or not VERSION_RE.match(versao):
+        print("Versao invalida.")
+        return 1
+
+    tracer = trace_from_env(args.trace)
+    steps = Steps(tracer)
+    # Arquivos da release que vão para o git: manifestos pequenos (o git confere se mudaram)
+    # e só os artefatos grandes que mudaram em relação à release commitada
+    written = []
+
+    with steps("validacao"):
+        channels = load_channels()
+        nome = args.canal
+        if nome not in channels:
+            erro = validate_channel_name(nome)
+            if erro:
+                print(f"ERRO: {erro}")
+                return 1
+            game = new_channel_game(channels, args.game)
+            if not game:
+                print(f"ERRO: informe --game para criar o canal {nome}")
+                return 1
+            print(f"Criando o canal {nome}...")
+            channels[nome] = new_channel(nome, game)
+        canal = channels[nome]
+
+        changelog_path = channel_path(canal, "changelog")
+        changelog = load_json(changelog_path, {"changes": []})
+        erros = validate_changelog(changelog)
+        if erros:
+            print(f"ERRO: {canal['changelog']} invalido:")
+            for erro in erros:
+                print(f"  {erro}")
+            return 1
+        # Release só avança em relação à publicada no version.json do canal
+        publicado = load_json(channel_path(canal, "version"), {})
+        erros = validate_version(
+            {"game_version": args.game or canal["game_version"], "axion_release": versao}, publicado
+        )
+        if erros:
+            print("ERRO: versao invalida:")
+            for erro in erros:
+                print(f"  {erro}")
+            return 1
+        # Entrada do usuário (editada fora do publicador): o git decide se mudou
+        written.append(changelog_path)
+
+    print(f"Publicando atualizacao da versao {versao} no canal {nome}...")
+
+    anterior = canal["axion_release"]
+    canal["axion_release"] = versao
+    if args.game:
+        canal["game_version"] = args.game
+    manifest = channel_manifest(nome, canal, channels)
+
+    # Notas desta release no histórico (clientes que pularam versões leem tudo desde a instalada)
+    with steps("historico"):
+        archive_dir = channel_path(canal, "archive")
+        append_release(versao, canal["game_version"], changelog["changes"], archive_dir)
+        manifest["changelog_archive"] = archive_entry(archive_dir)
+        written.extend(os.path.join(BASE_DIR, manifest["changelog_archive"][key]) for key in ("data", "index"))
+
+    binary_path = channel_path(canal, "binary")
+    artefatos = not args.sem_artefatos and os.path.exists(binary_path)
+    store = ArtifactStore()
+    if artefatos:
+        with steps("artefatos"):
+            secret = None if args.sem_assinatura else load_secret()
+            if secret is None and not args.sem_assinatura:
+                print("AVISO: chave de assinatura nao encontrada - binario publicado sem assinatura")
+            # Binário idêntico ao da release anterior ou ao de outro canal reaproveita o índice de chunks
+            shared = list(load_manifests(channels).values())
+            # Bases dos deltas lidas do store local (sem buscar releases antigas no histórico do LFS):
+            # a anterior (--de) e as N mais recentes do canal, todas geradas ao mesmo tempo
+            de = args.de or anterior
+            base = args.base
+            if not base and de and de != versao:
+                base = store.find_release(de, nome)
+                if base is None:
+                    print(f"AVISO: release {de} nao esta no store local - sem delta a partir dela")
+            bases = [(rel, path) for rel, _, path in store.recent_releases(nome, args.deltas, exclude=(versao,))]
+            spans = {}
+            generate_artifacts(manifest, binary_path, base, de, secret, shared,
+                               bases, args.memoria_delta << 20, spans)
+            if tracer:
+                # Início e fim reais de cada estágio (hash, chunks e deltas rodam em paralelo)
+                for etapa, (inicio, fim) in spans.items():
+                    if etapa != "total":
+                        tracer.record(f"artefatos.{etapa}", inicio, fim, cat="publish")
+            # Comparado com o commitado (não com o disco): uma publicação interrompida antes do
+            # commit ainda leva o binário novo na próxima tentativa
+            written.extend(artifact_paths(committed_manifest(channel_path(canal, "version")), manifest))
+
+    with steps("manifestos"):
+        # Notas da release comprimidas à parte: o client.json só aponta para elas
+        version_path = channel_path(canal, "version")
+        notes_path = client_paths(version_path)[1]
+        write_notes(changelog, notes_path)
+        written.append(notes_path)
+
+        # Uma passada: channels.json, version.json e client.json de todos os canais
+        save_channels(channels)
+        write_outputs(channels, {nome: manifest})
+        written.append(CHANNELS_PATH)
+        for channel in channels.values():
+            channel_version = channel_path(channel, "version")
+            written.extend((channel_version, client_paths(channel_version)[0], channel_path(channel, "changelog")))
+    print_report(format_report(version_path, changelog_path))
+
+    if artefatos:
+        with steps("store"):
+            # Binário e chunks desta release guardados para os próximos deltas / rollback; a retenção
+            # nunca remove a release atual de nenhum canal
+            try:
+                store_release(store, manifest, nome, binary_path)
+                for sha256 in store.evict(pinned_hashes(load_manifests(channels).values())):
+                    print(f"Store: removido {sha256[:12]}")
+                store.save()
+            except (OSError, ValueError) as e:
+                print(f"AVISO: store local nao atualizado: {e}")
+
+    with steps("git add"):
+        try:
+            changed = stage(written)
+        except RuntimeError as e:
+            print(f"ERRO ao adicionar os arquivos ao Git: {e}")
+            return 1
+    if tracer:
+        tracer.count("git.arquivos", len(changed))
+
+    mensagem = f"Update Axion para versao {versao}"
+    if nome != DEFAULT_CHANNEL:
+        mensagem = f"Update Axion ({nome}) para versao {versao}"
+    if not changed:
+        print("Nenhuma alteracao detectada. Nada para commitar.")
+    else:
+        with steps("commit"):
+            commit = git("commit", "-m", mensagem, "--", *changed)
+        if commit.returncode != 0:
+            print("ERRO ao criar o commit.")
+            if commit.stderr.strip():
+                print(commit.stderr.strip())
+            return 1
+        print(f"Commit criado com sucesso ({len(changed)} arquivos).")
+
+    if args.sem_push:
+        steps.report()
+        return 0
+
+    print("Enviando para o GitHub...")
+    with steps("push"):
+        push = subprocess.run(["git", "push"], cwd=BASE_DIR)
+    if push.returncode != 0:
+        print("ERRO ao enviar para o GitHub.")
+        print("Execute antes:")
+        print("  git pull --rebase")
+        print("e depois rode este script novamente.")
+        return 1
+
+    steps.report()
+    print("Publicacao concluida com sucesso.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import os
+import sys
+import random
+
+import pytest
+
+# Ferramentas ficam na raiz do repositório (sem pacote)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _random_bytes(rng, size):
+    return bytes(rng.getrandbits(8) for _ in range(size))
+
+
+# Layouts de release: (tamanho da antiga, nova a partir da antiga)
+RELEASE_LAYOUTS = {
+    # Trecho alterado no meio, bloco inserido e fim cortado
+    "editada": (300_000, lambda rng, old: (
+        old[:100_000] + b"novo" * 500 + old[100_000:250_000] + bytes(5000) + old[260_000:290_000]
+    )),
+    # Trecho aleatório inserido: desloca tudo o que vem depois
+    "inserida": (600_000, lambda rng, old: old[:200_000] + _random_bytes(rng, 30_000) + old[200_000:]),
+    # Release pequena com um trecho inserido
+    "pequena": (200_000, lambda rng, old: old[:50_000] + b"novo" * 1000 + old[50_000:]),
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "releases(seed, layout): semente e layout do fixture releases")
+
+
+@pytest.fixture
+def write_binary():
+    def write(path, data):
+        with open(path, "wb") as f:
+            f.write(data)
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def releases(request, tmp_path, write_binary):
+    """
+    (1.0.exe, 1.1.exe) gerados de uma semente fixa. Semente e layout vêm do marcador
+    releases do módulo ou do teste: pytestmark = pytest.mark.releases(2, "inserida")
+    """
+    marker = request.node.get_closest_marker("releases")
+    seed, layout = marker.args if marker else (1, "editada")
+    size, derive = RELEASE_LAYOUTS[layout]
+    rng = random.Random(seed)
+    old = _random_bytes(rng, size)
+    return (
+        write_binary(tmp_path / "1.0.exe", old),
+        write_binary(tmp_path / "1.1.exe", derive(rng, old)),
+    )
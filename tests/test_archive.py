@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from axion_archive import (
+    DATA_NAME, INDEX_NAME, append_release, changes_since, read_index, release_notes
+)
+
+
+def _notes(archive):
+    return [(r["release"], r["changes"]) for r in changes_since(None, archive)]
+
+
+def test_append_and_read_since(tmp_path):
+    archive = str(tmp_path)
+    for release in ("1.0", "1.1", "1.2.1"):
+        assert append_release(release, "9.0", [f"[ + ] {release}"], archive)
+    assert [r["release"] for r in changes_since("1.0", archive)] == ["1.1", "1.2.1"]
+    assert changes_since("1.2.1", archive) == []
+    assert release_notes("1.1", archive)["changes"] == ["[ + ] 1.1"]
+
+
+def test_republish_replaces_only_last_record(tmp_path):
+    archive = str(tmp_path)
+    append_release("1.0", "9.0", ["a"], archive)
+    append_release("1.1", "9.0", ["b"], archive)
+    assert not append_release("1.1", "9.0", ["b"], archive)
+    assert append_release("1.1", "9.0", ["b", "c"], archive)
+    assert _notes(archive) == [("1.0", ["a"]), ("1.1", ["b", "c"])]
+    with pytest.raises(ValueError):
+        append_release("1.0.5", "9.0", ["x"], archive)
+
+
+def test_interrupted_append_is_truncated(tmp_path):
+    archive = str(tmp_path)
+    append_release("1.0", "9.0", ["a"], archive)
+    data_path = os.path.join(archive, DATA_NAME)
+    size = os.path.getsize(data_path)
+    # Append interrompido antes do índice: bytes soltos depois do último registro indexado
+    with open(data_path, "ab") as f:
+        f.write(b'{"release":"1.1","game_vers')
+
+    assert _notes(archive) == [("1.0", ["a"])]
+    append_release("1.1", "9.0", ["b"], archive)
+    assert _notes(archive) == [("1.0", ["a"]), ("1.1", ["b"])]
+    assert read_index(archive)[-1][1] == size
+
+
+def test_corrupted_index_is_reported(tmp_path):
+    archive = str(tmp_path)
+    append_release("1.0", "9.0", ["a"], archive)
+    with open(os.path.join(archive, INDEX_NAME), "ab") as f:
+        f.write(b"\0\0\0")
+    with pytest.raises(ValueError):
+        read_index(archive)
@@ -0,0 +1,68 @@
+import os
+import json
+
+import pytest
+
+import axion_common
+import axion_channels
+from axion_channels import (
+    load_channels, save_channels, new_channel, validate_channel_name, write_outputs
+)
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    monkeypatch.setattr(axion_channels, "BASE_DIR", str(tmp_path))
+    monkeypatch.setattr(axion_common, "BASE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_channels_round_trip_stores_only_custom_paths(root):
+    path = str(root / "channels.json")
+    beta = new_channel("beta", "2.0", "1.1")
+    beta["binary"] = "builds/beta.exe"
+    save_channels({"beta": beta, "stable": new_channel("stable", "2.0", "1.0")}, path)
+
+    assert _read(path) == {"channels": {
+        "beta": {"game_version": "2.0", "axion_release": "1.1", "binary": "builds/beta.exe"},
+        "stable": {"game_version": "2.0", "axion_release": "1.0"},
+    }}
+    channels = load_channels(path)
+    assert list(channels) == ["stable", "beta"]
+    assert channels["beta"]["version"] == "channels/beta/version.json"
+    assert channels["beta"]["binary"] == "builds/beta.exe"
+
+
+def test_validate_channel_name():
+    assert validate_channel_name("beta-2") is None
+    assert validate_channel_name("Beta") is not None
+    assert validate_channel_name("../x") is not None
+    assert validate_channel_name("beta", {"beta": {}}) is not None
+
+
+def test_write_outputs(root):
+    binary = {"file": "Axion.exe", "size": 10, "sha256": "b" * 64}
+    (root / "version.json").write_text(json.dumps({"game_version": "1.9", "axion_release": "1.0", "binary": binary}))
+    channels = {"stable": new_channel("stable", "2.0", "1.0"), "beta": new_channel("beta", "2.0", "1.1")}
+    changed = {os.path.relpath(p, root) for p in write_outputs(channels)}
+
+    stable = _read(root / "version.json")
+    assert stable == {
+        "game_version": "2.0", "axion_release": "1.0", "binary": binary,
+        "channels": {"beta": "channels/beta/version.json"},
+    }
+    beta = _read(root / "channels" / "beta" / "version.json")
+    assert beta == {"game_version": "2.0", "axion_release": "1.1", "channel": "beta"}
+    assert _read(root / "channels" / "beta" / "changelog.json") == {"changes": []}
+    assert {
+        "version.json", "changelog.json",
+        os.path.join("channels", "beta", "version.json"),
+        os.path.join("channels", "beta", "changelog.json"),
+    } <= changed
+    assert write_outputs(channels) == []
+
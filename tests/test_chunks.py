@@ -0,0 +1,79 @@
+import os
+import random
+
+import pytest
+
+from axion_chunks import chunk_data, build_index, write_index, read_index, plan_fetch, assemble, MIN_SIZE, MAX_SIZE
+
+pytestmark = pytest.mark.releases(2, "inserida")
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _fetcher(path, log):
+    def fetch_range(offset, length):
+        log.append((offset, length))
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+    return fetch_range
+
+
+def test_index_round_trip(tmp_path, releases):
+    _, new = releases
+    index = build_index(new)
+    assert index["size"] == os.path.getsize(new)
+    assert all(length <= MAX_SIZE for _, length, _ in index["chunks"])
+    assert all(length >= MIN_SIZE for _, length, _ in index["chunks"][:-1])
+
+    path = str(tmp_path / "novo.axc")
+    write_index(index, path)
+    assert read_index(path) == index
+
+
+def test_assemble_reuses_local_chunks(tmp_path, releases):
+    old, new = releases
+    index = build_index(new)
+    log = []
+    out = str(tmp_path / "saida.exe")
+    reuse, fetch = assemble(index, old, _fetcher(new, log), out)
+
+    assert _read(out) == _read(new)
+    assert log == fetch
+    # Só a vizinhança da inserção é baixada
+    assert reuse and sum(length for _, length in fetch) < os.path.getsize(new) // 2
+
+
+def test_assemble_without_local_copy_fetches_everything(tmp_path, releases):
+    _, new = releases
+    index = build_index(new)
+    reuse, fetch = plan_fetch(index, str(tmp_path / "nao_existe.exe"))
+    assert reuse == [] and fetch == [(0, index["size"])]
+
+
+def test_bad_chunk_is_rejected(tmp_path, releases):
+    old, new = releases
+    index = build_index(new)
+    fetch = _fetcher(new, [])
+
+    def corrupted(offset, length):
+        data = bytearray(fetch(offset, length))
+        data[0] ^= 0xFF
+        return bytes(data)
+
+    out = str(tmp_path / "saida.exe")
+    with pytest.raises(ValueError):
+        assemble(index, old, corrupted, out)
+    assert not os.path.exists(out) and not os.path.exists(out + ".tmp")
+
+
+def test_cut_points_are_stable():
+    # Cortes fixos: índices já publicados só reaproveitam chunks se os cortes nunca mudarem
+    data = random.Random(7).randbytes(1 << 20) + bytes(300_000)
+    assert [size for _, size, _ in chunk_data(data)] == [
+        114170, 58434, 84551, 84192, 103736, 81773, 64112, 70890,
+        66076, 73904, 29116, 69728, 93883, MAX_SIZE, 91867,
+    ]
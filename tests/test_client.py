@@ -0,0 +1,89 @@
+import os
+import hashlib
+import http.client
+
+import pytest
+
+from axion_common import save_json
+from axion_client import download, load_checkpoint
+from axion_server import serve_in_background
+
+RANGE = 16 * 1024
+BINARY = os.urandom(10 * RANGE + 123)
+SHA256 = hashlib.sha256(BINARY).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def published(tmp_path_factory):
+    root = tmp_path_factory.mktemp("publicado")
+    (root / "Axion.exe").write_bytes(BINARY)
+    srv = serve_in_background(str(root))
+    url = f"http://127.0.0.1:{srv.server_address[1]}/Axion.exe"
+    yield root, url
+    srv.shutdown()
+    srv.server_close()
+
+
+def _etag(url):
+    conn = http.client.HTTPConnection(*url.split("/")[2].split(":"), timeout=10)
+    try:
+        conn.request("HEAD", "/Axion.exe")
+        return conn.getresponse().getheader("ETag")
+    finally:
+        conn.close()
+
+
+def _partial(out, url, etag, ranges):
+    # Checkpoint de um download interrompido depois das faixas indicadas
+    part = bytearray(len(BINARY))
+    for start, end in ranges:
+        part[start:end] = BINARY[start:end]
+    with open(out + ".part", "wb") as f:
+        f.write(part)
+    state = load_checkpoint(out, url, len(BINARY), SHA256, RANGE)
+    state.update(etag=etag, done=[list(r) for r in ranges])
+    save_json(out + ".part.json", state, fsync=False)
+
+
+def test_parallel_download(tmp_path, published):
+    _, url = published
+    out = str(tmp_path / "Axion.exe")
+    stats = download(url, out, len(BINARY), SHA256, connections=4, range_size=RANGE)
+    assert open(out, "rb").read() == BINARY
+    assert stats["downloaded"] == len(BINARY) and stats["resumed"] == 0
+    assert not os.path.exists(out + ".part") and not os.path.exists(out + ".part.json")
+
+
+def test_resume_downloads_only_missing_ranges(tmp_path, published):
+    _, url = published
+    out = str(tmp_path / "Axion.exe")
+    done = [(0, RANGE), (3 * RANGE, 4 * RANGE)]
+    _partial(out, url, _etag(url), done)
+
+    stats = download(url, out, len(BINARY), SHA256, connections=2, range_size=RANGE)
+    assert open(out, "rb").read() == BINARY
+    assert stats["resumed"] == 2 * RANGE
+    assert stats["downloaded"] == len(BINARY) - 2 * RANGE
+
+
+def test_resume_after_remote_change_starts_over(tmp_path, published):
+    _, url = published
+    out = str(tmp_path / "Axion.exe")
+    _partial(out, url, '"de-outro-binario"', [(0, RANGE)])
+
+    with pytest.raises(ValueError):
+        download(url, out, len(BINARY), SHA256, connections=2, range_size=RANGE)
+    assert not os.path.exists(out + ".part") and not os.path.exists(out + ".part.json")
+
+    download(url, out, len(BINARY), SHA256, connections=2, range_size=RANGE)
+    assert open(out, "rb").read() == BINARY
+
+
+def test_wrong_hash_keeps_installed_file(tmp_path, published):
+    _, url = published
+    out = tmp_path / "Axion.exe"
+    out.write_bytes(b"instalado")
+    with pytest.raises(ValueError):
+        download(url, str(out), len(BINARY), "0" * 64, range_size=RANGE)
+    assert out.read_bytes() == b"instalado"
+    assert not os.path.exists(str(out) + ".part")
@@ -0,0 +1,44 @@
+import os
+import json
+import stat
+
+import pytest
+
+from axion_common import save_json, write_atomic
+
+
+def test_save_json_skips_identical_content(tmp_path):
+    path = str(tmp_path / "version.json")
+    assert save_json(path, {"axion_release": "1.0"})
+    assert json.load(open(path, encoding="utf-8")) == {"axion_release": "1.0"}
+    before = os.stat(path)
+
+    assert not save_json(path, {"axion_release": "1.0"})
+    after = os.stat(path)
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    assert save_json(path, {"axion_release": "1.1"})
+    assert json.load(open(path, encoding="utf-8")) == {"axion_release": "1.1"}
+    assert os.listdir(tmp_path) == ["version.json"]
+
+
+def test_write_atomic_keeps_file_mode(tmp_path):
+    path = str(tmp_path / "version.json")
+    write_atomic(path, b"{}")
+    old_umask = os.umask(0o022)
+    os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~old_umask
+
+    os.chmod(path, 0o640)
+    write_atomic(path, b"[]")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert open(path, "rb").read() == b"[]"
+
+
+def test_write_atomic_failure_leaves_original(tmp_path):
+    path = str(tmp_path / "version.json")
+    write_atomic(path, b"{}")
+    with pytest.raises(TypeError):
+        write_atomic(path, object())
+    assert open(path, "rb").read() == b"{}"
+    assert os.listdir(tmp_path) == ["version.json"]
@@ -0,0 +1,108 @@
+import os
+import hashlib
+import random
+
+import pytest
+
+from axion_delta import make_delta, apply_delta, register_delta, _scan
+
+pytestmark = pytest.mark.releases(1, "editada")
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_round_trip(tmp_path, releases):
+    base, target = releases
+    delta = str(tmp_path / "a.axd")
+    stats = make_delta(base, target, delta)
+    assert stats["target_sha256"] == hashlib.sha256(_read(target)).hexdigest()
+    assert stats["delta_size"] < os.path.getsize(target) // 4
+
+    out = str(tmp_path / "saida.exe")
+    apply_delta(base, delta, out)
+    assert _read(out) == _read(target)
+
+
+def test_round_trip_in_place(tmp_path, releases):
+    # O cliente aplica sobre o próprio binário instalado
+    base, target = releases
+    delta = str(tmp_path / "a.axd")
+    make_delta(base, target, delta)
+    apply_delta(base, delta, base)
+    assert _read(base) == _read(target)
+
+
+def test_wrong_base_is_rejected(tmp_path, releases, write_binary):
+    base, target = releases
+    delta = str(tmp_path / "a.axd")
+    make_delta(base, target, delta)
+    other = write_binary(tmp_path / "outra.exe", b"x" * 1000)
+    out = str(tmp_path / "saida.exe")
+    with pytest.raises(ValueError):
+        apply_delta(other, delta, out)
+    assert not os.path.exists(out)
+
+
+def test_register_keeps_only_deltas_to_current_binary(tmp_path, releases):
+    base, target = releases
+    delta = str(tmp_path / "a.axd")
+    make_delta(base, target, delta)
+    manifest = {"axion_release": "1.2.0", "deltas": [
+        {"from": "1.0.0", "to": "1.1.0", "target_sha256": "a"},     # outra release
+        {"from": "1.0.1", "to": "1.2.0", "target_sha256": "b"},     # binário republicado
+        {"from": "1.1.0", "to": "1.2.0", "target_sha256": "c"},     # mesma base: substituído
+        {"from": "1.1.5", "to": "1.2.0", "target_sha256": "c"},
+    ]}
+    register_delta(manifest, "1.1.0", delta, "c")
+    assert [(d["from"], d["to"]) for d in manifest["deltas"]] == [("1.1.5", "1.2.0"), ("1.1.0", "1.2.0")]
+
+
+class _Ops:
+    def __init__(self):
+        self.ops = []
+
+    def copy(self, offset, length):
+        self.ops.append(("C", offset, length))
+
+    def data(self, source, start, end):
+        self.ops.append(("D", bytes(source[start:end])))
+
+
+def _greedy(base, target, n):
+    # Referência byte a byte: em cada posição, o primeiro bloco alinhado da base com o mesmo conteúdo
+    blocks = {}
+    for offset in range(0, len(base) - n + 1, n):
+        blocks.setdefault(base[offset:offset + n], offset)
+    ops, pos, literal_start = _Ops(), 0, 0
+    while blocks and pos + n <= len(target):
+        offset = blocks.get(target[pos:pos + n])
+        if offset is None:
+            pos += 1
+            continue
+        if literal_start < pos:
+            ops.data(target, literal_start, pos)
+        ops.copy(offset, n)
+        pos += n
+        literal_start = pos
+    if literal_start < len(target):
+        ops.data(target, literal_start, len(target))
+    return ops.ops
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_scan_matches_byte_by_byte_reference(seed):
+    rng = random.Random(seed)
+    base = bytes(rng.getrandbits(8) for _ in range(20_000)) + bytes(3000)
+    target = bytearray(base)
+    for _ in range(8):
+        p = rng.randrange(len(target))
+        target[p:p] = bytes(rng.getrandbits(8) for _ in range(rng.randrange(1, 200)))
+        p = rng.randrange(len(target))
+        del target[p:p + rng.randrange(1, 200)]
+    target = bytes(target)
+    ops = _Ops()
+    _scan(base, target, ops, 64)
+    assert ops.ops == _greedy(base, target, 64)
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from editor_axion_update import ChangelogModel, EditJournal
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_undo_redo_replays_every_operation():
+    model = ChangelogModel(["a", "b", "c"])
+    states = [list(model.changes)]
+    for edit in (
+        lambda: model.insert(1, "x"),
+        lambda: model.replace(0, "A"),
+        lambda: model.move(3, 0),
+        lambda: model.remove(2),
+        lambda: model.append("z"),
+    ):
+        edit()
+        states.append(list(model.changes))
+
+    for state in reversed(states[:-1]):
+        assert model.undo() >= 0
+        assert model.changes == state
+    assert model.undo() == -1
+
+    for state in states[1:]:
+        assert model.redo() >= 0
+        assert model.changes == state
+    assert model.redo() == -1
+    # ids acompanham as linhas em todas as operações
+    assert len(model.ids) == len(set(model.ids)) == len(model.changes)
+
+
+def test_bulk_edits_undo_in_one_step():
+    model = ChangelogModel(["a", "b"])
+    model.insert_many(1, ["p", "q", "r"])
+    model.remove_many(0, 2)
+    assert model.changes == ["q", "r", "b"]
+
+    assert model.undo() == 0
+    assert model.changes == ["a", "p", "q", "r", "b"]
+    assert model.undo() == 1
+    assert model.changes == ["a", "b"]
+    model.redo()
+    model.redo()
+    assert model.changes == ["q", "r", "b"]
+
+
+def test_new_edit_drops_redo_history():
+    model = ChangelogModel(["a"])
+    model.append("b")
+    model.undo()
+    assert model.journal.can_redo()
+    model.append("c")
+    assert not model.journal.can_redo()
+    assert model.redo() == -1
+    assert model.changes == ["a", "c"]
+
+
+def test_journal_is_bounded_and_reset_with_the_list():
+    model = ChangelogModel([])
+    for i in range(EditJournal.LIMIT + 10):
+        model.append(str(i))
+    assert len(model.journal.undo_stack) == EditJournal.LIMIT
+    while model.undo() >= 0:
+        pass
+    assert len(model.changes) == 10
+
+    model.set_changes(["novo"])
+    assert not model.journal.can_undo() and not model.journal.can_redo()
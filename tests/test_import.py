@@ -0,0 +1,67 @@
+from axion_import import parse_entries
+
+
+def test_full_git_log_keeps_only_subjects():
+    texto = (
+        "commit 0123456789abcdef0123456789abcdef01234567\n"
+        "Author: Fulano <fulano@exemplo.com>\n"
+        "Date:   Mon Oct 5 10:00:00 2026 -0300\n"
+        "\n"
+        "    fix(mira): mira travando no zoom\n"
+        "\n"
+        "    Corpo da mensagem que não entra.\n"
+        "\n"
+        "commit 89abcdef0123456\n"
+        "Merge: 1234567 89abcde\n"
+        "Author: Fulano <fulano@exemplo.com>\n"
+        "Date:   Mon Oct 5 09:00:00 2026 -0300\n"
+        "\n"
+        "    feat: modo noturno\n"
+    )
+    assert parse_entries(texto) == [
+        "[ * ] Corrigido Bug mira travando no zoom",
+        "[ + ] Adicionado modo noturno",
+    ]
+
+
+def test_oneline_git_log_drops_hashes():
+    texto = "0123abc Adicionado modo noturno\n* 4567def remove aba antiga\n89ab012 desativa chat global\n"
+    assert parse_entries(texto) == [
+        "[ + ] Adicionado modo noturno",
+        "[ - ] Removido aba antiga",
+        "[ ! ] Desativado temporariamente chat global",
+    ]
+
+
+def test_markdown_list():
+    texto = (
+        "# Release 1.2\n"
+        "\n"
+        "- Corrigido Bug da mira no zoom\n"
+        "  - só acontecia em 4K\n"
+        "* [x] novo atalho de captura\n"
+        "1. remove opção legada\n"
+        "+ ajuste de sensibilidade\n"
+        "\n"
+        "---\n"
+        "• detalhe solto\n"
+    )
+    assert parse_entries(texto) == [
+        "[ * ] Corrigido Bug da mira no zoom",
+        "• só acontecia em 4K",
+        # "novo" descreve o item: fica no texto
+        "[ + ] Adicionado novo atalho de captura",
+        "[ - ] Removido opção legada",
+        "[ + ] Adicionado ajuste de sensibilidade",
+        "• detalhe solto",
+    ]
+
+
+def test_plain_text_and_default_category():
+    texto = "[ + ] Adicionado modo noturno\r\nmira mais suave\r\nhotfix: crash ao sair\r\n"
+    assert parse_entries(texto, default_key="Correção Bug") == [
+        "[ + ] Adicionado modo noturno",
+        "[ * ] Corrigido Bug mira mais suave",
+        "[ * ] Corrigido Bug crash ao sair",
+    ]
+    assert parse_entries("\n  \n## Só título\n") == []
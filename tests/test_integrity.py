@@ -0,0 +1,81 @@
+import os
+import stat
+
+import pytest
+
+from axion_common import hash_file
+from axion_integrity import (
+    public_key, sign, verify, generate_keys, load_secret, load_public, binary_entry, verify_binary
+)
+
+# RFC 8032, seção 7.1 (testes 1 a 3): chave privada, chave pública, mensagem, assinatura
+RFC8032 = [
+    ("9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60",
+     "d75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a",
+     "",
+     "e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555"
+     "fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b"),
+    ("4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb",
+     "3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c",
+     "72",
+     "92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da"
+     "085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00"),
+    ("c5aa8df43f9f837bedb7442f31dcb7b166d38535076f094b85ce3a2e0b4458f7",
+     "fc51cd8e6218a1a38da47ed00230f0580816ed13ba3303ac5deb911548908025",
+     "af82",
+     "6291d657deec24024827e69c3abe01a30ce548a284743a445e3680d7db5ac3ac"
+     "18ff9b538d16f290ae67f760984dc6594a7c15e9716ed28dc027beceea1ec40a"),
+]
+
+
+@pytest.mark.parametrize("secret, pub, message, signature", RFC8032)
+def test_rfc8032_vectors(secret, pub, message, signature):
+    secret, pub, message, signature = map(bytes.fromhex, (secret, pub, message, signature))
+    assert public_key(secret) == pub
+    assert sign(secret, message) == signature
+    assert verify(pub, message, signature)
+
+
+@pytest.mark.parametrize("secret, pub, message, signature", RFC8032[1:2])
+def test_verify_rejects_tampering(secret, pub, message, signature):
+    pub, signature = bytes.fromhex(pub), bytes.fromhex(signature)
+    assert not verify(pub, b"\x73", signature)
+    assert not verify(pub, bytes.fromhex(message), signature[:-1] + bytes([signature[-1] ^ 1]))
+    assert not verify(bytes.fromhex(RFC8032[0][1]), bytes.fromhex(message), signature)
+    assert not verify(pub, bytes.fromhex(message), signature[:63])
+
+
+def test_generated_key_is_private_and_not_overwritten(tmp_path, monkeypatch):
+    monkeypatch.delenv("AXION_SIGN_KEY", raising=False)
+    secret_path, public_path = str(tmp_path / "k.key"), str(tmp_path / "k.pub")
+    old_umask = os.umask(0o022)
+    try:
+        pub = generate_keys(secret_path, public_path)
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(secret_path).st_mode) == 0o600
+    assert public_key(load_secret(secret_path)) == pub == load_public(public_path)
+
+    with pytest.raises(FileExistsError):
+        generate_keys(secret_path, public_path)
+    assert public_key(load_secret(secret_path)) == pub
+
+
+def test_verify_binary(tmp_path):
+    secret = bytes.fromhex(RFC8032[0][0])
+    path = tmp_path / "Axion.exe"
+    path.write_bytes(b"binario" * 100)
+    size, sha256 = hash_file(str(path))
+    manifest = {"axion_release": "1.2.3", "binary": binary_entry("1.2.3", str(path), size, sha256, secret)}
+    pub = public_key(secret)
+    assert verify_binary(manifest, str(path), pub)
+
+    # Mesma assinatura apresentada como outra release
+    assert not verify_binary({**manifest, "axion_release": "1.2.4"}, str(path), pub)
+    # Binário alterado depois da assinatura
+    path.write_bytes(b"binario" * 99 + b"BINARIO")
+    assert not verify_binary(manifest, str(path), pub)
+    # Manifesto alterado para bater com o binário novo, sem nova assinatura
+    size, sha256 = hash_file(str(path))
+    forged = {**manifest, "binary": {**manifest["binary"], "size": size, "sha256": sha256}}
+    assert not verify_binary(forged, str(path), pub)
@@ -0,0 +1,50 @@
+import os
+import json
+
+import axion_common
+from axion_manifest import client_manifest, current_deltas, write_client, write_notes, client_paths
+
+BINARY = {"file": "Axion.exe", "size": 10, "sha256": "b" * 64, "signature": "s", "key_id": "k"}
+
+
+def test_client_manifest_keeps_only_client_fields():
+    manifest = {
+        "game_version": "2.0", "axion_release": "1.0", "binary": {**BINARY, "extra": 1},
+        "chunks": {"file": "chunks/1.0.axc"}, "changelog_archive": {"file": "x"},
+    }
+    assert client_manifest(manifest) == {"axion_release": "1.0", "game_version": "2.0", "binary": BINARY}
+
+
+def test_client_json_points_to_release_notes(tmp_path, monkeypatch):
+    monkeypatch.setattr(axion_common, "BASE_DIR", str(tmp_path))
+    version_path = str(tmp_path / "version.json")
+    client_path, notes_path = client_paths(version_path)
+    changelog = {"changes": ["[ + ] Adicionado modo noturno"]}
+    assert write_notes(changelog, notes_path)
+    assert not write_notes(changelog, notes_path)
+
+    manifest = {"game_version": "2.0", "axion_release": "1.0", "binary": BINARY}
+    assert write_client(manifest, version_path)
+    assert not write_client(manifest, version_path)
+    payload = open(client_path, "rb").read()
+    # Compacto: é o que os clientes baixam a cada verificação
+    assert b": " not in payload
+    notes = json.loads(payload)["changelog"]
+    assert notes["file"] == "changelog.json.gz"
+    assert notes["size"] == os.path.getsize(notes_path)
+
+
+def test_only_deltas_to_the_published_binary():
+    current = {"from": "0.9", "to": "1.0", "file": "deltas/a.axd", "size": 3, "sha256": "d",
+               "target_sha256": "b" * 64}
+    manifest = {
+        "axion_release": "1.0", "binary": BINARY,
+        "deltas": [
+            current,
+            # Para a release anterior e para um binário republicado na mesma versão
+            {"from": "0.8", "to": "0.9", "file": "deltas/b.axd", "size": 3, "sha256": "e", "target_sha256": "c" * 64},
+            {**current, "from": "0.7", "target_sha256": "c" * 64},
+        ],
+    }
+    assert current_deltas(manifest) == [current]
+    assert client_manifest(manifest)["deltas"] == [{"from": "0.9", "file": "deltas/a.axd", "size": 3, "sha256": "d"}]
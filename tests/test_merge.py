@@ -0,0 +1,66 @@
+import pytest
+
+from axion_merge import merge3, edit_ops
+
+BASE = ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.parametrize("ours, theirs, expected", [
+    # Só um lado mudou
+    (BASE, ["a", "b", "X", "d", "e"], ["a", "b", "X", "d", "e"]),
+    (["a", "b", "c", "d", "e", "f"], BASE, ["a", "b", "c", "d", "e", "f"]),
+    # Mesma alteração dos dois lados
+    (["a", "c", "d", "e"], ["a", "c", "d", "e"], ["a", "c", "d", "e"]),
+    # Alterações em pontos distantes
+    (["X", "b", "c", "d", "e"], ["a", "b", "c", "d", "Y"], ["X", "b", "c", "d", "Y"]),
+    # Remoções vizinhas, uma de cada lado
+    (["b", "c", "d", "e"], ["a", "c", "d", "e"], ["c", "d", "e"]),
+    (["a", "c", "d", "e"], ["a", "b", "d", "e"], ["a", "d", "e"]),
+    # Inserção de um lado logo depois de uma remoção do outro
+    (["a", "b", "X", "c", "d", "e"], ["a", "c", "d", "e"], ["a", "X", "c", "d", "e"]),
+])
+def test_clean_merges(ours, theirs, expected):
+    assert merge3(BASE, ours, theirs) == (expected, 0)
+    assert merge3(BASE, theirs, ours) == (expected, 0)
+
+
+def test_same_line_changed_differently_is_a_conflict():
+    merged, conflicts = merge3(BASE, ["a", "X", "c", "d", "e"], ["a", "Y", "c", "d", "e"])
+    assert conflicts == 1
+    assert merged == ["a", "X", "Y", "c", "d", "e"]
+
+
+def test_insertions_at_same_point_are_a_conflict():
+    merged, conflicts = merge3(BASE, ["a", "X", "b", "c", "d", "e"], ["a", "Y", "b", "c", "d", "e"])
+    assert conflicts == 1
+    assert merged == ["a", "X", "Y", "b", "c", "d", "e"]
+
+
+def test_insertion_where_other_side_deleted_is_a_conflict():
+    # Ordem ambígua: a inserção era antes ou depois da linha removida?
+    merged, conflicts = merge3(BASE, ["a", "X", "b", "c", "d", "e"], ["a", "c", "d", "e"])
+    assert conflicts == 1
+    assert merged[:2] == ["a", "X"] and merged[-3:] == ["c", "d", "e"]
+
+
+def test_repeated_lines():
+    base = ["• x", "• x", "• y"]
+    assert merge3(base, ["• x", "• y"], base) == (["• x", "• y"], 0)
+
+
+@pytest.mark.parametrize("old, new", [
+    (BASE, ["a", "X", "c", "d", "e"]),
+    (BASE, ["b", "c", "X", "Y", "e", "Z"]),
+    (BASE, []),
+    ([], BASE),
+])
+def test_edit_ops_rebuild_new(old, new):
+    rows = list(old)
+    for op, line, arg in edit_ops(old, new):
+        if op == "replace":
+            rows[line:line + len(arg)] = arg
+        elif op == "delete":
+            del rows[line:line + arg]
+        else:
+            rows[line:line] = arg
+    assert rows == new
@@ -0,0 +1,59 @@
+import os
+import subprocess
+
+import pytest
+
+import publicar_update
+from publicar_update import artifact_paths, stage, new_channel_game
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("*.tmp\n")
+    monkeypatch.setattr(publicar_update, "BASE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_artifact_paths_lists_only_changed_artifacts():
+    previous = {
+        "binary": {"file": "Axion.exe", "sha256": "a"},
+        "chunks": {"file": "chunks/1.0.axc", "sha256": "c"},
+        "deltas": [{"from": "0.9", "file": "deltas/x.axd"}],
+    }
+    manifest = {
+        "binary": {"file": "Axion.exe", "sha256": "a"},
+        "chunks": {"file": "chunks/1.1.axc", "sha256": "c"},
+        "deltas": [{"from": "0.9", "file": "deltas/x.axd"}, {"from": "1.0", "file": "deltas/y.axd"}],
+    }
+    paths = artifact_paths(previous, manifest)
+    assert [os.path.relpath(p, publicar_update.BASE_DIR) for p in paths] == [
+        os.path.join("chunks", "1.1.axc"), os.path.join("deltas", "y.axd")
+    ]
+    assert len(artifact_paths({}, manifest)) == 4
+
+
+def test_stage_adds_only_changed_paths(repo):
+    (repo / "version.json").write_text("{}")
+    (repo / "outro.json").write_text("{}")
+    paths = [str(repo / "version.json"), str(repo / "nao_existe.json")]
+    assert stage(paths) == ["version.json"]
+    staged = subprocess.run(
+        ["git", "diff", "--cached", "--name-only"], cwd=repo, capture_output=True, text=True
+    ).stdout.split()
+    assert staged == ["version.json"]
+
+
+def test_stage_reports_git_add_failure(repo):
+    (repo / "version.json").write_text("{}")
+    (repo / "gerado.tmp").write_text("x")
+    with pytest.raises(RuntimeError):
+        stage([str(repo / "version.json"), str(repo / "gerado.tmp")])
+
+
+def test_new_channel_game_without_stable_channel():
+    channels = {"beta": {"game_version": "2.0"}, "dev": {"game_version": "2.1"}}
+    assert new_channel_game(channels) == "2.0"
+    assert new_channel_game({"stable": {"game_version": "1.9"}, **channels}) == "1.9"
+    assert new_channel_game(channels, "3.0") == "3.0"
+    assert new_channel_game({}) == ""
@@ -0,0 +1,112 @@
+import os
+import json
+import shutil
+
+import pytest
+
+import axion_publish
+from axion_common import hash_file
+from axion_delta import make_delta
+from axion_client import download_release, update_plan
+from axion_server import serve_in_background
+
+pytestmark = pytest.mark.releases(3, "pequena")
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(axion_publish, "CHUNKS_DIR", str(tmp_path / "chunks"))
+    monkeypatch.setattr(axion_publish, "DELTAS_DIR", str(tmp_path / "deltas"))
+    return tmp_path
+
+
+# ================= ARTEFATOS =================
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_generate_artifacts(outputs, releases, monkeypatch, cpus):
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+    old, new = releases
+    manifest = {"axion_release": "1.1"}
+    timings = axion_publish.generate_artifacts(manifest, new, old, "1.0")
+
+    assert manifest["binary"]["sha256"] == hash_file(new)[1]
+    assert manifest["chunks"]["count"] > 0
+    assert [(d["from"], d["to"]) for d in manifest["deltas"]] == [("1.0", "1.1")]
+    assert set(timings) == {"hash", "chunks", "delta 1.0", "sign", "total"}
+
+
+def test_artifact_spans_fall_inside_total(outputs, releases):
+    old, new = releases
+    spans = {}
+    axion_publish.generate_artifacts({"axion_release": "1.1"}, new, old, "1.0", spans=spans)
+    assert set(spans) == {"hash", "chunks", "delta 1.0", "sign", "total"}
+    total_start, total_end = spans["total"]
+    assert all(total_start <= start <= end <= total_end for start, end in spans.values())
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_delta_over_memory_cap_is_dropped(outputs, releases, monkeypatch, capsys, cpus):
+    # O teto vale só para os deltas: o índice de chunks sai mesmo com um teto minúsculo
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+    old, new = releases
+    manifest = {"axion_release": "1.1"}
+    axion_publish.generate_artifacts(manifest, new, old, "1.0", memory_limit=1)
+
+    assert manifest["chunks"]["count"] > 0 and manifest["binary"]["size"] == os.path.getsize(new)
+    assert "deltas" not in manifest
+    assert "delta 1.0 -> 1.1 não gerado" in capsys.readouterr().out
+
+
+# ================= ESCOLHA DO DELTA =================
+
+def test_update_plan_only_uses_deltas_to_current_binary():
+    manifest = {"axion_release": "1.2", "binary": {"size": 1000, "sha256": "novo"}, "deltas": [
+        {"from": "1.0", "to": "1.1", "size": 10, "target_sha256": "velho"},
+        {"from": "1.0", "to": "1.2", "size": 20, "target_sha256": "republicado"},
+        {"from": "1.0", "to": "1.2", "size": 30, "target_sha256": "novo"},
+        {"from": "1.0", "to": "1.2", "size": 2000, "target_sha256": "novo"},
+    ]}
+    assert update_plan(manifest, "1.0")["size"] == 30
+    assert update_plan(manifest, "0.9") is None
+    assert update_plan(manifest) is None
+    # client.json: deltas já filtrados, sem "to" nem "target_sha256"
+    client = {"axion_release": "1.2", "binary": {"size": 1000, "sha256": "novo"},
+              "deltas": [{"from": "1.0", "size": 30}]}
+    assert update_plan(client, "1.0")["size"] == 30
+
+
+def _publish(root, new, delta_target):
+    # version.json com um delta a partir de 1.0 que reconstrói delta_target
+    binary = str(shutil.copyfile(new, root / "Axion.exe"))
+    (root / "deltas").mkdir()
+    delta = str(root / "deltas" / "a.axd")
+    size, sha256 = hash_file(binary)
+    manifest = {"axion_release": "1.1", "binary": {"file": "Axion.exe", "size": size, "sha256": sha256}}
+    manifest["deltas"] = [{
+        "from": "1.0", "to": "1.1", "file": "deltas/a.axd",
+        "size": make_delta(str(root.parent / "1.0.exe"), delta_target, delta)["delta_size"],
+        "sha256": hash_file(delta)[1], "target_sha256": sha256,
+    }]
+    (root / "version.json").write_text(json.dumps(manifest))
+    return sha256
+
+
+@pytest.mark.parametrize("wrong_delta", [False, True])
+def test_download_release_checks_delta_result(tmp_path, releases, wrong_delta, write_binary):
+    old, new = releases
+    root = tmp_path / "publicado"
+    root.mkdir()
+    target = write_binary(tmp_path / "outro.exe", open(new, "rb").read()[:-100]) if wrong_delta else new
+    sha256 = _publish(root, new, target)
+
+    installed = write_binary(tmp_path / "Axion.exe", open(old, "rb").read())
+    srv = serve_in_background(str(root))
+    try:
+        stats = download_release(f"http://127.0.0.1:{srv.server_address[1]}/", installed, installed="1.0")
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+    assert hash_file(installed)[1] == sha256
+    assert stats.get("delta") == (None if wrong_delta else "1.0")
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("Axion.exe.")]
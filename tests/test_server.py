@@ -0,0 +1,86 @@
+import gzip
+import http.client
+
+import pytest
+
+from axion_server import serve_in_background, is_public
+
+BINARY = bytes(range(256)) * 400
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("publicado")
+    (tmp_path / "Axion.exe").write_bytes(BINARY)
+    (tmp_path / "version.json").write_text('{"axion_release": "1.0.0"}' + " " * 2000)
+    (tmp_path / "axion_sign.key").write_text("segredo")
+    (tmp_path / "publicar_update.py").write_text("")
+    (tmp_path / "chunks").mkdir()
+    (tmp_path / "chunks" / "Axion-1.0.0.axc").write_bytes(b"AXC1")
+    srv = serve_in_background(str(tmp_path))
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(server, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    try:
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def test_full_and_range(server):
+    status, headers, body = _get(server, "/Axion.exe")
+    assert status == 200 and body == BINARY and headers["Accept-Ranges"] == "bytes"
+
+    status, headers, body = _get(server, "/Axion.exe", {"Range": "bytes=100-199"})
+    assert status == 206 and body == BINARY[100:200]
+    assert headers["Content-Range"] == f"bytes 100-199/{len(BINARY)}"
+
+    status, _, body = _get(server, "/Axion.exe", {"Range": "bytes=-10"})
+    assert status == 206 and body == BINARY[-10:]
+
+    status, headers, _ = _get(server, "/Axion.exe", {"Range": f"bytes={len(BINARY)}-"})
+    assert status == 416 and headers["Content-Range"] == f"bytes */{len(BINARY)}"
+
+
+def test_if_range_with_stale_etag_sends_whole_file(server):
+    status, _, body = _get(server, "/Axion.exe", {"Range": "bytes=0-9", "If-Range": '"antigo"'})
+    assert status == 200 and body == BINARY
+
+
+def test_conditional_get(server):
+    status, headers, _ = _get(server, "/version.json")
+    etag = headers["ETag"]
+    status, headers, body = _get(server, "/version.json", {"If-None-Match": etag})
+    assert status == 304 and body == b"" and headers["ETag"] == etag
+    # ETag fraca também vale no If-None-Match
+    assert _get(server, "/version.json", {"If-None-Match": "W/" + etag})[0] == 304
+
+
+def test_gzip_has_its_own_etag(server):
+    identity = _get(server, "/version.json")
+    status, headers, body = _get(server, "/version.json", {"Accept-Encoding": "gzip"})
+    assert status == 200 and headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == identity[2]
+    assert headers["ETag"] != identity[1]["ETag"]
+    assert _get(server, "/version.json", {"Accept-Encoding": "gzip;q=0"})[1].get("Content-Encoding") is None
+
+
+@pytest.mark.parametrize("path", [
+    "/axion_sign.key", "/publicar_update.py", "/.git/config", "/../version.json", "/nao_existe.exe",
+])
+def test_private_files_are_not_served(server, path):
+    assert _get(server, path)[0] == 404
+
+
+def test_is_public():
+    assert is_public("version.json") and is_public("channels/beta/Axion.exe")
+    assert is_public("chunks/Axion-1.0.0.axc") and is_public("channels/beta/deltas/a.axd")
+    assert not is_public("axion_sign.key") and not is_public("channels/beta/x.key")
+    assert not is_public(".git/HEAD") and not is_public("editor_axion_update.py")
+    assert is_public("bench.bin", extra={"bench.bin"})
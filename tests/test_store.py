@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from axion_common import hash_file
+from axion_store import ArtifactStore, pinned_hashes
+
+
+def _binary(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path), hash_file(str(path))[1]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(str(tmp_path / "store"), max_bytes=1 << 30, max_releases=2)
+
+
+def _use(store, sha256, when):
+    store.objects[sha256]["last_used"] = when
+
+
+def test_put_is_content_addressed(tmp_path, store):
+    path, sha = _binary(tmp_path, "a.exe", b"A" * 1000)
+    obj = store.put(path, sha, "binary", "stable", "1.0")
+    again = store.put(path, sha, "binary", "beta", "1.0-beta")
+    assert obj == again and store.stats()["objects"] == 1
+    assert store.find_release("1.0-beta", "beta") == obj
+    # O objeto é independente da origem: regravar o Axion.exe não altera o store
+    with open(path, "wb") as f:
+        f.write(b"B" * 1000)
+    assert hash_file(obj)[1] == sha
+
+
+def test_put_rejects_changed_source(tmp_path, store):
+    path, _ = _binary(tmp_path, "a.exe", b"A" * 1000)
+    with pytest.raises(ValueError):
+        store.put(path, "0" * 64, "binary", "stable", "1.0")
+    assert store.stats()["objects"] == 0
+
+
+def test_evict_lru_keeps_pinned(tmp_path, store):
+    shas = []
+    for i, release in enumerate(("1.0", "1.1", "1.2", "1.3")):
+        path, sha = _binary(tmp_path, f"{release}.exe", bytes([i]) * 1000)
+        store.put(path, sha, "binary", "stable", release)
+        _use(store, sha, i)
+        shas.append(sha)
+    # A mais antiga é a release atual de um canal: fica mesmo sendo a menos usada
+    removed = store.evict(pinned={shas[0]})
+    assert removed == [shas[1], shas[2]]
+    assert set(store.objects) == {shas[0], shas[3]}
+    assert not os.path.exists(store.object_path(shas[1]))
+
+
+def test_evict_by_size_drops_chunk_indexes_with_their_release(tmp_path, store):
+    store.max_bytes = 2500
+    old, old_sha = _binary(tmp_path, "old.exe", b"o" * 1000)
+    new, new_sha = _binary(tmp_path, "new.exe", b"n" * 1000)
+    index, index_sha = _binary(tmp_path, "old.axc", b"i" * 600)
+    store.put(old, old_sha, "binary", "stable", "1.0")
+    store.put(index, index_sha, "chunks", "stable", "1.0")
+    store.put(new, new_sha, "binary", "stable", "1.1")
+    _use(store, old_sha, 1)
+    _use(store, index_sha, 2)
+    _use(store, new_sha, 3)
+
+    removed = store.evict(pinned={new_sha})
+    assert set(removed) == {old_sha, index_sha}
+    assert list(store.objects) == [new_sha]
+
+
+def test_pinned_hashes():
+    manifests = [{"binary": {"sha256": "a"}, "chunks": {"sha256": "b"}}, {"axion_release": "1.0"}]
+    assert pinned_hashes(manifests) == {"a", "b"}
+
+
+def test_index_survives_reload(tmp_path, store):
+    path, sha = _binary(tmp_path, "a.exe", b"A" * 1000)
+    store.put(path, sha, "binary", "stable", "1.0")
+    store.save()
+    reloaded = ArtifactStore(store.root)
+    assert [rel for rel, _, _ in reloaded.recent_releases("stable")] == ["1.0"]
@@ -0,0 +1,51 @@
+import pytest
+
+from axion_common import PREFIXOS
+from axion_validate import validate_changelog, validate_entry, validate_version
+
+ADD = PREFIXOS["Adicionar"]
+FIX = PREFIXOS["Correção Bug"]
+
+
+def test_valid_changelog():
+    changes = [f"{ADD} modo foto", "• atalho F9", "• atalho F10", f"{FIX} crash", "• atalho F9"]
+    assert validate_changelog({"changes": changes}) == []
+
+
+@pytest.mark.parametrize("changes, error", [
+    (["• solto"], "linha 1: detalhe sem entrada principal"),
+    ([f"{ADD} x", f"{ADD} x"], "linha 2: entrada duplicada (linha 1)"),
+    ([f"{ADD} x", "• a", "• a"], "linha 3: detalhe repetido (linha 2)"),
+    ([f"{ADD} x", "•   "], "linha 2: detalhe vazio"),
+    ([f"{ADD}   "], f"linha 1: descrição vazia: {ADD}   "),
+    (["Adicionado sem colchetes"], "linha 1: sem prefixo conhecido: Adicionado sem colchetes"),
+    (["   "], "linha 1: entrada vazia"),
+    ([42], "linha 1: entrada vazia"),
+])
+def test_changelog_errors(changes, error):
+    assert validate_changelog({"changes": changes}) == [error]
+
+
+def test_changelog_structure():
+    assert validate_changelog([]) == ["changelog precisa ser um objeto JSON"]
+    assert validate_changelog({"changes": "x"}) == ["'changes' precisa ser uma lista"]
+
+
+def test_fast_path_matches_validate_entry():
+    # Cada item sozinho (depois de uma entrada válida) dá o mesmo resultado da validação isolada
+    items = [f"{ADD} a", f"{ADD}", f"{ADD} ", "• b", "•", "• ", " • c", "[ + ]", "[ + ] Adicionad", "x", ""]
+    for item in items:
+        expected = validate_entry(item, 2)
+        errors = validate_changelog({"changes": [f"{FIX} base", item]})
+        assert errors == ([expected] if expected else []), item
+
+
+def test_version():
+    assert validate_version({"game_version": "9.4", "axion_release": "1.2.3.4"}) == []
+    assert validate_version({"game_version": "9.4"}) == ["axion_release: obrigatório"]
+    assert validate_version({"game_version": "9", "axion_release": "1.2"})[0].startswith(
+        "game_version: versão inválida")
+    assert validate_version({"game_version": "9.4", "axion_release": "1.2.9"},
+                            {"axion_release": "1.2.10"}) != []
+    assert validate_version({"game_version": "9.4", "axion_release": "1.2.10"},
+                            {"axion_release": "1.2.10"}) == []